@@ -0,0 +1,399 @@
+"""Dependency providers for the MLX Whisper Server API."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+
+from ..core.config import AppConfig
+from ..core.memory import get_peak_rss_bytes, get_rss_bytes
+from ..core.logging import get_logger
+from ..mlx.batching import EncoderBatcher, install_encoder_batching
+from ..mlx.continuous_batching import DecoderScheduler, install_decoder_batching
+from ..mlx.instrumentation import install_stage_timing
+from ..mlx.model_manager import ModelManager, synthetic_clip
+from ..mlx.model_registry import ModelRegistry
+from ..services.inference import create_inference_executor, transcribe_in_process
+from ..services.metrics import METRICS, RealtimeFactorTracker
+from ..services.model_host import ModelHostClient
+from ..services.result_cache import ResultCache
+from ..services.scheduling import create_policy_factory
+from ..services.transcription import TranscriptionService
+from ..services.validation import AudioValidator
+from ..services.workers import AsyncWorkerPool, WorkerPool
+
+logger = get_logger(__name__)
+
+
+class ServiceContainer:
+    """Process-wide service instances shared by all requests."""
+
+    def __init__(
+        self,
+        validator: AudioValidator,
+        model_manager: ModelManager,
+        transcription_service: TranscriptionService,
+        encoder_batcher: Optional[EncoderBatcher] = None,
+        decoder_scheduler: Optional[DecoderScheduler] = None,
+        model_registry: Optional[ModelRegistry] = None
+    ):
+        """Initialize service container.
+
+        Args:
+            validator: Audio validator instance
+            model_manager: Model manager of the default model
+            transcription_service: Transcription service instance
+            encoder_batcher: Batcher installed on the loaded model, if enabled
+            decoder_scheduler: Decoder scheduler installed on the loaded model, if enabled
+            model_registry: Registry serving per-request models, if configured
+        """
+        self.validator = validator
+        self.model_manager = model_manager
+        self.transcription_service = transcription_service
+        self.worker_pool = transcription_service.worker_pool
+        self.encoder_batcher = encoder_batcher
+        self.decoder_scheduler = decoder_scheduler
+        self.model_registry = model_registry
+        self.warmup_error: Optional[str] = None
+        self._ready = threading.Event()
+        self._started = time.monotonic()
+
+    @classmethod
+    def from_config(cls, cfg: AppConfig) -> "ServiceContainer":
+        """Build all services once from application configuration.
+
+        The model path is resolved here (including any modelscope download),
+        so request handling never repeats that lookup. Call from the running
+        event loop when the asyncio worker queue is configured.
+
+        Args:
+            cfg: Application configuration
+
+        Returns:
+            Service container
+        """
+        validator = AudioValidator(
+            cfg.transcription.max_file_size,
+            cfg.transcription.max_duration,
+            cfg.transcription.allowed_formats
+        )
+
+        def create_model_manager(checkpoint: str) -> ModelManager:
+            return ModelManager(
+                checkpoint,
+                cfg.transcription.use_modelscope,
+                dtype=cfg.transcription.dtype,
+                quantize_bits=cfg.transcription.quantize_bits,
+                quantize_group_size=cfg.transcription.quantize_group_size,
+                mmap_weights=cfg.transcription.mmap_weights
+            )
+
+        model_registry = ModelRegistry(
+            cfg.transcription.model,
+            create_model_manager,
+            aliases=cfg.transcription.model_aliases,
+            memory_budget_bytes=cfg.transcription.model_memory_budget_mb * 1024 * 1024,
+            idle_unload_seconds=cfg.transcription.model_idle_unload_seconds,
+            warmup=cfg.transcription.model_warmup
+        )
+        model_registry.start()
+        model_manager = model_registry.get_manager(cfg.transcription.model)
+        model_host = None
+        num_workers = cfg.transcription.inference_workers
+        if cfg.transcription.inference_backend == "host":
+            model_host = ModelHostClient(cfg.transcription.model_host_socket)
+            # Worker threads only wait on the host, so let every admitted request reach it
+            num_workers = cfg.transcription.max_concurrent
+
+        policy_factory = create_policy_factory(
+            cfg.transcription.scheduling_policy,
+            cfg.transcription.scheduling_aging_rate,
+            cfg.transcription.scheduling_weights
+        )
+        if cfg.transcription.worker_queue == "asyncio":
+            worker_pool = AsyncWorkerPool(
+                num_workers,
+                cfg.transcription.max_concurrent,
+                model_manager,
+                cfg.transcription.worker_queue_size,
+                policy_factory
+            )
+        else:
+            worker_pool = WorkerPool(
+                num_workers,
+                cfg.transcription.max_concurrent,
+                model_manager,
+                policy_factory
+            )
+        worker_pool.start()
+        process_executor = create_inference_executor(
+            cfg.transcription.inference_backend,
+            cfg.transcription.inference_workers
+        )
+        result_cache = None
+        if cfg.transcription.result_cache_mb > 0:
+            result_cache = ResultCache(
+                cfg.transcription.result_cache_mb * 1024 * 1024,
+                cfg.transcription.result_cache_dir,
+                cfg.transcription.result_cache_ttl_seconds
+            )
+        transcription_service = TranscriptionService(
+            validator,
+            model_manager,
+            worker_pool,
+            process_executor,
+            model_registry,
+            model_host,
+            RealtimeFactorTracker(cfg.transcription.rtf_window),
+            result_cache
+        )
+
+        logger.info(
+            "Services initialized",
+            model_name=model_manager.get_model_name()
+        )
+
+        return cls(validator, model_manager, transcription_service, model_registry=model_registry)
+
+    def prepare_inference(self, cfg: AppConfig) -> None:
+        """Load the default model in this process and install batching and stage timing on it.
+
+        Call once at startup in the process that runs inference (the server
+        with the thread backend, or the model host).
+
+        Args:
+            cfg: Application configuration
+        """
+        whisper = self.model_manager.get_model()
+        if cfg.transcription.encoder_batch_size > 1:
+            # Concurrent transcriptions share this instance, so their windows batch together
+            self.encoder_batcher = install_encoder_batching(
+                whisper,
+                cfg.transcription.encoder_batch_size,
+                cfg.transcription.encoder_batch_wait_ms / 1000
+            )
+        if cfg.transcription.decoder_batch_size > 1 or cfg.transcription.kv_cache_pool_size > 0:
+            pool = self.model_manager.get_kv_cache_pool(
+                whisper,
+                cfg.transcription.kv_cache_pool_size or cfg.transcription.decoder_batch_size
+            )
+            self.decoder_scheduler = install_decoder_batching(
+                whisper,
+                cfg.transcription.decoder_batch_size,
+                pool
+            )
+        # After batching, so the timed calls are the ones transcriptions make
+        install_stage_timing(whisper, METRICS)
+
+    async def warmup(self, cfg: AppConfig) -> None:
+        """Warm up the configured models, then mark the services ready.
+
+        Synthetic clips of each configured length run through the worker
+        pool like requests, for the default model and every model in
+        warmup_models. With the process backend each inference process
+        loads and warms the default model instead. A failed warm-up is
+        logged and leaves the services not ready.
+
+        Args:
+            cfg: Application configuration
+        """
+        durations = cfg.transcription.warmup_durations
+        start = time.perf_counter()
+        try:
+            if self.transcription_service.process_executor is not None:
+                await self._warmup_processes(cfg)
+            else:
+                names = [None, *cfg.transcription.warmup_models]
+                checkpoints = dict.fromkeys(self.model_registry.resolve(name) for name in names)
+                for checkpoint in checkpoints:
+                    await self.worker_pool.run(
+                        lambda checkpoint=checkpoint: self._warmup_checkpoint(checkpoint, durations),
+                        "warmup",
+                        sum(durations)
+                    )
+        except Exception as e:
+            self.warmup_error = str(e)
+            logger.error("Warm-up failed", error=str(e))
+            return
+
+        self.mark_ready()
+        logger.info("Warm-up complete", warmup_seconds=round(time.perf_counter() - start, 3))
+
+    def _warmup_checkpoint(self, checkpoint: str, durations: list[float]) -> None:
+        """Load and warm one checkpoint on a worker thread.
+
+        Args:
+            checkpoint: Checkpoint from the registry
+            durations: Clip lengths in seconds
+        """
+        self.model_registry.acquire(checkpoint, durations)
+        self.model_registry.release(checkpoint)
+
+    async def _warmup_processes(self, cfg: AppConfig) -> None:
+        """Warm the default model in each inference process.
+
+        One warm-up per process is submitted concurrently, so the pool
+        starts all of its processes; which process runs which warm-up is up
+        to the executor.
+
+        Args:
+            cfg: Application configuration
+        """
+        executor = self.transcription_service.process_executor
+        model_name = self.model_manager.get_model_name()
+        options = {**self.model_manager.get_transcribe_options(), "language": "en", "temperature": 0.0}
+        durations = cfg.transcription.warmup_durations
+
+        def task() -> None:
+            for duration in durations:
+                executor.submit(transcribe_in_process, synthetic_clip(duration), model_name, options).result()
+
+        await asyncio.gather(*(
+            self.worker_pool.run(task, "warmup", sum(durations))
+            for _ in range(cfg.transcription.inference_workers)
+        ))
+
+    def mark_ready(self) -> None:
+        """Mark the services ready to receive traffic."""
+        self._ready.set()
+
+    def is_ready(self) -> bool:
+        """Check whether the services finished warming up.
+
+        With the host backend the model host must also report ready. This
+        may block on the host socket, so call it off the event loop.
+
+        Returns:
+            True once warm-up finished
+        """
+        if not self._ready.is_set():
+            return False
+        model_host = self.transcription_service.model_host
+        if model_host is None:
+            return True
+        try:
+            return bool(model_host.get_status().get("ready"))
+        except Exception:
+            return False
+
+    def shutdown(self) -> None:
+        """Release resources held by the services."""
+        self.transcription_service.shutdown()
+        if self.encoder_batcher is not None:
+            self.encoder_batcher.stop()
+        if self.decoder_scheduler is not None:
+            self.decoder_scheduler.stop()
+        if self.model_registry is not None:
+            self.model_registry.stop()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get status of the managed services.
+
+        Returns:
+            Dictionary with status information
+        """
+        status = {
+            "ready": self._ready.is_set(),
+            "model": self.model_manager.get_status(),
+            "workers": self.worker_pool.get_status(),
+        }
+        if self.encoder_batcher is not None:
+            status["encoder_batching"] = self.encoder_batcher.get_status()
+        if self.decoder_scheduler is not None:
+            status["decoder_batching"] = self.decoder_scheduler.get_status()
+        if self.model_registry is not None:
+            status["models"] = self.model_registry.get_status()
+        status["realtime_factor"] = self.transcription_service.rtf_tracker.get_status()
+        if self.transcription_service.result_cache is not None:
+            status["result_cache"] = self.transcription_service.result_cache.get_status()
+        model_host = self.transcription_service.model_host
+        if model_host is not None:
+            try:
+                status["model_host"] = model_host.get_status()
+            except Exception as e:
+                status["model_host"] = {"error": str(e)}
+        return status
+
+    def get_metrics(self) -> str:
+        """Render Prometheus metrics, sampling the load gauges now.
+
+        Returns:
+            Metrics in the text exposition format
+        """
+        workers = self.worker_pool.get_status()
+        return METRICS.render({
+            "mlx_whisper_queue_depth": ("Requests waiting for a worker", workers["queue_depth"]),
+            "mlx_whisper_active_requests": ("Requests admitted to the worker pool", workers["active_requests"]),
+            "mlx_whisper_in_flight_requests": (
+                "Requests being validated, queued or transcribed",
+                self.transcription_service.in_flight_requests
+            ),
+        })
+
+    def get_health(self) -> Dict[str, Any]:
+        """Get cheap liveness and load signals.
+
+        Only reads counters and takes short-lived state locks, never the
+        model load lock or anything held during inference, so it answers
+        while a model is loading or transcribing. With the host backend the
+        model status comes from the host over its socket, so call it off the
+        event loop in that case.
+
+        Returns:
+            Dictionary matching HealthResponse
+        """
+        workers = self.worker_pool.get_status()
+        model_host = self.transcription_service.model_host
+        if model_host is None:
+            model = self.model_manager.get_status()
+        else:
+            try:
+                model = model_host.get_status()["model"]
+            except Exception as e:
+                model = {"loaded": False, "error": str(e)}
+
+        running = bool(workers["workers"]) and all(worker["running"] for worker in workers["workers"])
+        return {
+            "status": "healthy" if running and "error" not in model else "unhealthy",
+            "ready": self._ready.is_set(),
+            "workers": workers,
+            "model": model,
+            "model_loaded": bool(model.get("loaded")),
+            "queue_depth": workers["queue_depth"],
+            "in_flight_requests": self.transcription_service.in_flight_requests,
+            "rss_bytes": get_rss_bytes(),
+            "peak_rss_bytes": get_peak_rss_bytes(),
+            "uptime_seconds": int(time.monotonic() - self._started),
+        }
+
+
+def get_services(request: Request) -> ServiceContainer:
+    """Return the service container created during application startup.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Service container
+
+    Raises:
+        RuntimeError: If the application lifespan has not initialized services
+    """
+    services = getattr(request.app.state, "services", None)
+    if services is None:
+        raise RuntimeError("Services are not initialized")
+    return services
+
+
+def get_transcription_service(request: Request) -> TranscriptionService:
+    """FastAPI dependency returning the shared transcription service.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Transcription service
+    """
+    return get_services(request).transcription_service
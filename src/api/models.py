@@ -33,6 +33,10 @@ class TranscribeResponse(BaseModel):
 class VerboseTranscribeResponse(TranscribeResponse):
     """Response model for verbose JSON transcription."""
     segments: list[dict] = Field(default_factory=list, description="Timestamped segments")
+    processing_rtf: Optional[float] = Field(
+        default=None,
+        description="Audio seconds transcribed per second of inference (real-time factor)"
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -43,7 +47,13 @@ class ErrorResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """Health check response model."""
-    status: str = Field(description="Server status")
+    status: str = Field(description="Server status (healthy or unhealthy)")
+    ready: bool = Field(description="Whether the startup warm-up has finished")
     workers: dict = Field(description="Worker pool status")
+    model: dict = Field(description="Default model status")
     model_loaded: bool = Field(description="Whether MLX model is loaded")
+    queue_depth: int = Field(description="Requests waiting for a worker")
+    in_flight_requests: int = Field(description="Requests being validated, queued or transcribed")
+    rss_bytes: Optional[int] = Field(default=None, description="Resident memory of this process (None where unavailable)")
+    peak_rss_bytes: int = Field(description="Peak resident memory of this process")
     uptime_seconds: int = Field(description="Server uptime in seconds")
@@ -1,12 +1,15 @@
 """API routes for the MLX Whisper Server."""
 
+import asyncio
+import hashlib
+import shutil
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
-from fastapi import APIRouter, File, UploadFile, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, File, Form, UploadFile, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from ..api.models import (
     TranscribeResponse,
@@ -20,10 +23,15 @@ from ..core.exceptions import (
     FileTooLongError,
     InvalidFileFormatError,
     CorruptedAudioFileError,
+    ModelNotFoundError,
     ServerBusyError
 )
 from ..core.logging import get_logger
 from ..core.config import config
+from ..services.ingestion import spool_upload
+from ..services.metrics import CONTENT_TYPE, METRICS
+from ..services.transcription import TranscriptionService
+from .dependencies import ServiceContainer, get_services, get_transcription_service
 
 logger = get_logger(__name__)
 
@@ -31,8 +39,17 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _get_client_id(request: Request) -> str | None:
+    """Return the caller's API key from the Authorization header, if any."""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, credentials = authorization.partition(" ")
+    if scheme.lower() == "bearer" and credentials.strip():
+        return credentials.strip()
+    return None
+
+
 def _dump_audio_file(
-    audio_data: bytes,
+    audio_path: str,
     original_filename: str | None,
     dump_audio_dir: str,
     request_id: str
@@ -48,7 +65,7 @@ def _dump_audio_file(
 
     try:
         dump_dir_path.mkdir(parents=True, exist_ok=True)
-        dump_path.write_bytes(audio_data)
+        shutil.copyfile(audio_path, dump_path)
         logger.info(
             "Saved uploaded audio to dump directory",
             dump_path=str(dump_path),
@@ -80,9 +97,11 @@ def _dump_audio_file(
 async def transcribe_audio(
     request: Request,
     file: UploadFile = File(..., description="Audio file to transcribe"),
+    model: str | None = Form(None, description="Model alias (e.g. whisper-1, small) or checkpoint"),
     language: str | None = None,
     response_format: str = "json",
-    temperature: float = 0.0
+    temperature: float = 0.0,
+    transcription_service: TranscriptionService = Depends(get_transcription_service)
 ) -> Dict[str, Any]:
     """Transcribe an audio file to text.
 
@@ -98,50 +117,55 @@ async def transcribe_audio(
             "Received transcription request",
             filename=file.filename,
             content_type=file.content_type,
-            model=cfg.transcription.model,
+            model=model or cfg.transcription.model,
             language=language,
             response_format=response_format,
             request_id=request_id
         )
 
-        # Read file content
-        audio_data = await file.read()
-
-        # Check if file is empty
-        if not audio_data:
-            raise InvalidFileFormatError("empty", cfg.transcription.allowed_formats, request_id)
-
         filename_for_processing = file.filename or "audio.mp3"
-        _dump_audio_file(audio_data, filename_for_processing, cfg.transcription.dump_audio_dir, request_id)
 
         # Create parameters dict
         parameters = {
+            "model": model,
             "language": language,
             "response_format": response_format,
             "temperature": temperature
         }
 
-        # Import transcription service
-        from ..services.validation import AudioValidator
-        from ..mlx.model_manager import ModelManager
-        from ..services.transcription import TranscriptionService
-
-        # Create service instances
-        validator = AudioValidator(
-            cfg.transcription.max_file_size,
-            cfg.transcription.max_duration,
-            cfg.transcription.allowed_formats
-        )
-        model_manager = ModelManager(cfg.transcription.model, cfg.transcription.use_modelscope)
-        transcription_service = TranscriptionService(validator, model_manager)
-
-        # Run transcription
-        result = await transcription_service.transcribe(
-            audio_data,
-            filename_for_processing,
-            parameters,
-            request_id
-        )
+        # Stream file content to disk in chunks, enforcing the size limit
+        upload_start = time.perf_counter()
+        # Hashed while spooling, for the content-addressed result cache
+        digest = hashlib.sha256()
+        async with spool_upload(
+            file, cfg.transcription.max_file_size, request_id, digest=digest
+        ) as (audio_path, file_size):
+            METRICS.observe_stage("upload_read", time.perf_counter() - upload_start)
+
+            # Check if file is empty
+            if file_size == 0:
+                raise InvalidFileFormatError("empty", cfg.transcription.allowed_formats, request_id)
+
+            if cfg.transcription.dump_audio_dir:
+                with METRICS.time_stage("dump"):
+                    await asyncio.to_thread(
+                        _dump_audio_file,
+                        audio_path,
+                        filename_for_processing,
+                        cfg.transcription.dump_audio_dir,
+                        request_id
+                    )
+
+            # Run transcription
+            result = await transcription_service.transcribe_file(
+                audio_path,
+                file_size,
+                filename_for_processing,
+                parameters,
+                request_id,
+                client_id=_get_client_id(request),
+                content_hash=digest.hexdigest()
+            )
 
         logger.info(
             "Transcription successful",
@@ -149,14 +173,29 @@ async def transcribe_audio(
             request_id=request_id
         )
 
-        # Return based on response format
-        if response_format == "text":
-            return JSONResponse(content={"text": result.get("text", "")})
-
-        return result
-
-    except (FileTooLargeError, FileTooLongError, InvalidFileFormatError, CorruptedAudioFileError, ServerBusyError) as e:
+        # Return based on response format; serialized here so the stage is timed
+        with METRICS.time_stage("serialization"):
+            if response_format == "text":
+                response = JSONResponse(content={"text": result.get("text", "")})
+            elif response_format == "verbose_json":
+                response = JSONResponse(content=VerboseTranscribeResponse.model_validate(result).model_dump(mode="json"))
+            else:
+                response = JSONResponse(content=TranscribeResponse.model_validate(result).model_dump(mode="json"))
+
+        if result.get("processing_rtf") is not None:
+            response.headers["X-Processing-RTF"] = str(result["processing_rtf"])
+        return response
+
+    except (
+        FileTooLargeError,
+        FileTooLongError,
+        InvalidFileFormatError,
+        CorruptedAudioFileError,
+        ModelNotFoundError,
+        ServerBusyError
+    ) as e:
         # Handle expected errors
+        METRICS.record_error(e.error_type)
         logger.warning(
             "Transcription request failed",
             error_type=e.error_type,
@@ -167,6 +206,7 @@ async def transcribe_audio(
 
     except TranscribeError as e:
         # Handle transcription errors
+        METRICS.record_error(e.error_type)
         logger.error(
             "Transcription error",
             error=str(e.message),
@@ -174,12 +214,14 @@ async def transcribe_audio(
         )
         raise HTTPException(status_code=e.status_code, detail=e.to_dict())
 
-    except HTTPException:
-        # Re-raise HTTP exceptions
+    except HTTPException as e:
+        # Re-raise HTTP exceptions (raised here with a TranscribeError payload)
+        METRICS.record_error(e.detail["error"]["type"])
         raise
 
     except Exception as e:
         # Handle unexpected errors
+        METRICS.record_error("server_error")
         logger.error(
             "Unexpected error",
             error=str(e),
@@ -200,27 +242,59 @@ async def transcribe_audio(
 @router.get(
     "/health",
     response_model=HealthResponse,
+    responses={503: {"model": HealthResponse, "description": "Workers stopped or model host unreachable"}},
     tags=["System"]
 )
-async def health_check() -> Dict[str, Any]:
-    """Health check endpoint."""
-    # This is a simplified health check
-    # In a real implementation, you would check:
-    # - Model loading status
-    # - Worker pool status
-    # - Memory usage
-    # - etc.
+async def health_check(services: ServiceContainer = Depends(get_services)):
+    """Health check endpoint with live worker, model and memory state."""
+    if services.transcription_service.model_host is not None:
+        # The model status comes from the host over its socket
+        health = await asyncio.to_thread(services.get_health)
+    else:
+        health = services.get_health()
 
-    return {
-        "status": "healthy",
-        "workers": {
-            "total": config.load().server.workers,
-            "active": 0,
-            "available": config.load().server.workers
-        },
-        "model_loaded": True,
-        "uptime_seconds": 0  # Would calculate actual uptime
-    }
+    if health["status"] != "healthy":
+        return JSONResponse(status_code=503, content=health)
+    return health
+
+
+@router.get(
+    "/ready",
+    summary="Readiness check",
+    description="Returns 503 until the startup warm-up has finished",
+    tags=["System"]
+)
+async def readiness_check(services: ServiceContainer = Depends(get_services)):
+    """Readiness endpoint for load balancers and orchestrators."""
+    # With the host backend this asks the model host over its socket
+    if await asyncio.to_thread(services.is_ready):
+        return {"status": "ready"}
+
+    status = "warmup_failed" if services.warmup_error is not None else "warming_up"
+    return JSONResponse(status_code=503, content={"status": status})
+
+
+@router.get(
+    "/status",
+    summary="Service status",
+    description="Worker, model and batching state with the rolling real-time factor per model",
+    tags=["System"]
+)
+async def service_status(services: ServiceContainer = Depends(get_services)) -> Dict[str, Any]:
+    """Detailed status of this server's services."""
+    # May ask the model host over its socket
+    return await asyncio.to_thread(services.get_status)
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus metrics",
+    response_class=PlainTextResponse,
+    tags=["System"]
+)
+async def metrics(services: ServiceContainer = Depends(get_services)) -> PlainTextResponse:
+    """Per-stage latency histograms, error counters and load gauges of this process."""
+    return PlainTextResponse(services.get_metrics(), media_type=CONTENT_TYPE)
 
 
 @router.get(
@@ -237,6 +311,9 @@ async def root():
         "endpoints": {
             "transcribe": "/v1/audio/transcriptions",
             "health": "/health",
+            "ready": "/ready",
+            "metrics": "/metrics",
+            "status": "/status",
             "docs": "/docs",
             "openapi": "/openapi.json"
         }
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field, ConfigDict
@@ -20,7 +20,112 @@ class TranscriptionConfig(BaseModel):
     )
     model: str = Field(description="MLX model name")
     use_modelscope: bool = Field(default=True, description="Whether to use modelscope instead of huggingface")
+    dtype: Literal["float16", "bfloat16", "float32"] = Field(
+        default="float16",
+        description="Model weight dtype"
+    )
+    quantize_bits: Optional[Literal[4, 8]] = Field(
+        default=None,
+        description="Quantize Linear/Embedding weights to 4 or 8 bits after loading (None keeps full precision)"
+    )
+    quantize_group_size: int = Field(default=64, ge=1, description="Quantization group size")
+    mmap_weights: bool = Field(
+        default=False,
+        description="Memory-map safetensors/npz weights instead of reading the file into process memory"
+    )
+    model_aliases: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Extra request model names mapped to checkpoints (whisper-1 always maps to model)"
+    )
+    model_memory_budget_mb: int = Field(
+        default=0,
+        ge=0,
+        description="Weight memory allowed across loaded models before least recently used ones are unloaded (0 for unbounded)"
+    )
+    model_idle_unload_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Unload non-default models unused for this many seconds (0 disables)"
+    )
+    model_warmup: bool = Field(default=True, description="Run a short warm-up transcription after loading a model on demand")
+    startup_warmup: bool = Field(
+        default=True,
+        description="Warm up models after startup; /ready returns 503 until warm-up finishes"
+    )
+    warmup_models: list[str] = Field(
+        default_factory=list,
+        description="Request model names warmed up at startup in addition to the default model"
+    )
+    warmup_durations: list[float] = Field(
+        default_factory=lambda: [1.0],
+        description="Synthetic clip lengths in seconds transcribed by the startup warm-up, one per length bucket"
+    )
     dump_audio_dir: str = Field(default="", description="Directory to dump uploaded audio files")
+    inference_backend: Literal["thread", "process", "host"] = Field(
+        default="thread",
+        description="Execution backend for blocking inference: thread, process, or host (one model host process "
+                    "shared by all HTTP workers)"
+    )
+    model_host_socket: str = Field(
+        default="/tmp/mlx-whisper-host.sock",
+        description="Unix socket of the model host process (host backend)"
+    )
+    inference_workers: int = Field(default=1, ge=1, description="Number of inference threads or processes")
+    max_concurrent: int = Field(default=10, ge=1, description="Maximum concurrent transcription requests (queued or running)")
+    worker_queue: Literal["thread", "asyncio"] = Field(
+        default="thread",
+        description="Worker queue type: per-worker thread queues or one bounded asyncio queue"
+    )
+    worker_queue_size: int = Field(default=0, ge=0, description="Bound of the asyncio worker queue (0 for unbounded)")
+    result_cache_mb: int = Field(
+        default=64,
+        ge=0,
+        description="Memory budget of the result cache keyed by audio content and parameters (0 disables caching)"
+    )
+    result_cache_dir: str = Field(default="", description="Directory of the on-disk result cache tier (empty disables it)")
+    result_cache_ttl_seconds: float = Field(
+        default=86400.0,
+        ge=0,
+        description="Age after which on-disk cached results expire (0 keeps them)"
+    )
+    rtf_window: int = Field(
+        default=100,
+        ge=1,
+        description="Recent requests per model in the rolling real-time factor reported by /status"
+    )
+    scheduling_policy: Literal["fifo", "sjf", "fair"] = Field(
+        default="fifo",
+        description="Queue order: fifo, sjf (shortest audio first with aging) or fair (weighted share per API key)"
+    )
+    scheduling_aging_rate: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="sjf aging: audio seconds of priority gained per second waited"
+    )
+    scheduling_weights: Dict[str, float] = Field(
+        default_factory=dict,
+        description="fair share weight per API key (unlisted keys get 1.0)"
+    )
+    encoder_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="max 30 s mel windows encoded together across requests (1 disables batching)"
+    )
+    encoder_batch_wait_ms: float = Field(
+        default=10.0,
+        ge=0,
+        description="milliseconds to wait for more windows before running the encoder"
+    )
+    decoder_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="max sequences sharing each decoder step across requests (1 disables batching)"
+    )
+    kv_cache_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="preallocated decoder KV buffers (0 sizes the pool to decoder_batch_size)"
+    )
 
 
 class ServerConfig(BaseModel):
@@ -159,6 +159,21 @@ class ModelLoadError(TranscribeError):
         super().__init__(message, "model_load_error", 500, request_id)
 
 
+class ModelNotFoundError(TranscribeError):
+    """Raised when a request names a model the server does not serve."""
+
+    def __init__(self, model_name: str, available: list[str], request_id: Optional[str] = None):
+        """Initialize model not found error.
+
+        Args:
+            model_name: Model name from the request
+            available: Model names the server accepts
+            request_id: Optional request ID
+        """
+        message = f"Unknown model: {model_name}. Available models: {', '.join(available)}"
+        super().__init__(message, "model_not_found", 404, request_id)
+
+
 class ConfigurationError(Exception):
     """Raised when configuration is invalid."""
 
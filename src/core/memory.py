@@ -0,0 +1,34 @@
+"""Process memory readings for health reporting."""
+
+import os
+import resource
+import sys
+from typing import Optional
+
+
+def get_rss_bytes() -> Optional[int]:
+    """Current resident memory of this process.
+
+    Reads /proc/self/statm, which is a single small read and never blocks
+    on the process's own locks.
+
+    Returns:
+        Resident bytes, or None where /proc is unavailable (macOS)
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident_pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def get_peak_rss_bytes() -> int:
+    """Peak resident memory of this process.
+
+    Returns:
+        Peak resident bytes
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,74 @@
+"""Model host process: owns the models and serves inference to HTTP workers."""
+
+import asyncio
+import signal
+import threading
+from functools import partial
+from typing import Any, Optional
+
+from .api.dependencies import ServiceContainer
+from .core.config import AppConfig, config
+from .core.logging import setup_logging, get_logger
+from .services.model_host import ModelHostServer, handle_host_request
+
+logger = get_logger(__name__)
+
+
+def run_model_host(cfg: AppConfig, ready: Optional[Any] = None, stop: Optional[Any] = None) -> None:
+    """Load models once and serve front-end workers until stopped.
+
+    The host builds the same services as a thread-backend server, so the
+    worker pool, scheduling policy and cross-request batching all apply to
+    requests from every HTTP worker process.
+
+    Args:
+        cfg: Application configuration (inference_backend is ignored here)
+        ready: Event (threading or multiprocessing) set once the default model
+            is loaded (and warmed up, if configured) and the socket accepts
+            requests
+        stop: Event set to shut the host down (SIGTERM also stops it)
+    """
+    setup_logging(cfg.logging.level, cfg.logging.format)
+    stop = stop or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    # Inference runs here, on a plain thread worker pool
+    transcription = cfg.transcription.model_copy(update={"inference_backend": "thread", "worker_queue": "thread"})
+    host_cfg = cfg.model_copy(update={"transcription": transcription})
+
+    services = ServiceContainer.from_config(host_cfg)
+    services.prepare_inference(host_cfg)
+    if cfg.transcription.startup_warmup:
+        asyncio.run(services.warmup(host_cfg))
+    else:
+        services.mark_ready()
+
+    server = ModelHostServer(
+        cfg.transcription.model_host_socket,
+        partial(
+            handle_host_request,
+            model_registry=services.model_registry,
+            worker_pool=services.worker_pool,
+            get_status=services.get_status
+        )
+    )
+    server.start()
+    logger.info("Model host ready", model_name=services.model_manager.get_model_name())
+    if ready is not None:
+        ready.set()
+
+    try:
+        stop.wait()
+    finally:
+        server.stop()
+        services.shutdown()
+
+
+def main() -> None:
+    """Run a standalone model host for separately launched HTTP workers."""
+    run_model_host(config.load())
+
+
+if __name__ == "__main__":
+    main()
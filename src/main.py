@@ -1,19 +1,21 @@
 """Main application entry point for MLX Whisper Server."""
 
+import asyncio
 from contextlib import asynccontextmanager
+import multiprocessing
 import time
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import mlx_whisper
-from mlx_whisper.transcribe import ModelHolder
-import mlx.core as mx
 import uvicorn
 
+from .api.dependencies import ServiceContainer
 from .api.routes import router
 from .api.middleware import LoggingMiddleware, RequestSizeMiddleware
-from .core.config import config
+from .host import run_model_host
+from .core.config import AppConfig, config
 from .core.logging import setup_logging, get_logger
 
 # Setup logging
@@ -37,16 +39,31 @@ async def lifespan(app: FastAPI):
         workers=cfg.server.workers
     )
 
-    model = cfg.transcription.model
-    if cfg.transcription.use_modelscope:
-        from modelscope import snapshot_download
-        model = snapshot_download(cfg.transcription.model)
-    ModelHolder.get_model(model, mx.float16)
+    startup_start = time.perf_counter()
+
+    # Build shared services once; this also resolves the model path
+    services = ServiceContainer.from_config(cfg)
+    if cfg.transcription.inference_backend == "thread":
+        # Process backends load the model inside each inference process,
+        # the host backend inside the model host
+        services.prepare_inference(cfg)
+    app.state.services = services
+    if cfg.transcription.startup_warmup and cfg.transcription.inference_backend != "host":
+        # Serve (and report not ready on /ready) while the warm-up runs
+        app.state.warmup_task = asyncio.create_task(services.warmup(cfg))
+    else:
+        # The model host warms up before it accepts connections
+        services.mark_ready()
+    logger.info("Startup complete", startup_seconds=round(time.perf_counter() - startup_start, 3))
 
     yield
 
     # Shutdown
     logger.info("Shutting down MLX Whisper Server")
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None:
+        warmup_task.cancel()
+    services.shutdown()
 
 
 # Create FastAPI application
@@ -97,6 +114,32 @@ async def global_exception_handler(request, exc):
     )
 
 
+def start_model_host(cfg: AppConfig) -> multiprocessing.Process:
+    """Start the model host process and wait until it serves requests.
+
+    Args:
+        cfg: Application configuration
+
+    Returns:
+        Running model host process
+
+    Raises:
+        RuntimeError: If the host exits before becoming ready
+    """
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    host = context.Process(target=run_model_host, args=(cfg, ready), name="model-host")
+    host.start()
+
+    # Loading the model can take minutes on first download
+    while not ready.wait(1.0):
+        if not host.is_alive():
+            raise RuntimeError(f"Model host exited during startup (exit code {host.exitcode})")
+
+    logger.info("Model host started", pid=host.pid, socket_path=cfg.transcription.model_host_socket)
+    return host
+
+
 def main():
     """Main entry point."""
     cfg = config.load()
@@ -108,16 +151,25 @@ def main():
         workers=cfg.server.workers
     )
 
+    host = None
+    if cfg.transcription.inference_backend == "host":
+        host = start_model_host(cfg)
+
     # Run server
-    uvicorn.run(
-        "src.main:app",
-        host=cfg.server.host,
-        port=cfg.server.port,
-        workers=cfg.server.workers,
-        reload=False,
-        log_level=cfg.logging.level.lower(),
-        access_log=True
-    )
+    try:
+        uvicorn.run(
+            "src.main:app",
+            host=cfg.server.host,
+            port=cfg.server.port,
+            workers=cfg.server.workers,
+            reload=False,
+            log_level=cfg.logging.level.lower(),
+            access_log=True
+        )
+    finally:
+        if host is not None:
+            host.terminate()
+            host.join()
 
 
 if __name__ == "__main__":
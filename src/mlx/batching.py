@@ -0,0 +1,253 @@
+"""Dynamic cross-request batching of Whisper encoder windows."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import mlx.core as mx
+import mlx.nn as nn
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Placed on the queue to stop the batching thread
+_STOP = object()
+
+Encoder = Callable[[mx.array], mx.array]
+
+
+class EncoderBatcher:
+    """Collects mel windows from concurrent callers and encodes them together.
+
+    Callers block in encode() while a single background thread gathers
+    pending windows for up to max_wait seconds (or until max_batch_size
+    windows are waiting), runs the encoder once on the stack, and scatters
+    the rows back to each caller.
+    """
+
+    def __init__(self, encoder: Encoder, max_batch_size: int = 8, max_wait: float = 0.01):
+        """Initialize encoder batcher.
+
+        Args:
+            encoder: Encoder mapping (batch, frames, n_mels) mel windows to
+                (batch, n_audio_ctx, n_audio_state) audio features
+            max_batch_size: Maximum number of windows per encoder call
+            max_wait: Seconds to wait for more windows after the first arrives
+        """
+        self.encoder = encoder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._windows = 0
+
+    def start(self) -> None:
+        """Start the batching thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="encoder-batcher", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Encoder batcher started",
+            max_batch_size=self.max_batch_size,
+            max_wait=self.max_wait
+        )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the batching thread after it drains pending windows.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("Encoder batcher stopped")
+
+    def encode(self, mel: mx.array) -> mx.array:
+        """Encode mel windows, sharing the encoder call with concurrent callers.
+
+        Args:
+            mel: Mel windows shaped (frames, n_mels) or (batch, frames, n_mels)
+
+        Returns:
+            Audio features with the same leading batch shape as mel
+        """
+        if self._thread is None:
+            return self.encoder(mel)
+
+        single = mel.ndim == 2
+        if single:
+            mel = mel[None]
+
+        # MLX streams are per thread: hand over a materialized array
+        mx.eval(mel)
+        future: Future = Future()
+        self._queue.put((mel, future))
+        features = future.result()
+        return features[0] if single else features
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get batching statistics.
+
+        Returns:
+            Dictionary with status information
+        """
+        with self._stats_lock:
+            return {
+                "running": self._thread is not None,
+                "max_batch_size": self.max_batch_size,
+                "max_wait": self.max_wait,
+                "batches": self._batches,
+                "windows": self._windows,
+                "avg_batch_size": self._windows / self._batches if self._batches else 0.0,
+            }
+
+    def _run(self) -> None:
+        """Batching loop: gather, encode, scatter until stopped."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            pending, stop = self._gather(item)
+            for group in _group_by_shape(pending):
+                self._encode_group(group)
+            if stop:
+                break
+
+    def _gather(self, first: Tuple[mx.array, Future]) -> Tuple[List[Tuple[mx.array, Future]], bool]:
+        """Collect windows arriving within max_wait of the first one.
+
+        Args:
+            first: First pending (mel, future) pair
+
+        Returns:
+            Tuple of (pending pairs, whether a stop was requested)
+        """
+        pending = [first]
+        count = first[0].shape[0]
+        deadline = time.monotonic() + self.max_wait
+
+        while count < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return pending, True
+            pending.append(item)
+            count += item[0].shape[0]
+
+        return pending, False
+
+    def _encode_group(self, group: List[Tuple[mx.array, Future]]) -> None:
+        """Run the encoder once for windows of one shape and scatter results.
+
+        Args:
+            group: Pending (mel, future) pairs sharing shape and dtype
+        """
+        for first in range(0, len(group), self.max_batch_size):
+            chunk = [(mel, future) for mel, future in group[first:first + self.max_batch_size]
+                     if future.set_running_or_notify_cancel()]
+            if not chunk:
+                continue
+
+            try:
+                stacked = chunk[0][0] if len(chunk) == 1 else mx.concatenate([mel for mel, _ in chunk])
+                features = self.encoder(stacked)
+                offsets = [0]
+                for mel, _ in chunk:
+                    offsets.append(offsets[-1] + mel.shape[0])
+                # Evaluate the slices here; callers cannot run ops queued on this thread's stream
+                rows = [features[start:end] for start, end in zip(offsets, offsets[1:])]
+                mx.eval(rows)
+            except Exception as e:
+                logger.error("Batched encoder call failed", windows=len(chunk), error=str(e))
+                for _, future in chunk:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), row in zip(chunk, rows):
+                future.set_result(row)
+
+            with self._stats_lock:
+                self._batches += 1
+                self._windows += offsets[-1]
+
+
+def _group_by_shape(pending: List[Tuple[mx.array, Future]]) -> List[List[Tuple[mx.array, Future]]]:
+    """Split pending windows into groups that can be concatenated.
+
+    Args:
+        pending: Pending (mel, future) pairs
+
+    Returns:
+        Groups sharing per-window shape and dtype, in arrival order
+    """
+    groups: Dict[Tuple[Any, ...], List[Tuple[mx.array, Future]]] = {}
+    for mel, future in pending:
+        groups.setdefault((tuple(mel.shape[1:]), mel.dtype), []).append((mel, future))
+    return list(groups.values())
+
+
+class BatchedEncoder:
+    """Drop-in replacement for Whisper.encoder that routes through a batcher."""
+
+    def __init__(self, batcher: EncoderBatcher):
+        """Initialize batched encoder.
+
+        Args:
+            batcher: Started encoder batcher wrapping the original encoder
+        """
+        self.batcher = batcher
+
+    def __call__(self, mel: mx.array) -> mx.array:
+        """Encode mel windows through the batcher.
+
+        Args:
+            mel: Mel windows shaped (batch, frames, n_mels)
+
+        Returns:
+            Audio features
+        """
+        return self.batcher.encode(mel)
+
+
+def install_encoder_batching(model: Any, max_batch_size: int, max_wait: float) -> EncoderBatcher:
+    """Route a loaded Whisper model's encoder calls through a shared batcher.
+
+    mlx_whisper.transcribe calls model.encoder once per 30 s window (and per
+    language detection), so replacing the attribute batches windows from
+    every transcription running concurrently on the same model instance.
+
+    Args:
+        model: Loaded mlx_whisper Whisper model
+        max_batch_size: Maximum number of windows per encoder call
+        max_wait: Seconds to wait for more windows after the first arrives
+
+    Returns:
+        Started encoder batcher; stop it on shutdown
+    """
+    encoder = model.encoder
+    if isinstance(encoder, BatchedEncoder):
+        encoder.batcher.stop()
+        encoder = encoder.batcher.encoder
+
+    if isinstance(encoder, nn.Module):
+        # Buffers such as the positional embedding may still be lazy on this
+        # thread's stream; the batching thread cannot evaluate them
+        mx.eval(encoder.state)
+
+    batcher = EncoderBatcher(encoder, max_batch_size, max_wait)
+    batcher.start()
+    model.encoder = BatchedEncoder(batcher)
+    return batcher
@@ -0,0 +1,586 @@
+"""Continuous batching of Whisper decoder steps across concurrent requests."""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import replace
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import mlx.core as mx
+import mlx.nn as nn
+import numpy as np
+from mlx_whisper.decoding import DecodingOptions, DecodingTask, LogitFilter
+
+from ..core.logging import get_logger
+from .kv_cache import KVCachePool, WindowCache
+
+logger = get_logger(__name__)
+
+# Placed on the queue to stop the scheduler thread
+_STOP = object()
+
+KVPair = Tuple[mx.array, mx.array]
+
+
+class DecodeSequence:
+    """One token sequence moving through the decoder scheduler."""
+
+    def __init__(
+        self,
+        audio_features: mx.array,
+        tokens: Sequence[int],
+        logit_filters: Sequence[LogitFilter],
+        temperature: float,
+        eot: int,
+        sample_len: int,
+        n_ctx: int,
+        sot_index: int,
+        no_speech: Optional[int] = None
+    ):
+        """Initialize decode sequence.
+
+        Args:
+            audio_features: Evaluated encoder output shaped (1, n_audio_ctx, n_audio_state)
+            tokens: Initial tokens (SOT sequence plus any prompt or prefix)
+            logit_filters: Filters applied to this sequence's logits every step
+            temperature: Sampling temperature (0 for greedy)
+            eot: End-of-transcript token
+            sample_len: Maximum number of tokens to sample
+            n_ctx: Decoder context length
+            sot_index: Position of the SOT token, where no-speech probability is read
+            no_speech: No-speech token, if the tokenizer has one
+        """
+        self.audio_features = audio_features
+        self.tokens = list(tokens)
+        self.sample_begin = len(self.tokens)
+        self.logit_filters = list(logit_filters)
+        self.temperature = temperature
+        self.eot = eot
+        self.sample_len = sample_len
+        self.n_ctx = n_ctx
+        self.sot_index = sot_index
+        self.no_speech = no_speech
+
+        self.sum_logprob = 0.0
+        self.no_speech_prob = float("nan")
+        self.finished = False
+        self.future: Future = Future()
+
+        # KV pool slot and per-layer cross-attention keys/values, set by prefill
+        self.slot: Optional[int] = None
+        self.cross_kv: Optional[List[KVPair]] = None
+
+    @property
+    def sampled(self) -> int:
+        """Number of tokens sampled so far."""
+        return len(self.tokens) - self.sample_begin
+
+    def append(self, token: int, logprob: float) -> None:
+        """Record a sampled token and mark the sequence finished when done.
+
+        Args:
+            token: Sampled token
+            logprob: Log probability of the token
+        """
+        self.tokens.append(token)
+        self.sum_logprob += logprob
+        if token == self.eot or self.sampled >= self.sample_len or len(self.tokens) >= self.n_ctx:
+            self.finished = True
+
+
+class DecoderScheduler:
+    """Runs decoder steps for active sequences from all requests as one batch.
+
+    A single background thread owns the batch. New sequences are prefilled
+    and join between steps, finished sequences leave immediately, so a
+    request never waits for another request's sequence to complete.
+    Self-attention keys/values live in a KVCachePool slot checked out for
+    each sequence's lifetime; sequences wait in the pending queue while
+    the pool is exhausted.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        max_batch_size: int = 16,
+        pool: Optional[KVCachePool] = None,
+        windows: Optional[WindowCache] = None
+    ):
+        """Initialize decoder scheduler.
+
+        Args:
+            model: Loaded mlx_whisper Whisper model
+            max_batch_size: Maximum number of sequences sharing a decoder step
+            pool: KV cache pool (defaults to one buffer per batch slot)
+            windows: Per-window encoder output and cross-attention cache
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.pool = pool if pool is not None else KVCachePool.for_model(model, max_batch_size)
+        self.windows = windows if windows is not None else WindowCache()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._pending: Deque[DecodeSequence] = deque()
+        self._active: List[DecodeSequence] = []
+
+        # Batch state, rebuilt when membership changes
+        self._batch: List[DecodeSequence] = []
+        self._cross_kv: List[KVPair] = []
+
+        self._stats_lock = threading.Lock()
+        self._steps = 0
+        self._step_rows = 0
+        self._tokens = 0
+        self._completed = 0
+
+    def start(self) -> None:
+        """Start the scheduler thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="decoder-scheduler", daemon=True)
+        self._thread.start()
+        logger.info("Decoder scheduler started", max_batch_size=self.max_batch_size)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduler thread after in-flight sequences finish.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("Decoder scheduler stopped")
+
+    def submit(self, sequence: DecodeSequence) -> Future:
+        """Queue a sequence to join the batch at the next step boundary.
+
+        Args:
+            sequence: Sequence to decode; its audio features must be evaluated
+
+        Returns:
+            Future resolving to the finished sequence
+
+        Raises:
+            RuntimeError: If the scheduler is not running
+        """
+        if self._thread is None:
+            raise RuntimeError("Decoder scheduler is not running")
+        self._queue.put(sequence)
+        return sequence.future
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get scheduling statistics.
+
+        Returns:
+            Dictionary with status information
+        """
+        with self._stats_lock:
+            return {
+                "running": self._thread is not None,
+                "max_batch_size": self.max_batch_size,
+                "active": len(self._active),
+                "pending": len(self._pending) + self._queue.qsize(),
+                "steps": self._steps,
+                "tokens": self._tokens,
+                "completed": self._completed,
+                "avg_batch_size": self._step_rows / self._steps if self._steps else 0.0,
+                "kv_cache_pool": self.pool.get_status(),
+                "windows": self.windows.get_status(),
+            }
+
+    def _run(self) -> None:
+        """Scheduling loop: admit, step, retire until stopped and drained."""
+        stopping = False
+        while True:
+            if not self._active and not self._pending:
+                if stopping:
+                    break
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                self._pending.append(item)
+
+            stopping = self._drain_queue() or stopping
+            self._admit()
+            if self._active:
+                self._step()
+
+    def _drain_queue(self) -> bool:
+        """Move newly submitted sequences to the pending deque.
+
+        Returns:
+            True if a stop was requested
+        """
+        stop = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return stop
+            if item is _STOP:
+                stop = True
+            else:
+                self._pending.append(item)
+
+    def _admit(self) -> None:
+        """Prefill pending sequences into free batch slots and KV buffers."""
+        joined = False
+        while self._pending and len(self._active) < self.max_batch_size:
+            slot = self.pool.acquire()
+            if slot is None:
+                break
+            sequence = self._pending.popleft()
+            if not sequence.future.set_running_or_notify_cancel():
+                self.pool.release(slot)
+                continue
+            sequence.slot = slot
+            try:
+                self._prefill(sequence)
+            except Exception as e:
+                logger.error("Decoder prefill failed", error=str(e))
+                self.pool.release(slot)
+                sequence.slot = None
+                sequence.future.set_exception(e)
+                continue
+
+            if sequence.finished:
+                self._retire(sequence)
+            else:
+                self._active.append(sequence)
+                joined = True
+
+        if joined:
+            self._rebuild()
+
+    def _prefill(self, sequence: DecodeSequence) -> None:
+        """Run the initial tokens through the decoder and sample the first token.
+
+        Keys/values are written into the sequence's pool slot. Cross-attention
+        keys/values are reused when this audio window was decoded before
+        (temperature fallback), otherwise computed once and cached.
+
+        Args:
+            sequence: Newly admitted sequence holding a pool slot
+        """
+        decoder = self.model.decoder
+        n_tokens = len(sequence.tokens)
+        x = decoder.token_embedding(mx.array([sequence.tokens])) + decoder.positional_embedding[:n_tokens]
+        mask = nn.MultiHeadAttention.create_additive_causal_mask(n_tokens).astype(x.dtype)
+
+        cross_kv = self.windows.get_cross_kv(sequence.audio_features)
+        computed = cross_kv is None
+        if computed:
+            cross_kv = []
+
+        for e, block in enumerate(decoder.blocks):
+            attn = block.attn
+            h = block.attn_ln(x)
+            keys, values = attn.key(h), attn.value(h)
+            self.pool.keys[e][sequence.slot, :n_tokens] = keys[0]
+            self.pool.values[e][sequence.slot, :n_tokens] = values[0]
+            x = x + attn.out(_attention(attn.query(h), keys, values, attn.n_head, mask))
+
+            cross = block.cross_attn
+            if computed:
+                cross_kv.append((cross.key(sequence.audio_features), cross.value(sequence.audio_features)))
+            h = block.cross_attn_ln(x)
+            x = x + cross.out(_attention(cross.query(h), *cross_kv[e], cross.n_head))
+
+            x = x + block.mlp2(nn.gelu(block.mlp1(block.mlp_ln(x))))
+
+        logits = decoder.token_embedding.as_linear(decoder.ln(x)).astype(mx.float32)
+        if computed:
+            mx.eval(cross_kv)
+            self.windows.put_cross_kv(sequence.audio_features, cross_kv)
+        sequence.cross_kv = cross_kv
+
+        if sequence.no_speech is not None:
+            probs_at_sot = mx.softmax(logits[:, sequence.sot_index], axis=-1)
+            sequence.no_speech_prob = probs_at_sot[0, sequence.no_speech].item()
+
+        self._sample([sequence], logits[:, -1])
+
+    def _step(self) -> None:
+        """Advance every active sequence by one token with a single decoder pass."""
+        batch = self._batch
+        decoder = self.model.decoder
+        try:
+            positions = [len(sequence.tokens) - 1 for sequence in batch]
+            width = max(positions) + 1
+            slots = mx.array([sequence.slot for sequence in batch])
+            offsets = mx.array(positions)
+            tokens = mx.array([[sequence.tokens[-1]] for sequence in batch])
+            x = decoder.token_embedding(tokens) + decoder.positional_embedding[offsets][:, None, :]
+
+            # Pool buffers hold stale data past each sequence's own length
+            valid = np.arange(width)[None, :] <= np.array(positions)[:, None]
+            mask = mx.array(np.where(valid, 0.0, -np.inf).astype(np.float32))
+            mask = mask[:, None, None, :].astype(x.dtype)
+
+            for e, block in enumerate(decoder.blocks):
+                attn = block.attn
+                h = block.attn_ln(x)
+                keys, values = self.pool.keys[e], self.pool.values[e]
+                keys[slots, offsets] = attn.key(h)[:, 0]
+                values[slots, offsets] = attn.value(h)[:, 0]
+                x = x + attn.out(_attention(
+                    attn.query(h), keys[slots, :width], values[slots, :width], attn.n_head, mask
+                ))
+
+                cross = block.cross_attn
+                h = block.cross_attn_ln(x)
+                cross_keys, cross_values = self._cross_kv[e]
+                x = x + cross.out(_attention(cross.query(h), cross_keys, cross_values, cross.n_head))
+
+                x = x + block.mlp2(nn.gelu(block.mlp1(block.mlp_ln(x))))
+
+            logits = decoder.token_embedding.as_linear(decoder.ln(x))[:, -1].astype(mx.float32)
+            self._sample(batch, logits)
+
+        except Exception as e:
+            logger.error("Decoder step failed", batch_size=len(batch), error=str(e))
+            for sequence in batch:
+                self.pool.release(sequence.slot)
+                sequence.slot = None
+                sequence.future.set_exception(e)
+            self._active = []
+            self._rebuild()
+            return
+
+        with self._stats_lock:
+            self._steps += 1
+            self._step_rows += len(batch)
+
+        finished = [sequence for sequence in batch if sequence.finished]
+        if finished:
+            for sequence in finished:
+                self._retire(sequence)
+            self._active = [sequence for sequence in self._active if not sequence.finished]
+            self._rebuild()
+
+    def _sample(self, sequences: List[DecodeSequence], logits: mx.array) -> None:
+        """Apply each sequence's logit filters and sample its next token.
+
+        Args:
+            sequences: Sequences in row order
+            logits: Last-position logits shaped (len(sequences), n_vocab)
+        """
+        rows = []
+        for i, sequence in enumerate(sequences):
+            row = logits[i:i + 1]
+            context = mx.array([sequence.tokens])
+            for logit_filter in sequence.logit_filters:
+                row = logit_filter.apply(row, context)
+            rows.append(row)
+        logits = rows[0] if len(rows) == 1 else mx.concatenate(rows)
+
+        next_tokens = logits.argmax(axis=-1)
+        temperatures = [sequence.temperature for sequence in sequences]
+        if any(temperature > 0 for temperature in temperatures):
+            scale = mx.array([max(temperature, 1e-6) for temperature in temperatures])[:, None]
+            sampled = mx.random.categorical(logits / scale)
+            next_tokens = mx.where(mx.array(temperatures) > 0, sampled, next_tokens)
+
+        logprobs = logits - mx.logsumexp(logits, axis=-1, keepdims=True)
+        current = logprobs[mx.arange(logprobs.shape[0]), next_tokens]
+        # Evaluate the pool writes together with the sampled tokens
+        mx.eval(next_tokens, current, self.pool.keys, self.pool.values)
+
+        for sequence, token, logprob in zip(sequences, next_tokens.tolist(), current.tolist()):
+            sequence.append(token, logprob)
+
+        with self._stats_lock:
+            self._tokens += len(sequences)
+
+    def _retire(self, sequence: DecodeSequence) -> None:
+        """Return a finished sequence's KV buffer and resolve its future.
+
+        Args:
+            sequence: Finished sequence
+        """
+        self.pool.release(sequence.slot)
+        sequence.slot = None
+        sequence.cross_kv = None
+        sequence.audio_features = None
+        sequence.future.set_result(sequence)
+        with self._stats_lock:
+            self._completed += 1
+
+    def _rebuild(self) -> None:
+        """Restack cross-attention keys/values for the current active set."""
+        self._batch = list(self._active)
+        if not self._batch:
+            self._cross_kv = []
+            return
+
+        n_layer = len(self._batch[0].cross_kv)
+        self._cross_kv = [
+            (mx.concatenate([s.cross_kv[e][0] for s in self._batch]),
+             mx.concatenate([s.cross_kv[e][1] for s in self._batch]))
+            for e in range(n_layer)
+        ]
+        mx.eval(self._cross_kv)
+
+
+def _attention(q: mx.array, k: mx.array, v: mx.array, n_head: int, mask: Optional[mx.array] = None) -> mx.array:
+    """Multi-head attention matching mlx_whisper's scaling.
+
+    Args:
+        q: Queries shaped (batch, n_query, state)
+        k: Keys shaped (batch, n_key, state)
+        v: Values shaped (batch, n_key, state)
+        n_head: Number of attention heads
+        mask: Additive mask broadcastable to (batch, heads, n_query, n_key)
+
+    Returns:
+        Attention output shaped (batch, n_query, state)
+    """
+    n_batch, n_query, n_state = q.shape
+    head_dim = n_state // n_head
+    q = q.reshape(n_batch, n_query, n_head, head_dim).transpose(0, 2, 1, 3)
+    k = k.reshape(n_batch, k.shape[1], n_head, head_dim).transpose(0, 2, 1, 3)
+    v = v.reshape(n_batch, v.shape[1], n_head, head_dim).transpose(0, 2, 1, 3)
+    out = mx.fast.scaled_dot_product_attention(q, k, v, scale=head_dim ** -0.5, mask=mask)
+    return out.transpose(0, 2, 1, 3).reshape(n_batch, n_query, n_state)
+
+
+class BatchedDecodingTask(DecodingTask):
+    """DecodingTask whose sampling loop runs on a shared DecoderScheduler.
+
+    Prompt construction, language detection, logit filters and result
+    ranking are inherited unchanged; the token loop is replaced and encoder
+    output is reused when the same window is retried.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        options: DecodingOptions,
+        scheduler: DecoderScheduler,
+        window: Optional[mx.array] = None
+    ):
+        """Initialize batched decoding task.
+
+        Args:
+            model: Loaded mlx_whisper Whisper model
+            options: Decoding options
+            scheduler: Running decoder scheduler
+            window: Mel array as passed to decode, identifying the window
+                across temperature-fallback retries
+        """
+        super().__init__(model, options)
+        self.scheduler = scheduler
+        self.window = window
+
+    def _get_audio_features(self, mel: mx.array) -> mx.array:
+        """Encode the window, or reuse the encoder output from a previous attempt.
+
+        Args:
+            mel: Mel windows shaped (n_audio, frames, n_mels)
+
+        Returns:
+            Evaluated audio features
+        """
+        windows = self.scheduler.windows
+        features = windows.get_features(self.window) if self.window is not None else None
+        if features is None:
+            features = super()._get_audio_features(mel)
+            mx.eval(features)
+            if self.window is not None:
+                windows.put_features(self.window, features)
+        return features
+
+    def _main_loop(self, audio_features: mx.array, tokens: mx.array) -> Tuple[mx.array, mx.array, mx.array]:
+        """Decode every row on the scheduler and wait for all to finish.
+
+        Args:
+            audio_features: Encoder output shaped (n_audio, n_audio_ctx, n_audio_state)
+            tokens: Initial tokens shaped (n_audio * n_group, n_initial)
+
+        Returns:
+            Tuple of (tokens padded with EOT, sum of log probabilities,
+            no-speech probabilities), as DecodingTask._main_loop returns
+        """
+        n_batch = tokens.shape[0]
+        if audio_features.shape[0] == 1:
+            # Keep the cached array itself so its cross-attention keys/values are reused
+            features = [audio_features] * n_batch
+        else:
+            group = 1 if audio_features.shape[0] == n_batch else self.n_group
+            features = [audio_features[i // group][None] for i in range(n_batch)]
+        # MLX streams are per thread: hand over materialized arrays
+        mx.eval(features)
+
+        sequences = [
+            DecodeSequence(
+                features[i],
+                row,
+                self.logit_filters,
+                self.options.temperature,
+                self.tokenizer.eot,
+                self.sample_len,
+                self.n_ctx,
+                self.sot_index,
+                self.tokenizer.no_speech
+            )
+            for i, row in enumerate(tokens.tolist())
+        ]
+        futures = [self.scheduler.submit(sequence) for sequence in sequences]
+        for future in futures:
+            future.result()
+
+        width = max(len(sequence.tokens) for sequence in sequences)
+        eot = self.tokenizer.eot
+        return (
+            mx.array([sequence.tokens + [eot] * (width - len(sequence.tokens)) for sequence in sequences]),
+            mx.array([sequence.sum_logprob for sequence in sequences]),
+            mx.array([sequence.no_speech_prob for sequence in sequences]),
+        )
+
+
+def install_decoder_batching(
+    model: Any,
+    max_batch_size: int,
+    pool: Optional[KVCachePool] = None
+) -> DecoderScheduler:
+    """Route a loaded Whisper model's decode calls through a shared scheduler.
+
+    mlx_whisper.transcribe calls model.decode for every 30 s window and
+    temperature fallback, so replacing the attribute lets sequences from
+    every concurrent transcription share decoder steps.
+
+    Args:
+        model: Loaded mlx_whisper Whisper model
+        max_batch_size: Maximum number of sequences sharing a decoder step
+        pool: KV cache pool, typically owned by the ModelManager
+
+    Returns:
+        Started decoder scheduler; stop it on shutdown
+    """
+    previous = getattr(model.decode, "scheduler", None)
+    if previous is not None:
+        previous.stop()
+
+    # Weights and buffers may still be lazy on this thread's stream
+    mx.eval(model.decoder.state)
+
+    scheduler = DecoderScheduler(model, max_batch_size, pool)
+    scheduler.start()
+
+    def decode(mel: mx.array, options: DecodingOptions = DecodingOptions(), **kwargs: Any) -> Any:
+        """Batched replacement for mlx_whisper.decoding.decode."""
+        window = mel
+        if single := mel.ndim == 2:
+            mel = mel[None]
+        if kwargs:
+            options = replace(options, **kwargs)
+        result = BatchedDecodingTask(model, options, scheduler, window).run(mel)
+        return result[0] if single else result
+
+    decode.scheduler = scheduler
+    model.decode = decode
+    return scheduler
@@ -0,0 +1,79 @@
+"""Stage timing of Whisper encoder and decoder calls."""
+
+import functools
+import threading
+import time
+from typing import Any
+
+import mlx.core as mx
+
+from ..services.metrics import ServerMetrics
+
+# Encoder seconds spent on the current thread, so decode time can exclude them
+_thread_state = threading.local()
+
+
+class TimedEncoder:
+    """Drop-in replacement for Whisper.encoder that records encode time."""
+
+    def __init__(self, encoder: Any, metrics: ServerMetrics):
+        """Initialize timed encoder.
+
+        Args:
+            encoder: Encoder being timed (a module or a BatchedEncoder)
+            metrics: Metrics receiving the encode stage
+        """
+        self.encoder = encoder
+        self.metrics = metrics
+
+    def __call__(self, mel: mx.array) -> mx.array:
+        """Encode and evaluate mel windows, recording the elapsed time.
+
+        The features are evaluated here rather than lazily inside the first
+        decoder step, which is where mlx_whisper would evaluate them anyway.
+
+        Args:
+            mel: Mel windows shaped (batch, frames, n_mels)
+
+        Returns:
+            Evaluated audio features
+        """
+        start = time.perf_counter()
+        features = self.encoder(mel)
+        mx.eval(features)
+        elapsed = time.perf_counter() - start
+        self.metrics.observe_stage("encode", elapsed)
+        _thread_state.encode_seconds = getattr(_thread_state, "encode_seconds", 0.0) + elapsed
+        return features
+
+
+def install_stage_timing(model: Any, metrics: ServerMetrics) -> None:
+    """Record encode and decode stage times of a loaded Whisper model.
+
+    Install after any encoder or decoder batching so the timed calls are
+    the ones mlx_whisper.transcribe makes. model.decode runs the encoder
+    for its window first; that time is recorded as encode, not decode.
+
+    Args:
+        model: Loaded mlx_whisper Whisper model
+        metrics: Metrics receiving the encode and decode stages
+    """
+    if not isinstance(model.encoder, TimedEncoder):
+        model.encoder = TimedEncoder(model.encoder, metrics)
+
+    decode = model.decode
+    if getattr(decode, "timed", False):
+        return
+
+    @functools.wraps(decode)
+    def timed_decode(*args: Any, **kwargs: Any) -> Any:
+        encode_before = getattr(_thread_state, "encode_seconds", 0.0)
+        start = time.perf_counter()
+        try:
+            return decode(*args, **kwargs)
+        finally:
+            encode = getattr(_thread_state, "encode_seconds", 0.0) - encode_before
+            metrics.observe_stage("decode", time.perf_counter() - start - encode)
+
+    timed_decode.timed = True
+    model.decode = timed_decode
@@ -0,0 +1,219 @@
+"""Preallocated decoder KV cache pool and per-window cross-attention cache."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import mlx.core as mx
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+KVPair = Tuple[mx.array, mx.array]
+
+
+class KVCachePool:
+    """Fixed-capacity self-attention KV buffers checked out per sequence.
+
+    One (capacity, n_ctx, n_state) key slab and value slab is allocated
+    per decoder layer up front. A sequence checks out a slot (a row of
+    every slab) for its whole lifetime and writes each new token's keys
+    and values in place, so decoding never grows or reallocates caches.
+    """
+
+    def __init__(self, n_layer: int, n_ctx: int, n_state: int, capacity: int, dtype: mx.Dtype = mx.float16):
+        """Initialize KV cache pool and allocate its buffers.
+
+        Args:
+            n_layer: Number of decoder layers
+            n_ctx: Tokens per buffer (the decoder context, 448 for Whisper)
+            n_state: Decoder width
+            capacity: Number of sequences that can hold a buffer at once
+            dtype: Cache dtype (matches the model's activations)
+        """
+        self.n_layer = n_layer
+        self.n_ctx = n_ctx
+        self.n_state = n_state
+        self.capacity = capacity
+        self.dtype = dtype
+
+        self.keys: List[mx.array] = [mx.zeros((capacity, n_ctx, n_state), dtype) for _ in range(n_layer)]
+        self.values: List[mx.array] = [mx.zeros((capacity, n_ctx, n_state), dtype) for _ in range(n_layer)]
+        mx.eval(self.keys, self.values)
+
+        self._lock = threading.Lock()
+        self._free = list(range(capacity - 1, -1, -1))
+        self._allocations = 1
+        self._checkouts = 0
+        self._exhausted = 0
+        self._peak_in_use = 0
+
+        logger.info(
+            "KV cache pool allocated",
+            capacity=capacity,
+            n_layer=n_layer,
+            n_ctx=n_ctx,
+            bytes=self.nbytes
+        )
+
+    @classmethod
+    def for_model(cls, model: Any, capacity: int) -> "KVCachePool":
+        """Size a pool for a loaded Whisper model's decoder.
+
+        Args:
+            model: Loaded mlx_whisper Whisper model
+            capacity: Number of sequences that can hold a buffer at once
+
+        Returns:
+            KV cache pool
+        """
+        dims = model.dims
+        # Activations are float16 for float16 weights and float32 otherwise
+        # (bfloat16 and quantized embeddings included), see ModelManager
+        dtype = mx.float16 if model.decoder.ln.weight.dtype == mx.float16 else mx.float32
+        return cls(dims.n_text_layer, dims.n_text_ctx, dims.n_text_state, capacity, dtype)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the key and value slabs."""
+        return sum(array.nbytes for array in self.keys + self.values)
+
+    def acquire(self) -> Optional[int]:
+        """Check out a buffer slot.
+
+        Returns:
+            Slot index, or None if every buffer is in use
+        """
+        with self._lock:
+            if not self._free:
+                self._exhausted += 1
+                return None
+            slot = self._free.pop()
+            self._checkouts += 1
+            self._peak_in_use = max(self._peak_in_use, self.capacity - len(self._free))
+            return slot
+
+    def release(self, slot: int) -> None:
+        """Return a buffer slot to the pool.
+
+        Stale contents are left in place; readers mask positions beyond
+        each sequence's length.
+
+        Args:
+            slot: Slot index from acquire()
+        """
+        with self._lock:
+            self._free.append(slot)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get pool occupancy and allocation statistics.
+
+        Returns:
+            Dictionary with status information
+        """
+        with self._lock:
+            in_use = self.capacity - len(self._free)
+            return {
+                "capacity": self.capacity,
+                "in_use": in_use,
+                "occupancy": in_use / self.capacity,
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "exhausted": self._exhausted,
+                "allocations": self._allocations,
+                "bytes": self.nbytes,
+            }
+
+
+class WindowCache:
+    """Encoder output and cross-attention KV per 30 s window.
+
+    mlx_whisper retries a window at increasing temperatures by calling
+    decode again with the same mel array. Entries are matched by identity
+    of that array, so retries reuse the encoder output and cross-attention
+    keys/values instead of recomputing them.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        """Initialize window cache.
+
+        Args:
+            max_entries: Maximum number of windows kept (least recently used are evicted)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[mx.array, mx.array, Optional[List[KVPair]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_features(self, mel: mx.array) -> Optional[mx.array]:
+        """Look up encoder output for a mel window.
+
+        Args:
+            mel: Mel array passed to decode
+
+        Returns:
+            Cached audio features, or None
+        """
+        with self._lock:
+            entry = self._entries.get(id(mel))
+            if entry is None or entry[0] is not mel:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(id(mel))
+            self._hits += 1
+            return entry[1]
+
+    def put_features(self, mel: mx.array, features: mx.array) -> None:
+        """Store encoder output for a mel window.
+
+        The mel array is kept referenced so its id cannot be reused while
+        the entry is alive.
+
+        Args:
+            mel: Mel array passed to decode
+            features: Evaluated audio features
+        """
+        with self._lock:
+            self._entries[id(mel)] = (mel, features, None)
+            self._entries.move_to_end(id(mel))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_cross_kv(self, features: mx.array) -> Optional[List[KVPair]]:
+        """Look up cross-attention keys/values computed for audio features.
+
+        Args:
+            features: Audio features previously stored with put_features
+
+        Returns:
+            Per-layer cross-attention keys/values, or None
+        """
+        with self._lock:
+            for _, cached, cross_kv in self._entries.values():
+                if cached is features:
+                    return cross_kv
+            return None
+
+    def put_cross_kv(self, features: mx.array, cross_kv: List[KVPair]) -> None:
+        """Attach cross-attention keys/values to a cached window.
+
+        Args:
+            features: Audio features previously stored with put_features
+            cross_kv: Per-layer cross-attention keys/values
+        """
+        with self._lock:
+            for key, (mel, cached, _) in self._entries.items():
+                if cached is features:
+                    self._entries[key] = (mel, cached, cross_kv)
+                    return
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get hit and miss counts.
+
+        Returns:
+            Dictionary with status information
+        """
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
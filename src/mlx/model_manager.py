@@ -1,54 +1,197 @@
 """Model manager for MLX Whisper."""
 
 import threading
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Sequence
 
 import mlx_whisper
+from mlx_whisper.audio import N_FFT, SAMPLE_RATE, hanning, mel_filters
 from mlx_whisper.load_models import load_model
+from mlx_whisper.transcribe import ModelHolder
 from mlx_whisper.whisper import Whisper
 import mlx.core as mx
+import mlx.nn as nn
+from mlx.utils import tree_flatten
+import numpy as np
 
 from ..core.exceptions import ModelLoadError
 from ..core.logging import get_logger
+from .kv_cache import KVCachePool
+from .weights import load_whisper_mmap
 
 logger = get_logger(__name__)
 
+DTYPES = {
+    "float16": mx.float16,
+    "bfloat16": mx.bfloat16,
+    "float32": mx.float32,
+}
+
+QUANTIZE_BITS = (4, 8)
+
+# Models loaded by ModelManager instances, keyed by model path. mlx_whisper.transcribe
+# looks models up through ModelHolder, which is routed here so it never loads a copy.
+_LOADED_MODELS: Dict[str, Whisper] = {}
+_holder_get_model = ModelHolder.get_model
+
+
+def _get_loaded_model(cls: type, model_path: str, dtype: mx.Dtype) -> Whisper:
+    """ModelHolder.get_model replacement preferring ModelManager-owned models."""
+    model = _LOADED_MODELS.get(model_path)
+    if model is not None:
+        return model
+    return _holder_get_model(model_path, dtype)
+
+
+ModelHolder.get_model = classmethod(_get_loaded_model)
+
+
+def prepare_model(
+    model: Whisper,
+    dtype: mx.Dtype = mx.float16,
+    quantize_bits: Optional[int] = None,
+    group_size: int = 64
+) -> Whisper:
+    """Cast a Whisper model's weights and optionally quantize them.
+
+    Args:
+        model: Whisper model with loaded weights
+        dtype: Floating point dtype for weights (and quantization scales)
+        quantize_bits: 4 or 8 to quantize Linear and Embedding weights, or None
+        group_size: Quantization group size
+
+    Returns:
+        The same model, modified in place and evaluated
+    """
+    model.set_dtype(dtype)
+
+    if quantize_bits is not None:
+        if any(isinstance(m, (nn.QuantizedLinear, nn.QuantizedEmbedding)) for _, m in model.named_modules()):
+            logger.warning("Model weights are already quantized, skipping quantization")
+        else:
+            nn.quantize(
+                model,
+                group_size=group_size,
+                bits=quantize_bits,
+                class_predicate=lambda _, m: (
+                    isinstance(m, (nn.Linear, nn.Embedding)) and m.weight.shape[-1] % group_size == 0
+                )
+            )
+
+    # Include buffers such as the causal mask: MLX streams are per thread, so
+    # arrays left lazy here could not be evaluated by inference worker threads
+    mx.eval(model.state)
+    return model
+
+
+def model_nbytes(model: Whisper) -> int:
+    """Bytes held by a model's parameters.
+
+    Args:
+        model: Whisper model
+
+    Returns:
+        Total parameter size in bytes
+    """
+    return sum(value.nbytes for _, value in tree_flatten(model.parameters()))
+
+
+def synthetic_clip(duration: float) -> np.ndarray:
+    """Low-level noise used to warm up a model.
+
+    Noise rather than silence keeps the decoder from stopping after the
+    first token, so decoding kernels are exercised as well.
+
+    Args:
+        duration: Clip length in seconds
+
+    Returns:
+        16 kHz mono float32 samples
+    """
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(duration * SAMPLE_RATE)) * 0.01).astype(np.float32)
+
 
 class ModelManager:
     """Manager for MLX Whisper model lifecycle."""
 
-    def __init__(self, model_name: str, use_modelscope: bool):
+    def __init__(
+        self,
+        model_name: str,
+        use_modelscope: bool,
+        dtype: str = "float16",
+        quantize_bits: Optional[int] = None,
+        quantize_group_size: int = 64,
+        mmap_weights: bool = False
+    ):
         """Initialize model manager.
 
         Args:
             model_name: Name of the model to manage
             use_modelscope: Whether to use modelscope
+            dtype: Weight dtype (float16, bfloat16 or float32)
+            quantize_bits: 4 or 8 to quantize weights after loading, or None
+            quantize_group_size: Quantization group size
+            mmap_weights: Memory-map the weights file instead of reading it whole
+
+        Raises:
+            ValueError: If dtype or quantize_bits is not supported
         """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown dtype: {dtype}. Allowed: {', '.join(DTYPES)}")
+        if quantize_bits is not None and quantize_bits not in QUANTIZE_BITS:
+            raise ValueError(f"Unsupported quantization: {quantize_bits} bits. Allowed: 4, 8")
+
         self.model_name = model_name
         if use_modelscope:
             from modelscope import snapshot_download
             self.model_name = snapshot_download(model_name)
-        self._model: Optional[Any] = None
+        self.dtype = dtype
+        self.quantize_bits = quantize_bits
+        self.quantize_group_size = quantize_group_size
+        self.mmap_weights = mmap_weights
+        self._model: Optional[Whisper] = None
+        # Held for the whole (possibly minutes long) load; _lock only guards state
+        self._load_lock = threading.Lock()
         self._lock = threading.Lock()
         self._load_count = 0
+        self._load_seconds: Optional[float] = None
+        self._model_bytes: Optional[int] = None
+        self._warmup_seconds: Optional[float] = None
+        self._kv_cache_pool: Optional[KVCachePool] = None
 
     def get_model_name(self) -> str:
         return self.model_name
 
-    def get_model(self) -> Any:
+    def get_transcribe_options(self) -> Dict[str, Any]:
+        """Options keeping mlx_whisper.transcribe consistent with the weight dtype.
+
+        mlx_whisper feeds float16 mel to the model when fp16 is set and
+        checks the encoder output dtype, so only float16 weights use fp16;
+        bfloat16 and float32 weights run with float32 activations.
+
+        Returns:
+            Keyword arguments for mlx_whisper.transcribe
+        """
+        return {"fp16": self.dtype == "float16"}
+
+    def get_model(self) -> Whisper:
         """Get the loaded model, loading it if necessary.
 
         Returns:
-            Loaded MLX model
+            Loaded Whisper model
 
         Raises:
             ModelLoadError: If model loading fails
         """
-        with self._lock:
+        model = self._model
+        if model is not None:
+            return model
+
+        with self._load_lock:
             if self._model is None:
                 logger.info("Model not loaded, loading...", model_name=self.model_name)
                 self._load_model()
-                self._load_count += 1
                 logger.info(
                     "Model loaded successfully",
                     model_name=self.model_name,
@@ -62,12 +205,100 @@ class ModelManager:
         Raises:
             ModelLoadError: If model loading fails
         """
+        start = time.perf_counter()
         try:
-            self._model = mlx_whisper #load_model(self.model_name, dtype=mx.float16)
+            loader = load_whisper_mmap if self.mmap_weights else load_model
+            model = loader(self.model_name, dtype=DTYPES[self.dtype])
+            prepare_model(model, DTYPES[self.dtype], self.quantize_bits, self.quantize_group_size)
+            # mlx_whisper caches these process-wide; evaluate them here so concurrent
+            # inference threads never receive an array pending on another thread's stream
+            mx.eval(mel_filters(model.dims.n_mels), hanning(N_FFT))
         except Exception as e:
             logger.error("Failed to load model", model_name=self.model_name, error=str(e))
             raise ModelLoadError(self.model_name, str(e))
 
+        nbytes = model_nbytes(model)
+        with self._lock:
+            self._model = model
+            self._load_count += 1
+            self._load_seconds = time.perf_counter() - start
+            self._model_bytes = nbytes
+        _LOADED_MODELS[self.model_name] = model
+        logger.info(
+            "Model weights prepared",
+            model_name=self.model_name,
+            dtype=self.dtype,
+            quantize_bits=self.quantize_bits,
+            mmap_weights=self.mmap_weights,
+            model_bytes=self._model_bytes,
+            load_seconds=round(self._load_seconds, 3)
+        )
+
+    def transcribe(self, audio: Any, **options: Any) -> Dict[str, Any]:
+        """Transcribe with the managed model, loading it if necessary.
+
+        Args:
+            audio: 16 kHz mono float32 samples or a path for ffmpeg to decode
+            **options: Extra keyword arguments for mlx_whisper.transcribe
+
+        Returns:
+            Transcription result
+        """
+        self.get_model()
+        return mlx_whisper.transcribe(
+            audio,
+            path_or_hf_repo=self.model_name,
+            **{**self.get_transcribe_options(), **options}
+        )
+
+    def warmup(self, durations: Sequence[float] = (1.0,)) -> float:
+        """Load the model and transcribe a synthetic clip of each duration.
+
+        The first call through the encoder and decoder compiles kernels and
+        allocates buffers; doing it here keeps that cost off the first request.
+        Clips longer than one 30 second window also exercise the multi-window
+        path.
+
+        Args:
+            durations: Clip lengths in seconds
+
+        Returns:
+            Seconds spent in the warm-up transcriptions
+        """
+        self.get_model()
+        start = time.perf_counter()
+        for duration in durations:
+            self.transcribe(synthetic_clip(duration), language="en", temperature=0.0)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._warmup_seconds = elapsed
+        logger.info("Model warmed up", model_name=self.model_name, warmup_seconds=round(elapsed, 3))
+        return elapsed
+
+    def get_model_bytes(self) -> int:
+        """Get bytes held by the loaded model's parameters.
+
+        Returns:
+            Parameter bytes, or 0 if the model is not loaded
+        """
+        with self._lock:
+            return self._model_bytes or 0
+
+    def get_kv_cache_pool(self, model: Any, capacity: int) -> KVCachePool:
+        """Get the decoder KV cache pool, allocating it on first use.
+
+        Args:
+            model: Loaded Whisper model the pool is sized for
+            capacity: Number of sequences that can hold a buffer at once
+
+        Returns:
+            KV cache pool shared by all decoding on this model
+        """
+        with self._lock:
+            if self._kv_cache_pool is None:
+                self._kv_cache_pool = KVCachePool.for_model(model, capacity)
+            return self._kv_cache_pool
+
     def is_loaded(self) -> bool:
         """Check if model is loaded.
 
@@ -79,10 +310,14 @@ class ModelManager:
 
     def unload_model(self) -> None:
         """Unload the model to free resources."""
-        with self._lock:
+        with self._load_lock, self._lock:
             if self._model is not None:
                 logger.info("Unloading model", model_name=self.model_name)
+                _LOADED_MODELS.pop(self.model_name, None)
                 self._model = None
+                self._model_bytes = None
+                self._warmup_seconds = None
+                self._kv_cache_pool = None
 
     def get_status(self) -> Dict[str, Any]:
         """Get model manager status.
@@ -91,11 +326,19 @@ class ModelManager:
             Dictionary with status information
         """
         with self._lock:
-            return {
+            status = {
                 "model_name": self.model_name,
                 "loaded": self._model is not None,
                 "load_count": self._load_count,
+                "dtype": self.dtype,
+                "quantize_bits": self.quantize_bits,
+                "model_bytes": self._model_bytes,
+                "load_seconds": self._load_seconds,
+                "warmup_seconds": self._warmup_seconds,
             }
+            if self._kv_cache_pool is not None:
+                status["kv_cache_pool"] = self._kv_cache_pool.get_status()
+            return status
 
     def __enter__(self):
         """Context manager entry."""
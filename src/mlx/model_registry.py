@@ -0,0 +1,314 @@
+"""Registry of MLX Whisper models selectable per request."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import mlx.core as mx
+
+from ..core.exceptions import ModelNotFoundError
+from ..core.logging import get_logger
+from .model_manager import ModelManager
+
+logger = get_logger(__name__)
+
+# OpenAI model name and short aliases for the mlx-community Whisper checkpoints
+DEFAULT_ALIASES = {
+    "tiny": "mlx-community/whisper-tiny",
+    "base": "mlx-community/whisper-base-mlx",
+    "small": "mlx-community/whisper-small-mlx",
+    "medium": "mlx-community/whisper-medium-mlx",
+    "large-v3": "mlx-community/whisper-large-v3-mlx",
+    "large-v3-turbo": "mlx-community/whisper-large-v3-turbo",
+}
+
+# Served by the configured default model
+DEFAULT_MODEL_ALIAS = "whisper-1"
+
+ManagerFactory = Callable[[str], ModelManager]
+
+
+class ModelRegistry:
+    """Resolves request model names and keeps a bounded set of models loaded.
+
+    Each checkpoint gets its own ModelManager. Loaded models are kept in
+    least-recently-used order; after a load pushes the total parameter
+    bytes over the memory budget, idle models are unloaded oldest first.
+    Models that are transcribing are never unloaded, and the default model
+    is pinned because batching is installed on its instance at startup.
+    """
+
+    def __init__(
+        self,
+        default_model: str,
+        manager_factory: ManagerFactory,
+        aliases: Optional[Dict[str, str]] = None,
+        memory_budget_bytes: int = 0,
+        idle_unload_seconds: float = 0.0,
+        warmup: bool = True
+    ):
+        """Initialize model registry.
+
+        Args:
+            default_model: Checkpoint used when a request names no model
+                (or the OpenAI name whisper-1)
+            manager_factory: Builds a ModelManager for a checkpoint
+            aliases: Extra alias to checkpoint mappings, merged over DEFAULT_ALIASES
+            memory_budget_bytes: Parameter bytes allowed across loaded models (0 for unbounded)
+            idle_unload_seconds: Unload models unused for this long (0 disables)
+            warmup: Run a short transcription after each on-demand load
+        """
+        self.default_model = default_model
+        self.manager_factory = manager_factory
+        self.aliases = {**DEFAULT_ALIASES, **(aliases or {}), DEFAULT_MODEL_ALIAS: default_model}
+        self.memory_budget_bytes = memory_budget_bytes
+        self.idle_unload_seconds = idle_unload_seconds
+        self.warmup = warmup
+
+        self._lock = threading.Lock()
+        self._managers: Dict[str, ModelManager] = {}
+        self._manager_locks: Dict[str, threading.Lock] = {}
+        # Loaded checkpoints, least recently used first, with their last use time
+        self._lru: "OrderedDict[str, float]" = OrderedDict()
+        self._in_use: Dict[str, int] = {}
+        self._evictions = 0
+        self._reaper: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def resolve(self, name: Optional[str], request_id: Optional[str] = None) -> str:
+        """Map a request's model name to a checkpoint.
+
+        Args:
+            name: Alias, checkpoint or None for the default model
+            request_id: Request ID for error correlation
+
+        Returns:
+            Checkpoint name
+
+        Raises:
+            ModelNotFoundError: If the name is neither an alias nor a configured checkpoint
+        """
+        if not name:
+            return self.default_model
+        if name in self.aliases:
+            return self.aliases[name]
+        if name in self.aliases.values():
+            return name
+        raise ModelNotFoundError(name, sorted(self.aliases), request_id)
+
+    def get_manager(self, checkpoint: str) -> ModelManager:
+        """Get the manager for a checkpoint, creating it on first use.
+
+        Creating a manager may download the checkpoint (modelscope), so
+        call this off the event loop.
+
+        Args:
+            checkpoint: Checkpoint from resolve()
+
+        Returns:
+            Model manager
+        """
+        with self._lock:
+            lock = self._manager_locks.setdefault(checkpoint, threading.Lock())
+        # Per checkpoint, so one slow download does not block other models
+        with lock:
+            with self._lock:
+                manager = self._managers.get(checkpoint)
+            if manager is None:
+                manager = self.manager_factory(checkpoint)
+                with self._lock:
+                    self._managers[checkpoint] = manager
+            return manager
+
+    def acquire(self, checkpoint: str, warmup_durations: Optional[Sequence[float]] = None) -> ModelManager:
+        """Load a checkpoint's model and mark it in use.
+
+        Pair every call with release().
+
+        Args:
+            checkpoint: Checkpoint from resolve()
+            warmup_durations: Warm up with synthetic clips of these lengths
+                even if the model is already loaded (None keeps the
+                on-demand warm-up after a load)
+
+        Returns:
+            Model manager with its model loaded
+
+        Raises:
+            ModelLoadError: If model loading fails
+        """
+        manager = self.get_manager(checkpoint)
+        with self._lock:
+            self._in_use[checkpoint] = self._in_use.get(checkpoint, 0) + 1
+
+        try:
+            loaded = manager.is_loaded()
+            if not loaded:
+                manager.get_model()
+            if warmup_durations is not None:
+                manager.warmup(warmup_durations)
+            elif not loaded and self.warmup:
+                manager.warmup()
+        except Exception:
+            self.release(checkpoint)
+            raise
+
+        with self._lock:
+            self._lru[checkpoint] = time.monotonic()
+            self._lru.move_to_end(checkpoint)
+        self._enforce_budget()
+        return manager
+
+    def release(self, checkpoint: str) -> None:
+        """Mark one use of a checkpoint as finished.
+
+        Args:
+            checkpoint: Checkpoint passed to acquire()
+        """
+        with self._lock:
+            self._in_use[checkpoint] -= 1
+            if checkpoint in self._lru:
+                self._lru[checkpoint] = time.monotonic()
+
+    def transcribe(self, checkpoint: str, audio: Any, **options: Any) -> Dict[str, Any]:
+        """Transcribe with a checkpoint, loading it (and evicting others) as needed.
+
+        Args:
+            checkpoint: Checkpoint from resolve()
+            audio: 16 kHz mono float32 samples
+            **options: Extra keyword arguments for mlx_whisper.transcribe
+
+        Returns:
+            Transcription result
+        """
+        manager = self.acquire(checkpoint)
+        try:
+            return manager.transcribe(audio, **options)
+        finally:
+            self.release(checkpoint)
+
+    def get_transcribe_options(self, checkpoint: str) -> Dict[str, Any]:
+        """Options keeping mlx_whisper.transcribe consistent with a checkpoint's dtype.
+
+        Args:
+            checkpoint: Checkpoint from resolve()
+
+        Returns:
+            Keyword arguments for mlx_whisper.transcribe
+        """
+        return self.get_manager(checkpoint).get_transcribe_options()
+
+    def evict_idle(self) -> int:
+        """Unload models that have not been used for idle_unload_seconds.
+
+        Returns:
+            Number of models unloaded
+        """
+        if self.idle_unload_seconds <= 0:
+            return 0
+        cutoff = time.monotonic() - self.idle_unload_seconds
+        with self._lock:
+            idle = [checkpoint for checkpoint, last_used in self._lru.items()
+                    if last_used < cutoff and self._evictable(checkpoint)]
+        for checkpoint in idle:
+            self._unload(checkpoint, reason="idle")
+        return len(idle)
+
+    def start(self) -> None:
+        """Start the idle eviction thread (no-op when idle eviction is disabled)."""
+        if self.idle_unload_seconds <= 0 or self._reaper is not None:
+            return
+        self._stop_event.clear()
+        self._reaper = threading.Thread(target=self._reap, name="model-reaper", daemon=True)
+        self._reaper.start()
+
+    def stop(self) -> None:
+        """Stop the idle eviction thread."""
+        if self._reaper is None:
+            return
+        self._stop_event.set()
+        self._reaper.join()
+        self._reaper = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get registry status.
+
+        Returns:
+            Dictionary with status information
+        """
+        with self._lock:
+            managers = dict(self._managers)
+            lru = list(self._lru)
+            in_use = {checkpoint: count for checkpoint, count in self._in_use.items() if count}
+            evictions = self._evictions
+
+        return {
+            "default_model": self.default_model,
+            "aliases": dict(self.aliases),
+            "loaded": lru,
+            "in_use": in_use,
+            "loaded_bytes": sum(managers[checkpoint].get_model_bytes() for checkpoint in lru),
+            "memory_budget_bytes": self.memory_budget_bytes,
+            "evictions": evictions,
+            "models": {checkpoint: manager.get_status() for checkpoint, manager in managers.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Stop eviction and unload every model."""
+        self.stop()
+        with self._lock:
+            managers = list(self._managers.values())
+            self._lru.clear()
+        for manager in managers:
+            manager.unload_model()
+
+    def _reap(self) -> None:
+        """Idle eviction loop."""
+        interval = min(self.idle_unload_seconds / 2, 60.0)
+        while not self._stop_event.wait(interval):
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logger.error("Idle model eviction failed", error=str(e))
+
+    def _evictable(self, checkpoint: str) -> bool:
+        """Whether a loaded checkpoint may be unloaded; call with the lock held."""
+        return checkpoint != self.default_model and not self._in_use.get(checkpoint)
+
+    def _enforce_budget(self) -> None:
+        """Unload least recently used idle models until within the memory budget."""
+        if self.memory_budget_bytes <= 0:
+            return
+        while True:
+            with self._lock:
+                managers = self._managers
+                loaded_bytes = sum(managers[checkpoint].get_model_bytes() for checkpoint in self._lru)
+                if loaded_bytes <= self.memory_budget_bytes:
+                    return
+                victim = next((checkpoint for checkpoint in self._lru if self._evictable(checkpoint)), None)
+            if victim is None:
+                logger.warning(
+                    "Loaded models exceed memory budget but none can be unloaded",
+                    loaded_bytes=loaded_bytes,
+                    memory_budget_bytes=self.memory_budget_bytes
+                )
+                return
+            self._unload(victim, reason="memory_budget")
+
+    def _unload(self, checkpoint: str, reason: str) -> None:
+        """Unload one model and return its memory to the system.
+
+        Args:
+            checkpoint: Loaded checkpoint
+            reason: Why it is unloaded, for logging
+        """
+        with self._lock:
+            if checkpoint not in self._lru or not self._evictable(checkpoint):
+                return
+            del self._lru[checkpoint]
+            manager = self._managers[checkpoint]
+            self._evictions += 1
+        manager.unload_model()
+        mx.clear_cache()
+        logger.info("Model unloaded", model_name=checkpoint, reason=reason)
@@ -0,0 +1,190 @@
+"""Memory-mapped loading of Whisper checkpoint weights."""
+
+import json
+import mmap
+import struct
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+import mlx.core as mx
+import mlx.nn as nn
+import numpy as np
+from mlx.utils import tree_unflatten
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# safetensors dtype codes; BF16 has no numpy dtype and is reinterpreted from uint16
+_SAFETENSORS_DTYPES = {
+    "F64": np.float64,
+    "F32": np.float32,
+    "F16": np.float16,
+    "BF16": np.uint16,
+    "I64": np.int64,
+    "I32": np.int32,
+    "I16": np.int16,
+    "I8": np.int8,
+    "U64": np.uint64,
+    "U32": np.uint32,
+    "U16": np.uint16,
+    "U8": np.uint8,
+    "BOOL": np.bool_,
+}
+
+# Where a tensor lives in the mapped file: (dtype, shape, byte offset, Fortran order, is bfloat16)
+TensorLocation = Tuple[np.dtype, Tuple[int, ...], int, bool, bool]
+
+
+def _locate_safetensors(f: BinaryIO) -> Dict[str, TensorLocation]:
+    """Read a safetensors header.
+
+    Args:
+        f: Open safetensors file
+
+    Returns:
+        Tensor name to location
+    """
+    header_size = struct.unpack("<Q", f.read(8))[0]
+    header = json.loads(f.read(header_size))
+    header.pop("__metadata__", None)
+
+    locations = {}
+    for name, info in header.items():
+        bfloat16 = info["dtype"] == "BF16"
+        locations[name] = (
+            np.dtype(_SAFETENSORS_DTYPES[info["dtype"]]),
+            tuple(info["shape"]),
+            8 + header_size + info["data_offsets"][0],
+            False,
+            bfloat16
+        )
+    return locations
+
+
+def _locate_npz(f: BinaryIO) -> Optional[Dict[str, TensorLocation]]:
+    """Read the member headers of an uncompressed npz archive.
+
+    Args:
+        f: Open npz file
+
+    Returns:
+        Array name to location, or None if any member is compressed
+    """
+    locations = {}
+    for member in zipfile.ZipFile(f).infolist():
+        if member.compress_type != zipfile.ZIP_STORED:
+            return None
+
+        # Skip the zip local file header to reach the .npy payload
+        f.seek(member.header_offset)
+        local_header = f.read(30)
+        name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+        f.seek(member.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+        # mx.savez writes bfloat16 as two-byte void
+        bfloat16 = dtype == np.dtype("V2")
+        locations[member.filename.removesuffix(".npy")] = (
+            np.dtype(np.uint16) if bfloat16 else dtype,
+            shape,
+            f.tell(),
+            fortran_order,
+            bfloat16
+        )
+    return locations
+
+
+def load_weights(path: Path) -> Dict[str, mx.array]:
+    """Load checkpoint weights by memory-mapping the file.
+
+    MLX arrays own their memory, so each tensor is still copied once into
+    an MLX buffer. The copy streams from the page cache one tensor at a
+    time instead of reading the whole file into a private buffer first,
+    and each tensor's pages are unmapped once copied so they do not count
+    towards the process's resident memory.
+
+    Args:
+        path: weights.safetensors or weights.npz
+
+    Returns:
+        Flat mapping of parameter names to arrays
+    """
+    with open(path, "rb") as f:
+        locations = _locate_safetensors(f) if path.suffix == ".safetensors" else _locate_npz(f)
+        if locations is None:
+            # Compressed archives cannot be mapped
+            return mx.load(str(path))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    weights = {}
+    for name, (dtype, shape, offset, fortran_order, bfloat16) in locations.items():
+        count = int(np.prod(shape))
+        array = np.frombuffer(mapped, dtype=dtype, count=count, offset=offset)
+        array = array.reshape(shape[::-1]).T if fortran_order else array.reshape(shape)
+        weights[name] = mx.array(array).view(mx.bfloat16) if bfloat16 else mx.array(array)
+        mx.eval(weights[name])
+        del array
+
+        # Drop this tensor's pages from the mapping; they stay in the page cache
+        start = offset - offset % mmap.PAGESIZE
+        mapped.madvise(mmap.MADV_DONTNEED, start, offset + count * dtype.itemsize - start)
+
+    mapped.close()
+    return weights
+
+
+def find_weights_file(model_path: Path) -> Path:
+    """Locate the weights file of a checkpoint directory.
+
+    Args:
+        model_path: Checkpoint directory
+
+    Returns:
+        weights.safetensors if present, else weights.npz
+    """
+    path = model_path / "weights.safetensors"
+    return path if path.exists() else model_path / "weights.npz"
+
+
+def load_whisper_mmap(path_or_hf_repo: str, dtype: mx.Dtype = mx.float16) -> Whisper:
+    """Load a Whisper checkpoint like mlx_whisper.load_model, memory-mapping the weights.
+
+    Args:
+        path_or_hf_repo: Checkpoint directory or Hugging Face repository
+        dtype: Dtype for the model's non-parameter buffers
+
+    Returns:
+        Whisper model with evaluated parameters
+    """
+    model_path = Path(path_or_hf_repo)
+    if not model_path.exists():
+        from huggingface_hub import snapshot_download
+        model_path = Path(snapshot_download(repo_id=path_or_hf_repo))
+
+    with open(model_path / "config.json", "r") as f:
+        config = json.load(f)
+    config.pop("model_type", None)
+    quantization: Optional[dict] = config.pop("quantization", None)
+
+    weights_path = find_weights_file(model_path)
+    weights = load_weights(weights_path)
+
+    model = Whisper(ModelDimensions(**config), dtype)
+    if quantization is not None:
+        nn.quantize(
+            model,
+            **quantization,
+            class_predicate=lambda p, m: isinstance(m, (nn.Linear, nn.Embedding)) and f"{p}.scales" in weights
+        )
+    model.update(tree_unflatten(list(weights.items())))
+    mx.eval(model.parameters())
+
+    logger.debug("Weights memory-mapped", weights_file=str(weights_path), tensors=len(weights))
+    return model
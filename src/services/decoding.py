@@ -0,0 +1,227 @@
+"""In-process audio decoding to 16 kHz mono float32 PCM."""
+
+import struct
+from math import gcd
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Whisper's expected input sample rate
+SAMPLE_RATE = 16000
+
+# WAVE format tags
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+AudioSource = Union[str, bytes]
+Decoder = Callable[[bytes], np.ndarray]
+
+# Registry of in-process decoders keyed by AudioValidator format names
+DECODERS: Dict[str, Decoder] = {}
+
+
+class UnsupportedEncodingError(ValueError):
+    """Raised when an in-process decoder cannot handle a file's encoding."""
+
+
+class PreparedAudio:
+    """Audio decoded once and shared by validation and inference."""
+
+    def __init__(self, format: str, samples: np.ndarray, path: Optional[str] = None):
+        """Initialize prepared audio.
+
+        Args:
+            format: Validated audio format
+            samples: 16 kHz mono float32 samples
+            path: Source file path, if the audio came from disk
+        """
+        self.format = format
+        self.samples = samples
+        self.path = path
+
+    @property
+    def duration(self) -> float:
+        """Exact duration in seconds from the decoded sample count."""
+        return len(self.samples) / SAMPLE_RATE
+
+
+def register_decoder(format: str) -> Callable[[Decoder], Decoder]:
+    """Register an in-process decoder for a format.
+
+    Args:
+        format: Format name as returned by AudioValidator._detect_format
+
+    Returns:
+        Decorator registering the decoder
+    """
+    def decorator(decoder: Decoder) -> Decoder:
+        DECODERS[format] = decoder
+        return decoder
+    return decorator
+
+
+def decode_audio(source: AudioSource, format: str) -> Union[str, np.ndarray]:
+    """Decode audio in-process when a decoder is registered for its format.
+
+    Args:
+        source: Path to the audio file or its raw bytes
+        format: Detected audio format
+
+    Returns:
+        16 kHz mono float32 samples, or the original path when no in-process
+        decoder applies (mlx_whisper then decodes it with ffmpeg)
+    """
+    decoder = DECODERS.get(format)
+    if decoder is not None:
+        data = Path(source).read_bytes() if isinstance(source, str) else source
+        try:
+            return decoder(data)
+        except UnsupportedEncodingError as e:
+            logger.debug("In-process decode not possible, using ffmpeg", format=format, reason=str(e))
+
+    if isinstance(source, str):
+        return source
+    return _decode_with_ffmpeg(source)
+
+
+def _decode_with_ffmpeg(data: bytes) -> np.ndarray:
+    """Decode raw bytes with ffmpeg through stdin.
+
+    Args:
+        data: Raw audio bytes
+
+    Returns:
+        16 kHz mono float32 samples
+    """
+    from subprocess import CalledProcessError, run
+
+    cmd = [
+        "ffmpeg", "-nostdin", "-i", "pipe:0", "-threads", "0",
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"
+    ]
+    try:
+        out = run(cmd, input=data, capture_output=True, check=True).stdout
+    except CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio: {e.stderr.decode()}") from e
+
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+def to_whisper_pcm(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Down-mix to mono and resample to 16 kHz float32.
+
+    Args:
+        samples: Float samples shaped (frames,) or (frames, channels)
+        sample_rate: Source sample rate
+
+    Returns:
+        16 kHz mono float32 samples
+    """
+    if samples.ndim == 2:
+        samples = samples.mean(axis=1)
+
+    if sample_rate != SAMPLE_RATE:
+        from scipy.signal import resample_poly
+
+        divisor = gcd(SAMPLE_RATE, sample_rate)
+        samples = resample_poly(samples, SAMPLE_RATE // divisor, sample_rate // divisor)
+
+    return np.ascontiguousarray(samples, dtype=np.float32)
+
+
+def parse_wav_header(data: bytes) -> Tuple[int, int, int, int, int, int]:
+    """Locate the fmt and data chunks of a RIFF/WAVE file.
+
+    Args:
+        data: File bytes (only the header region is required)
+
+    Returns:
+        Tuple of (format_tag, channels, sample_rate, bits_per_sample,
+        data_offset, data_size). data_size may exceed the bytes available
+        for streamed files with placeholder sizes.
+
+    Raises:
+        UnsupportedEncodingError: If the header is not a parseable WAVE header
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise UnsupportedEncodingError("not a RIFF/WAVE file")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        chunk_size = struct.unpack_from("<I", data, offset + 4)[0]
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(data):
+                raise UnsupportedEncodingError("truncated fmt chunk")
+            format_tag, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", data, body)
+            if format_tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40 and body + 26 <= len(data):
+                # Sub-format GUID starts with the actual format tag
+                format_tag = struct.unpack_from("<H", data, body + 24)[0]
+            fmt = (format_tag, channels, sample_rate, bits)
+
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise UnsupportedEncodingError("data chunk before fmt chunk")
+            return (*fmt, body, chunk_size)
+
+        # Chunks are word aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise UnsupportedEncodingError("missing fmt or data chunk")
+
+
+@register_decoder("wav")
+def decode_wav(data: bytes) -> np.ndarray:
+    """Decode PCM or IEEE float WAV data without ffmpeg.
+
+    Args:
+        data: WAV file bytes
+
+    Returns:
+        16 kHz mono float32 samples
+
+    Raises:
+        UnsupportedEncodingError: For compressed or unusual encodings
+    """
+    format_tag, channels, sample_rate, bits, data_offset, data_size = parse_wav_header(data)
+
+    if channels < 1 or sample_rate < 1:
+        raise UnsupportedEncodingError("invalid channel count or sample rate")
+
+    sample_width = bits // 8
+    frame_width = sample_width * channels
+    payload = data[data_offset:data_offset + data_size]
+    payload = payload[:len(payload) - len(payload) % frame_width]
+
+    if format_tag == _WAVE_FORMAT_PCM and bits == 8:
+        samples = (np.frombuffer(payload, np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 16:
+        samples = np.frombuffer(payload, "<i2").astype(np.float32) / 32768.0
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 24:
+        raw = np.frombuffer(payload, np.uint8).reshape(-1, 3)
+        # Place the 3 bytes in the top of an int32 to keep the sign bit
+        widened = np.zeros((raw.shape[0], 4), np.uint8)
+        widened[:, 1:] = raw
+        samples = widened.view("<i4").reshape(-1).astype(np.float32) / 2147483648.0
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 32:
+        samples = np.frombuffer(payload, "<i4").astype(np.float32) / 2147483648.0
+    elif format_tag == _WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        samples = np.frombuffer(payload, "<f4").astype(np.float32)
+    elif format_tag == _WAVE_FORMAT_IEEE_FLOAT and bits == 64:
+        samples = np.frombuffer(payload, "<f8").astype(np.float32)
+    else:
+        raise UnsupportedEncodingError(f"format tag {format_tag:#06x} with {bits} bits")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+
+    return to_whisper_pcm(samples, sample_rate)
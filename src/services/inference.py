@@ -0,0 +1,64 @@
+"""Execution backends for blocking MLX inference."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+INFERENCE_BACKENDS = ("thread", "process", "host")
+
+
+def create_inference_executor(backend: str, max_workers: int = 1) -> Optional[Executor]:
+    """Create the executor backing inference for the configured backend.
+
+    With the "thread" backend inference runs directly on WorkerPool threads
+    sharing the process model, so no extra executor is needed. With the
+    "process" backend each WorkerPool thread forwards its task to a process
+    pool where every process holds its own model. With the "host" backend
+    WorkerPool threads forward to the shared model host process instead.
+
+    Args:
+        backend: "thread", "process" or "host"
+        max_workers: Number of inference processes
+
+    Returns:
+        Process pool executor, or None for the thread and host backends
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    if backend not in INFERENCE_BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend}. Allowed: {', '.join(INFERENCE_BACKENDS)}")
+
+    if backend != "process":
+        return None
+
+    logger.info("Inference process pool created", max_workers=max_workers)
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def transcribe_in_process(
+    audio: np.ndarray,
+    model_name: str,
+    options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run mlx_whisper transcription inside a worker process.
+
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+    Each process keeps its own model cached by mlx_whisper's ModelHolder.
+
+    Args:
+        audio: 16 kHz mono float32 samples decoded by the parent
+        model_name: Model path or Hugging Face repo
+        options: Extra keyword arguments for transcribe
+
+    Returns:
+        Transcription result
+    """
+    import mlx_whisper
+
+    return mlx_whisper.transcribe(audio, path_or_hf_repo=model_name, **options)
@@ -0,0 +1,109 @@
+"""Streaming ingestion of uploaded audio files."""
+
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Optional, Tuple
+
+from fastapi import UploadFile
+
+from ..core.exceptions import FileTooLargeError
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Read size when copying an upload; bounds per-request memory used for the copy
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _copy_upload(
+    source: BinaryIO,
+    destination: BinaryIO,
+    max_size: int,
+    chunk_size: int,
+    digest: Optional[Any] = None
+) -> int:
+    """Copy an upload in chunks, stopping as soon as it exceeds max_size.
+
+    Args:
+        source: Uploaded file object
+        destination: Destination file object
+        max_size: Maximum allowed size in bytes
+        chunk_size: Bytes read per chunk
+        digest: Optional hashlib object updated with every chunk
+
+    Returns:
+        Number of bytes copied
+
+    Raises:
+        FileTooLargeError: If the upload exceeds max_size
+    """
+    size = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return size
+        size += len(chunk)
+        if size > max_size:
+            raise FileTooLargeError(size, max_size)
+        destination.write(chunk)
+        if digest is not None:
+            digest.update(chunk)
+
+
+@asynccontextmanager
+async def spool_upload(
+    upload: UploadFile,
+    max_size: int,
+    request_id: Optional[str] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    digest: Optional[Any] = None
+) -> AsyncIterator[Tuple[str, int]]:
+    """Stream an upload into a single temporary file.
+
+    Starlette keeps small uploads in memory and rolls larger ones over to its
+    own temporary file; this copies from there in fixed-size chunks on a
+    worker thread, so the upload is never held in memory as one bytes object.
+    The temporary file keeps the upload's extension for format detection and
+    is removed on exit.
+
+    Args:
+        upload: Uploaded file
+        max_size: Maximum allowed size in bytes, enforced while copying
+        request_id: Request ID for tracking
+        chunk_size: Bytes read per chunk
+        digest: Optional hashlib object fed the upload while it is copied,
+            so content hashing needs no second read
+
+    Yields:
+        Tuple of (temporary file path, size in bytes)
+
+    Raises:
+        FileTooLargeError: If the upload exceeds max_size
+    """
+    suffix = Path(upload.filename or "audio.mp3").suffix
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as destination:
+            await upload.seek(0)
+            try:
+                size = await asyncio.to_thread(_copy_upload, upload.file, destination, max_size, chunk_size, digest)
+            except FileTooLargeError as e:
+                e.request_id = request_id
+                raise
+
+        logger.debug("Upload spooled to disk", size_bytes=size, request_id=request_id)
+        yield temp_path, size
+
+    finally:
+        try:
+            Path(temp_path).unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning(
+                "Failed to cleanup temporary file",
+                file_path=temp_path,
+                error=str(e),
+                request_id=request_id
+            )
@@ -0,0 +1,332 @@
+"""Prometheus metrics for the transcription pipeline.
+
+Metrics are kept in process memory and rendered in the Prometheus text
+exposition format on scrape. Recording an observation is a bucket lookup
+and a few additions under an uncontended lock, so instrumented code paths
+stay within noise of uninstrumented ones.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Pipeline stages timed per request
+STAGES = (
+    "upload_read",
+    "dump",
+    "validation",
+    "probe",
+    "audio_decode",
+    "queue_wait",
+    "inference",
+    "encode",
+    "decode",
+    "serialization",
+)
+
+# Seconds, from sub-millisecond header probes to multi-minute transcriptions
+STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Audio seconds per inference second
+RTF_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    """Render a label set as {name="value",...} (empty for no labels)."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value."""
+    return repr(float(value))
+
+
+class Histogram:
+    """Histogram with cumulative buckets and an optional single label."""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], label: Optional[str] = None):
+        """Initialize histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            buckets: Sorted upper bounds (+Inf is implied)
+            label: Label name distinguishing series, if any
+        """
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.label = label
+        self._lock = threading.Lock()
+        # Label value to (per-bucket counts including +Inf, sum)
+        self._series: Dict[Optional[str], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, label_value: Optional[str] = None) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value
+            label_value: Series label value (None when the histogram has no label)
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def get_count(self, label_value: Optional[str] = None) -> int:
+        """Number of observations in one series."""
+        with self._lock:
+            series = self._series.get(label_value)
+            return sum(series[0]) if series is not None else 0
+
+    def render(self) -> List[str]:
+        """Render the histogram in the text exposition format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {key: (list(counts), total[0]) for key, (counts, total) in self._series.items()}
+
+        for label_value, (counts, total) in sorted(snapshot.items(), key=lambda item: item[0] or ""):
+            labels = [(self.label, label_value)] if self.label is not None else []
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(f"{self.name}_bucket{_format_labels([*labels, ('le', le)])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter with an optional single label."""
+
+    def __init__(self, name: str, documentation: str, label: Optional[str] = None):
+        """Initialize counter.
+
+        Args:
+            name: Metric name (conventionally ending in _total)
+            documentation: HELP text
+            label: Label name distinguishing series, if any
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self._lock = threading.Lock()
+        self._values: Dict[Optional[str], float] = {}
+
+    def inc(self, amount: float = 1.0, label_value: Optional[str] = None) -> None:
+        """Increase one series.
+
+        Args:
+            amount: Non-negative increment
+            label_value: Series label value (None when the counter has no label)
+        """
+        with self._lock:
+            self._values[label_value] = self._values.get(label_value, 0.0) + amount
+
+    def get(self, label_value: Optional[str] = None) -> float:
+        """Current value of one series."""
+        with self._lock:
+            return self._values.get(label_value, 0.0)
+
+    def render(self) -> List[str]:
+        """Render the counter in the text exposition format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = dict(self._values)
+        if not values and self.label is None:
+            values[None] = 0.0
+        for label_value, value in sorted(values.items(), key=lambda item: item[0] or ""):
+            labels = [(self.label, label_value)] if self.label is not None else []
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class ServerMetrics:
+    """Per-process metrics of the transcription server."""
+
+    def __init__(self):
+        """Initialize server metrics."""
+        self.stage_seconds = Histogram(
+            "mlx_whisper_stage_seconds",
+            "Time spent in each pipeline stage",
+            STAGE_BUCKETS,
+            label="stage"
+        )
+        self.errors = Counter(
+            "mlx_whisper_errors_total",
+            "Failed requests by error type",
+            label="error_type"
+        )
+        self.audio_seconds = Counter(
+            "mlx_whisper_audio_seconds_total",
+            "Audio seconds transcribed; its rate is audio seconds processed per wall second"
+        )
+        self.inference_seconds = Counter(
+            "mlx_whisper_inference_seconds_total",
+            "Seconds spent running inference, excluding queue wait"
+        )
+        self.cache_lookups = Counter(
+            "mlx_whisper_result_cache_lookups_total",
+            "Result cache lookups by outcome (hit or miss)",
+            label="result"
+        )
+        self.realtime_factor = Histogram(
+            "mlx_whisper_realtime_factor",
+            "Audio seconds per inference second, per request",
+            RTF_BUCKETS
+        )
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Record the duration of one pipeline stage.
+
+        Args:
+            stage: Stage name from STAGES
+            seconds: Elapsed seconds
+        """
+        self.stage_seconds.observe(seconds, stage)
+
+    @contextmanager
+    def time_stage(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as one pipeline stage.
+
+        Args:
+            stage: Stage name from STAGES
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds.observe(time.perf_counter() - start, stage)
+
+    def record_error(self, error_type: str) -> None:
+        """Count one failed request.
+
+        Args:
+            error_type: TranscribeError.error_type (server_error for unexpected errors)
+        """
+        self.errors.inc(1.0, error_type)
+
+    def record_transcription(self, audio_seconds: float, inference_seconds: float) -> None:
+        """Record a finished transcription for throughput and real-time factor.
+
+        Args:
+            audio_seconds: Validated audio duration
+            inference_seconds: Wall time of the inference task, excluding queue wait
+        """
+        self.audio_seconds.inc(audio_seconds)
+        self.inference_seconds.inc(inference_seconds)
+        if inference_seconds > 0:
+            self.realtime_factor.observe(audio_seconds / inference_seconds)
+
+    def render(self, gauges: Optional[Dict[str, Tuple[str, float]]] = None) -> str:
+        """Render all metrics in the Prometheus text exposition format.
+
+        Args:
+            gauges: Gauges sampled at scrape time, by name: (HELP text, value)
+
+        Returns:
+            Exposition text
+        """
+        lines: List[str] = []
+        for metric in (self.stage_seconds, self.errors, self.audio_seconds, self.inference_seconds,
+                       self.realtime_factor, self.cache_lookups):
+            lines.extend(metric.render())
+        for name, (documentation, value) in (gauges or {}).items():
+            lines.extend([f"# HELP {name} {documentation}", f"# TYPE {name} gauge", f"{name} {_format_value(value)}"])
+        return "\n".join(lines) + "\n"
+
+
+class RealtimeFactorTracker:
+    """Rolling real-time factor per model.
+
+    The real-time factor is audio seconds transcribed per second of
+    inference, so 10.0 means ten minutes of audio per minute of compute.
+    Each model keeps its most recent requests; the rolling factor divides
+    their total audio by their total inference time, so long requests
+    weigh more than short ones, as they do for capacity.
+    """
+
+    def __init__(self, window: int = 100):
+        """Initialize real-time factor tracker.
+
+        Args:
+            window: Requests per model in the rolling window
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        # Model to recent (audio seconds, inference seconds)
+        self._recent: Dict[str, Deque[Tuple[float, float]]] = {}
+        # Model to lifetime [requests, audio seconds, inference seconds]
+        self._totals: Dict[str, List[float]] = {}
+
+    def record(self, model: str, audio_seconds: float, inference_seconds: float) -> Optional[float]:
+        """Record one transcription.
+
+        Args:
+            model: Model (checkpoint) that transcribed the audio
+            audio_seconds: Validated audio duration
+            inference_seconds: Inference wall time, excluding queue wait
+
+        Returns:
+            The request's real-time factor, or None if no time was measured
+        """
+        if inference_seconds <= 0:
+            return None
+
+        with self._lock:
+            recent = self._recent.get(model)
+            if recent is None:
+                recent = self._recent[model] = deque(maxlen=self.window)
+                self._totals[model] = [0, 0.0, 0.0]
+            recent.append((audio_seconds, inference_seconds))
+            totals = self._totals[model]
+            totals[0] += 1
+            totals[1] += audio_seconds
+            totals[2] += inference_seconds
+        return audio_seconds / inference_seconds
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get rolling and lifetime real-time factors per model.
+
+        Returns:
+            Model to status dictionary
+        """
+        with self._lock:
+            snapshot = {model: (list(recent), list(self._totals[model])) for model, recent in self._recent.items()}
+
+        status = {}
+        for model, (recent, (requests, audio_seconds, inference_seconds)) in snapshot.items():
+            factors = [audio / inference for audio, inference in recent]
+            recent_audio = sum(audio for audio, _ in recent)
+            recent_inference = sum(inference for _, inference in recent)
+            status[model] = {
+                "window_requests": len(recent),
+                "rolling_rtf": round(recent_audio / recent_inference, 3),
+                "min_rtf": round(min(factors), 3),
+                "max_rtf": round(max(factors), 3),
+                "total_requests": int(requests),
+                "total_audio_seconds": round(audio_seconds, 3),
+                "total_inference_seconds": round(inference_seconds, 3),
+                "total_rtf": round(audio_seconds / inference_seconds, 3),
+            }
+        return status
+
+
+# Process-wide metrics, like Prometheus client libraries' default registry
+METRICS = ServerMetrics()
@@ -0,0 +1,266 @@
+"""Unix socket transport between HTTP front-end workers and the model host process."""
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from ..core.exceptions import TranscribeError
+from ..core.logging import get_logger
+from .decoding import SAMPLE_RATE
+
+logger = get_logger(__name__)
+
+# Frame prefix: JSON header length, raw payload length
+_FRAME = struct.Struct("<IQ")
+
+# Samples cross the socket as raw little-endian float32
+_SAMPLE_DTYPE = np.dtype("<f4")
+
+Handler = Callable[[Dict[str, Any], np.ndarray], Dict[str, Any]]
+
+
+def send_message(sock: socket.socket, header: Dict[str, Any], payload: Any = b"") -> None:
+    """Send one framed message.
+
+    Args:
+        sock: Connected socket
+        header: JSON-serializable header
+        payload: Raw bytes (or a buffer such as a float32 array) sent after the header
+    """
+    data = json.dumps(header, default=_to_json).encode()
+    view = memoryview(payload).cast("B")
+    sock.sendall(_FRAME.pack(len(data), view.nbytes) + data)
+    if view.nbytes:
+        sock.sendall(view)
+
+
+def _to_json(value: Any) -> Any:
+    """Convert NumPy values in transcription results to JSON types."""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def recv_message(sock: socket.socket) -> Tuple[Dict[str, Any], bytearray]:
+    """Receive one framed message.
+
+    Args:
+        sock: Connected socket
+
+    Returns:
+        Tuple of (header, payload)
+
+    Raises:
+        ConnectionError: If the peer closes the connection mid-message
+    """
+    header_size, payload_size = _FRAME.unpack(_recv_exactly(sock, _FRAME.size))
+    header = json.loads(_recv_exactly(sock, header_size))
+    return header, _recv_exactly(sock, payload_size)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytearray:
+    """Read exactly size bytes into a fresh buffer.
+
+    Args:
+        sock: Connected socket
+        size: Number of bytes
+
+    Returns:
+        Received bytes
+
+    Raises:
+        ConnectionError: If the peer closes the connection first
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("Model host connection closed")
+        received += count
+    return buffer
+
+
+class ModelHostServer:
+    """Serves transcription requests from front-end workers over a Unix socket.
+
+    Each connection carries one request and is handled on its own thread,
+    so requests from every front-end reach the host's worker pool (and
+    the batching installed on its model) concurrently.
+    """
+
+    def __init__(self, socket_path: str, handler: Handler):
+        """Initialize model host server.
+
+        Args:
+            socket_path: Unix socket path to listen on (a stale file is replaced)
+            handler: Maps (request header, float32 samples) to a response header
+        """
+        self.socket_path = socket_path
+        self.handler = handler
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Bind the socket and start serving in a background thread."""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        handler = self.handler
+
+        class RequestHandler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                try:
+                    header, payload = recv_message(self.request)
+                except (ConnectionError, ValueError) as e:
+                    logger.warning("Malformed model host request", error=str(e))
+                    return
+                samples = np.frombuffer(payload, dtype=_SAMPLE_DTYPE)
+                send_message(self.request, handler(header, samples))
+
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, RequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="model-host", daemon=True)
+        self._thread.start()
+        logger.info("Model host listening", socket_path=self.socket_path)
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        logger.info("Model host stopped")
+
+
+def handle_host_request(
+    header: Dict[str, Any],
+    samples: np.ndarray,
+    model_registry: Any,
+    worker_pool: Any,
+    get_status: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run one front-end request inside the model host.
+
+    Args:
+        header: Request header ("status" or "transcribe" type)
+        samples: 16 kHz mono float32 samples (empty for status requests)
+        model_registry: Host model registry
+        worker_pool: Host worker pool providing admission and scheduling
+        get_status: Returns the host's service status
+
+    Returns:
+        Response header with "result" or "error"
+    """
+    request_id = header.get("request_id")
+    try:
+        if header.get("type") == "status":
+            return {"result": get_status()}
+
+        checkpoint = model_registry.resolve(header.get("model"), request_id)
+        options = {**model_registry.get_transcribe_options(checkpoint), **header.get("options", {})}
+
+        def task() -> Dict[str, Any]:
+            return model_registry.transcribe(checkpoint, samples, **options)
+
+        future = worker_pool.submit(task, request_id, len(samples) / SAMPLE_RATE, header.get("client_id"))
+        return {"result": future.result()}
+
+    except TranscribeError as e:
+        return {"error": {"message": e.message, "type": e.error_type, "status_code": e.status_code}}
+
+    except Exception as e:
+        logger.error("Model host request failed", error=str(e), request_id=request_id)
+        return {"error": {"message": f"Transcription failed: {e}", "type": "server_error", "status_code": 500}}
+
+
+class ModelHostClient:
+    """Forwards decoded audio from a front-end worker to the model host."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        """Initialize model host client.
+
+        Args:
+            socket_path: Unix socket the model host listens on
+            timeout: Socket timeout in seconds (None waits for the transcription)
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def transcribe(
+        self,
+        samples: np.ndarray,
+        model: Optional[str],
+        options: Dict[str, Any],
+        request_id: Optional[str] = None,
+        client_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Transcribe samples on the model host.
+
+        Args:
+            samples: 16 kHz mono float32 samples
+            model: Checkpoint (None for the host's default model)
+            options: Extra keyword arguments for mlx_whisper.transcribe
+            request_id: Request ID for tracking
+            client_id: Client identity, used by the host's scheduling policy
+
+        Returns:
+            Transcription result
+
+        Raises:
+            TranscribeError: If the host rejects or fails the request
+            ConnectionError: If the host is unreachable
+        """
+        header = {
+            "type": "transcribe",
+            "request_id": request_id,
+            "client_id": client_id,
+            "model": model,
+            "options": options,
+        }
+        return self._request(header, np.ascontiguousarray(samples, dtype=_SAMPLE_DTYPE), request_id)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the model host's service status.
+
+        Returns:
+            Dictionary with status information
+        """
+        return self._request({"type": "status"})
+
+    def _request(self, header: Dict[str, Any], payload: Any = b"", request_id: Optional[str] = None) -> Any:
+        """Send one request on a fresh connection and unwrap the response.
+
+        Args:
+            header: Request header
+            payload: Raw payload
+            request_id: Request ID attached to errors
+
+        Returns:
+            Response result
+
+        Raises:
+            TranscribeError: If the host returned an error
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            send_message(sock, header, payload)
+            response, _ = recv_message(sock)
+
+        error = response.get("error")
+        if error is not None:
+            raise TranscribeError(error["message"], error["type"], error["status_code"], request_id)
+        return response["result"]
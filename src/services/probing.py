@@ -0,0 +1,415 @@
+"""In-process audio duration probes that read only container headers."""
+
+import mmap
+import os
+import struct
+from typing import BinaryIO, Callable, Dict, Optional, Tuple
+
+from ..core.logging import get_logger
+
+logger = get_logger(__name__)
+
+Probe = Callable[[BinaryIO, int], Optional[float]]
+
+# Registry of duration probes keyed by AudioValidator format names
+PROBES: Dict[str, Probe] = {}
+
+
+def register_probe(*formats: str) -> Callable[[Probe], Probe]:
+    """Register a duration probe for one or more formats.
+
+    Args:
+        formats: Format names as returned by AudioValidator._detect_format
+
+    Returns:
+        Decorator registering the probe
+    """
+    def decorator(probe: Probe) -> Probe:
+        for format in formats:
+            PROBES[format] = probe
+        return probe
+    return decorator
+
+
+def probe_duration(file_path: str, format: str) -> Optional[float]:
+    """Get audio duration from container headers without decoding.
+
+    Args:
+        file_path: Path to the file
+        format: Detected file format
+
+    Returns:
+        Duration in seconds, or None if no probe applies or headers are unusable
+    """
+    probe = PROBES.get(format)
+    if probe is None:
+        return None
+
+    try:
+        with open(file_path, "rb") as f:
+            file_size = os.fstat(f.fileno()).st_size
+            duration = probe(f, file_size)
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug("Duration probe failed", file_path=file_path, format=format, error=str(e))
+        return None
+
+    if duration is None or duration < 0:
+        return None
+    return float(duration)
+
+
+@register_probe("wav")
+def probe_wav(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Duration from RIFF fmt byte rate and data chunk size.
+
+    Args:
+        f: Open file
+        file_size: File size in bytes
+
+    Returns:
+        Duration in seconds or None
+    """
+    header = f.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        return None
+
+    byte_rate = None
+    offset = 12
+    while offset + 8 <= file_size:
+        f.seek(offset)
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            return None
+        chunk_id, chunk_size = chunk_header[:4], struct.unpack("<I", chunk_header[4:])[0]
+
+        if chunk_id == b"fmt ":
+            fmt = f.read(16)
+            if len(fmt) < 16:
+                return None
+            byte_rate = struct.unpack_from("<I", fmt, 8)[0]
+
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            available = file_size - offset - 8
+            # Streamed writers leave 0 or 0xFFFFFFFF as a placeholder size
+            if chunk_size == 0 or chunk_size > available:
+                chunk_size = available
+            return chunk_size / byte_rate
+
+        offset += 8 + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+# MPEG audio tables indexed by [version][layer] where version is 1 (MPEG-1)
+# or 2 (MPEG-2/2.5) and layer is 1-3
+_MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    0b11: (44100, 48000, 32000),  # MPEG-1
+    0b10: (22050, 24000, 16000),  # MPEG-2
+    0b00: (11025, 12000, 8000),   # MPEG-2.5
+}
+# How far to look for the first frame after any ID3v2 tag
+_MP3_SYNC_SEARCH_BYTES = 64 * 1024
+
+
+def parse_mp3_frame_header(header: bytes) -> Optional[Tuple[int, int, int, int, bool]]:
+    """Parse a 4-byte MPEG audio frame header.
+
+    Args:
+        header: Four header bytes
+
+    Returns:
+        Tuple of (frame_length, samples_per_frame, sample_rate, side_info_size,
+        is_mono), or None if the bytes are not a valid frame header
+    """
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (header[1] >> 3) & 0b11
+    layer_bits = (header[1] >> 1) & 0b11
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0b11
+    padding = (header[2] >> 1) & 0b1
+    is_mono = (header[3] >> 6) == 0b11
+
+    if version_bits == 0b01 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    version = 1 if version_bits == 0b11 else 2
+    layer = 4 - layer_bits
+    bitrate = _MP3_BITRATES[(version, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version_bits][sample_rate_index]
+
+    if layer == 1:
+        samples_per_frame = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2 or version == 1:
+        samples_per_frame = 1152
+        frame_length = 144 * bitrate // sample_rate + padding
+    else:
+        samples_per_frame = 576
+        frame_length = 72 * bitrate // sample_rate + padding
+
+    if version == 1:
+        side_info_size = 17 if is_mono else 32
+    else:
+        side_info_size = 9 if is_mono else 17
+
+    return frame_length, samples_per_frame, sample_rate, side_info_size, is_mono
+
+
+def _skip_id3v2(f: BinaryIO) -> int:
+    """Return the offset just past an ID3v2 tag (0 if none)."""
+    f.seek(0)
+    header = f.read(10)
+    if len(header) == 10 and header[:3] == b"ID3":
+        size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+        footer = 10 if header[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+
+@register_probe("mp3")
+def probe_mp3(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Duration from a Xing/Info/VBRI header, or by scanning frame headers.
+
+    Args:
+        f: Open file
+        file_size: File size in bytes
+
+    Returns:
+        Duration in seconds or None
+    """
+    audio_start = _skip_id3v2(f)
+    f.seek(audio_start)
+    window = f.read(_MP3_SYNC_SEARCH_BYTES)
+
+    # Find the first frame whose successor is also a valid frame
+    first = None
+    for i in range(len(window) - 4):
+        if window[i] != 0xFF:
+            continue
+        parsed = parse_mp3_frame_header(window[i:i + 4])
+        if parsed is None:
+            continue
+        following = window[i + parsed[0]:i + parsed[0] + 4]
+        if len(following) < 4 or parse_mp3_frame_header(following) is not None:
+            first = (i, parsed)
+            break
+    if first is None:
+        return None
+
+    position, (frame_length, samples_per_frame, sample_rate, side_info_size, _) = first
+    frame = window[position:position + frame_length]
+
+    # Xing ("Xing" for VBR, "Info" for CBR, both written by LAME)
+    xing_offset = 4 + side_info_size
+    tag = frame[xing_offset:xing_offset + 4]
+    if tag in (b"Xing", b"Info") and len(frame) >= xing_offset + 12:
+        flags = struct.unpack_from(">I", frame, xing_offset + 4)[0]
+        if flags & 0x1:
+            frames = struct.unpack_from(">I", frame, xing_offset + 8)[0]
+            return frames * samples_per_frame / sample_rate
+
+    # VBRI (Fraunhofer) sits 32 bytes after the frame header
+    if frame[36:40] == b"VBRI" and len(frame) >= 54:
+        frames = struct.unpack_from(">I", frame, 50)[0]
+        return frames * samples_per_frame / sample_rate
+
+    return _scan_mp3_frames(f, audio_start + position, file_size)
+
+
+def _scan_mp3_frames(f: BinaryIO, start: int, file_size: int) -> Optional[float]:
+    """Sum frame durations by hopping between frame headers.
+
+    Only the 4 header bytes of each frame are inspected; the file is memory
+    mapped so the payload is never copied.
+    """
+    if file_size <= start:
+        return None
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        end = file_size - 128 if data[file_size - 128:file_size - 125] == b"TAG" else file_size
+        offset = start
+        seconds = 0.0
+        while offset + 4 <= end:
+            parsed = parse_mp3_frame_header(data[offset:offset + 4])
+            if parsed is None:
+                # Resynchronize on the next frame sync
+                next_sync = data.find(b"\xff", offset + 1, end)
+                if next_sync < 0:
+                    break
+                offset = next_sync
+                continue
+            frame_length, samples_per_frame, sample_rate, _, _ = parsed
+            seconds += samples_per_frame / sample_rate
+            offset += frame_length
+
+    return seconds if seconds > 0 else None
+
+
+@register_probe("flac")
+def probe_flac(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Duration from the FLAC STREAMINFO block.
+
+    Args:
+        f: Open file
+        file_size: File size in bytes
+
+    Returns:
+        Duration in seconds or None
+    """
+    header = f.read(4 + 4 + 18)
+    if len(header) < 26 or header[:4] != b"fLaC" or (header[4] & 0x7F) != 0:
+        return None
+
+    # Bytes 10-17 of STREAMINFO: 20-bit rate, 3-bit channels, 5-bit bps, 36-bit total samples
+    packed = int.from_bytes(header[8 + 10:8 + 18], "big")
+    sample_rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if sample_rate == 0 or total_samples == 0:
+        return None
+    return total_samples / sample_rate
+
+
+# Size of the tail read when looking for the last Ogg page
+_OGG_TAIL_BYTES = 64 * 1024
+
+
+@register_probe("ogg")
+def probe_ogg(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Duration from the last Ogg page's granule position.
+
+    Supports Vorbis (granule in samples at the stream rate) and Opus
+    (granule at 48 kHz, minus pre-skip).
+
+    Args:
+        f: Open file
+        file_size: File size in bytes
+
+    Returns:
+        Duration in seconds or None
+    """
+    first_page = f.read(27 + 255 + 19)
+    if len(first_page) < 28 or first_page[:4] != b"OggS":
+        return None
+    segments = first_page[26]
+    packet = first_page[27 + segments:]
+
+    if packet[:7] == b"\x01vorbis" and len(packet) >= 16:
+        sample_rate = struct.unpack_from("<I", packet, 12)[0]
+        pre_skip = 0
+    elif packet[:8] == b"OpusHead" and len(packet) >= 12:
+        sample_rate = 48000
+        pre_skip = struct.unpack_from("<H", packet, 10)[0]
+    else:
+        return None
+
+    serial = first_page[14:18]
+    tail_start = max(0, file_size - _OGG_TAIL_BYTES)
+    f.seek(tail_start)
+    tail = f.read()
+
+    position = tail.rfind(b"OggS")
+    while position >= 0:
+        page = tail[position:position + 27]
+        # Granule of -1 marks pages where no packet ends; skip other streams too
+        if len(page) == 27 and page[14:18] == serial:
+            granule = struct.unpack_from("<q", page, 6)[0]
+            if granule >= 0:
+                return max(0, granule - pre_skip) / sample_rate
+        position = tail.rfind(b"OggS", 0, position)
+
+    return None
+
+
+def _iter_atoms(f: BinaryIO, start: int, end: int):
+    """Yield (type, body_offset, body_size) for MP4 atoms in a range."""
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        header = f.read(16)
+        if len(header) < 8:
+            return
+        size, kind = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if size == 1:
+            if len(header) < 16:
+                return
+            size = struct.unpack(">Q", header[8:16])[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return
+        yield kind, offset + header_size, size - header_size
+        offset += size
+
+
+def _read_media_header(f: BinaryIO, offset: int) -> Optional[float]:
+    """Parse an mvhd or mdhd body (same leading layout) into seconds."""
+    f.seek(offset)
+    version = f.read(1)
+    if not version:
+        return None
+    if version[0] == 1:
+        body = f.read(3 + 8 + 8 + 4 + 8)
+        if len(body) < 31:
+            return None
+        timescale, duration = struct.unpack_from(">IQ", body, 19)
+    else:
+        body = f.read(3 + 4 + 4 + 4 + 4)
+        if len(body) < 19:
+            return None
+        timescale, duration = struct.unpack_from(">II", body, 11)
+    if timescale == 0 or duration in (0, 0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+        return None
+    return duration / timescale
+
+
+@register_probe("mp4", "m4a")
+def probe_mp4(f: BinaryIO, file_size: int) -> Optional[float]:
+    """Duration from the moov/mvhd atom, falling back to a track's mdhd.
+
+    Atoms are walked by seeking over their bodies, so a large mdat before
+    moov is never read.
+
+    Args:
+        f: Open file
+        file_size: File size in bytes
+
+    Returns:
+        Duration in seconds or None
+    """
+    for kind, body, size in _iter_atoms(f, 0, file_size):
+        if kind != b"moov":
+            continue
+
+        track_durations = []
+        for child, child_body, child_size in _iter_atoms(f, body, body + size):
+            if child == b"mvhd":
+                duration = _read_media_header(f, child_body)
+                if duration is not None:
+                    return duration
+            elif child == b"trak":
+                for trak_child, trak_body, trak_size in _iter_atoms(f, child_body, child_body + child_size):
+                    if trak_child != b"mdia":
+                        continue
+                    for mdia_child, mdia_body, _ in _iter_atoms(f, trak_body, trak_body + trak_size):
+                        if mdia_child == b"mdhd":
+                            duration = _read_media_header(f, mdia_body)
+                            if duration is not None:
+                                track_durations.append(duration)
+
+        return max(track_durations) if track_durations else None
+
+    return None
@@ -0,0 +1,222 @@
+"""Content-addressed cache of transcription results."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..core.logging import get_logger
+from .metrics import METRICS
+
+logger = get_logger(__name__)
+
+# Request parameters that change the transcription result
+KEY_PARAMETERS = ("language", "temperature", "response_format")
+
+# Per-request fields that are not part of the cached result
+UNCACHED_FIELDS = ("processing_rtf",)
+
+# Expired disk entries are swept after this many writes
+_SWEEP_INTERVAL = 256
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's contents.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def make_cache_key(content_hash: str, model: str, parameters: Dict[str, Any]) -> str:
+    """Key identifying one transcription of one audio payload.
+
+    Args:
+        content_hash: SHA-256 of the uploaded audio bytes
+        model: Checkpoint that transcribes the audio
+        parameters: Request parameters
+
+    Returns:
+        Hex digest over the audio hash, model and result-affecting parameters
+    """
+    fields = [content_hash, model, *(repr(parameters.get(name)) for name in KEY_PARAMETERS)]
+    return hashlib.sha256("\0".join(fields).encode()).hexdigest()
+
+
+class ResultCache:
+    """Two-tier cache of transcription results keyed by make_cache_key().
+
+    Results are stored as JSON. The memory tier keeps the most recently
+    used entries within a byte budget; the optional disk tier keeps one
+    file per key and drops entries older than its TTL. Disk hits are
+    promoted to memory. Every lookup returns a fresh copy.
+    """
+
+    def __init__(self, max_bytes: int, disk_dir: str = "", disk_ttl_seconds: float = 0.0):
+        """Initialize result cache.
+
+        Args:
+            max_bytes: Memory tier budget in bytes of serialized results
+            disk_dir: Directory of the disk tier (empty disables it)
+            disk_ttl_seconds: Age after which disk entries expire (0 keeps them)
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_ttl_seconds = disk_ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._writes = 0
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def has_disk_tier(self) -> bool:
+        """Whether lookups may read files (so should run off the event loop)."""
+        return self.disk_dir is not None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self._memory_hits += 1
+
+        if data is None and self.disk_dir is not None:
+            data = self._read_disk(key)
+            if data is not None:
+                self._store_memory(key, data)
+                with self._lock:
+                    self._disk_hits += 1
+
+        if data is None:
+            with self._lock:
+                self._misses += 1
+            METRICS.cache_lookups.inc(1.0, "miss")
+            return None
+
+        METRICS.cache_lookups.inc(1.0, "hit")
+        return json.loads(data)
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result.
+
+        Args:
+            key: Cache key
+            result: Transcription result (per-request fields are dropped)
+        """
+        data = json.dumps({k: v for k, v in result.items() if k not in UNCACHED_FIELDS}).encode()
+        self._store_memory(key, data)
+        if self.disk_dir is not None:
+            self._write_disk(key, data)
+
+    def _store_memory(self, key: str, data: bytes) -> None:
+        """Insert into the memory tier, evicting least recently used entries over budget."""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def _path(self, key: str) -> Path:
+        """Disk tier file of a key."""
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _expired(self, mtime: float) -> bool:
+        """Whether a disk entry written at mtime has outlived the TTL."""
+        return self.disk_ttl_seconds > 0 and time.time() - mtime > self.disk_ttl_seconds
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """Read a disk entry, removing it if expired."""
+        path = self._path(key)
+        try:
+            if self._expired(path.stat().st_mtime):
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        """Write a disk entry atomically; failures only cost future hits."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning("Failed to write result cache entry", path=str(path), error=str(e))
+            return
+
+        with self._lock:
+            self._writes += 1
+            sweep = self._writes % _SWEEP_INTERVAL == 0
+        if sweep:
+            self.evict_expired()
+
+    def evict_expired(self) -> int:
+        """Remove expired disk entries.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.disk_dir is None or self.disk_ttl_seconds <= 0:
+            return 0
+
+        removed = 0
+        for path in self.disk_dir.glob("*/*.json"):
+            try:
+                if self._expired(path.stat().st_mtime):
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info("Expired result cache entries removed", removed=removed)
+        return removed
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get cache status.
+
+        Returns:
+            Dictionary with status information
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk_dir": str(self.disk_dir) if self.disk_dir is not None else None,
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+            }
@@ -0,0 +1,217 @@
+"""Scheduling policies for ordering queued transcription requests."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from queue import Queue
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+SCHEDULING_POLICIES = ("fifo", "sjf", "fair")
+
+
+class SchedulingPolicy:
+    """Base class for request ordering policies.
+
+    Requests are dictionaries carrying at least ``duration`` (validated audio
+    seconds), ``client_id`` and ``enqueued_at``. Policies are not thread-safe;
+    the owning queue serializes access.
+    """
+
+    def push(self, request: Dict[str, Any]) -> None:
+        """Add a request.
+
+        Args:
+            request: Request dictionary
+        """
+        raise NotImplementedError
+
+    def pop(self) -> Dict[str, Any]:
+        """Remove and return the next request to run.
+
+        Returns:
+            Request dictionary
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class FifoPolicy(SchedulingPolicy):
+    """First-in, first-out ordering."""
+
+    def __init__(self):
+        """Initialize FIFO policy."""
+        self._requests: Deque[Dict[str, Any]] = deque()
+
+    def push(self, request: Dict[str, Any]) -> None:
+        self._requests.append(request)
+
+    def pop(self) -> Dict[str, Any]:
+        return self._requests.popleft()
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+
+class ShortestJobFirstPolicy(SchedulingPolicy):
+    """Shortest audio duration first, with aging to prevent starvation.
+
+    A request waiting ``w`` seconds is treated as ``aging_rate * w`` seconds
+    shorter. Since aging applies to all queued requests equally, the effective
+    order is fixed at enqueue time by ``duration + aging_rate * enqueued_at``,
+    which keeps push/pop at O(log n).
+    """
+
+    def __init__(self, aging_rate: float = 10.0):
+        """Initialize shortest-job-first policy.
+
+        Args:
+            aging_rate: Audio seconds of priority gained per second waited
+        """
+        self.aging_rate = aging_rate
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._counter = itertools.count()
+
+    def push(self, request: Dict[str, Any]) -> None:
+        key = request.get("duration", 0.0) + self.aging_rate * request["enqueued_at"]
+        heapq.heappush(self._heap, (key, next(self._counter), request))
+
+    def pop(self) -> Dict[str, Any]:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class FairSharePolicy(SchedulingPolicy):
+    """Weighted fair share of audio seconds per client (API key).
+
+    Uses weighted fair queuing: each request gets a virtual finish tag of
+    ``max(virtual_time, client's last tag) + duration / weight`` and the
+    smallest tag runs next. Requests of one client stay FIFO.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, default_weight: float = 1.0):
+        """Initialize fair share policy.
+
+        Args:
+            weights: Weight per client ID (API key)
+            default_weight: Weight for clients not listed in weights
+        """
+        self.weights = weights or {}
+        self.default_weight = default_weight
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._counter = itertools.count()
+        self._virtual_time = 0.0
+        self._last_tag: Dict[Optional[str], float] = {}
+
+    def push(self, request: Dict[str, Any]) -> None:
+        client_id = request.get("client_id")
+        weight = self.weights.get(client_id, self.default_weight) if client_id else self.default_weight
+        start = max(self._virtual_time, self._last_tag.get(client_id, 0.0))
+        # Zero-length requests still advance the tag so one client cannot flood
+        tag = start + max(request.get("duration", 0.0), 1e-3) / weight
+        self._last_tag[client_id] = tag
+        heapq.heappush(self._heap, (tag, next(self._counter), request))
+
+    def pop(self) -> Dict[str, Any]:
+        tag, _, request = heapq.heappop(self._heap)
+        self._virtual_time = tag
+        if not self._heap:
+            # Idle reset keeps tags bounded and forgets past usage
+            self._virtual_time = 0.0
+            self._last_tag.clear()
+        return request
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def create_policy_factory(
+    name: str,
+    aging_rate: float = 10.0,
+    weights: Optional[Dict[str, float]] = None
+) -> Callable[[], SchedulingPolicy]:
+    """Create a factory building fresh policy instances for worker queues.
+
+    Args:
+        name: Policy name: fifo, sjf or fair
+        aging_rate: Aging rate for shortest-job-first
+        weights: Client weights for fair share
+
+    Returns:
+        Callable returning a new policy
+
+    Raises:
+        ValueError: If policy name is unknown
+    """
+    if name == "fifo":
+        return FifoPolicy
+    if name == "sjf":
+        return lambda: ShortestJobFirstPolicy(aging_rate)
+    if name == "fair":
+        return lambda: FairSharePolicy(weights)
+    raise ValueError(f"Unknown scheduling policy: {name}. Allowed: {', '.join(SCHEDULING_POLICIES)}")
+
+
+class SchedulingQueue(Queue):
+    """Thread-safe queue ordering requests with a scheduling policy.
+
+    Request dictionaries are ordered by the policy; any other item (such as
+    a worker stop sentinel) is returned only after all requests are drained.
+    """
+
+    def __init__(self, policy: Optional[SchedulingPolicy] = None):
+        """Initialize scheduling queue.
+
+        Args:
+            policy: Scheduling policy (defaults to FIFO)
+        """
+        self.policy = policy if policy is not None else FifoPolicy()
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._control: Deque[Any] = deque()
+
+    def _qsize(self) -> int:
+        return len(self.policy) + len(self._control)
+
+    def _put(self, item: Any) -> None:
+        if isinstance(item, dict):
+            item.setdefault("enqueued_at", time.monotonic())
+            self.policy.push(item)
+        else:
+            self._control.append(item)
+
+    def _get(self) -> Any:
+        if len(self.policy):
+            return self.policy.pop()
+        return self._control.popleft()
+
+
+class AsyncSchedulingQueue(asyncio.Queue):
+    """Bounded asyncio queue ordering requests with a scheduling policy."""
+
+    def __init__(self, maxsize: int = 0, policy: Optional[SchedulingPolicy] = None):
+        """Initialize async scheduling queue.
+
+        Args:
+            maxsize: Maximum queued requests (0 for unbounded)
+            policy: Scheduling policy (defaults to FIFO)
+        """
+        self.policy = policy if policy is not None else FifoPolicy()
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        # asyncio.Queue sizes itself via len(self._queue)
+        self._queue = self.policy
+
+    def _put(self, item: Dict[str, Any]) -> None:
+        item.setdefault("enqueued_at", time.monotonic())
+        self.policy.push(item)
+
+    def _get(self) -> Dict[str, Any]:
+        return self.policy.pop()
@@ -1,13 +1,22 @@
 """Transcription service for audio transcription."""
 
+import asyncio
+import copy
+import hashlib
 import tempfile
+import time
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
 
-from mlx_whisper.whisper import Whisper
-
-from ..core.exceptions import TranscriptionError
+from ..core.exceptions import TranscribeError, TranscriptionError
 from ..core.logging import get_logger
+from .decoding import PreparedAudio
+from .inference import transcribe_in_process
+from .metrics import METRICS, RealtimeFactorTracker
+from .model_host import ModelHostClient
+from .result_cache import ResultCache, hash_file, make_cache_key
+from .workers import AsyncWorkerPool, WorkerPool
 
 logger = get_logger(__name__)
 
@@ -15,30 +24,67 @@ logger = get_logger(__name__)
 class TranscriptionService:
     """Service for handling audio transcription requests."""
 
-    def __init__(self, validator: Any, model_manager: Any):
+    def __init__(
+        self,
+        validator: Any,
+        model_manager: Any,
+        worker_pool: Optional[Union[WorkerPool, AsyncWorkerPool]] = None,
+        process_executor: Optional[Executor] = None,
+        model_registry: Optional[Any] = None,
+        model_host: Optional[ModelHostClient] = None,
+        rtf_tracker: Optional[RealtimeFactorTracker] = None,
+        result_cache: Optional[ResultCache] = None
+    ):
         """Initialize transcription service.
 
         Args:
             validator: File validator instance
             model_manager: Model manager instance
+            worker_pool: Worker pool scheduling all inference (defaults to a
+                single started worker)
+            process_executor: Optional process pool that worker threads
+                forward inference to
+            model_registry: Optional registry serving the model named in
+                each request's parameters (model_manager is used otherwise)
+            model_host: Optional client of a separate model host process;
+                when set, inference runs there instead of in this process
+            rtf_tracker: Rolling real-time factor per model (defaults to a
+                100 request window)
+            result_cache: Optional cache of results by audio content and
+                parameters, consulted before validation
         """
         self.validator = validator
         self.model_manager = model_manager
+        self.worker_pool = worker_pool
+        if self.worker_pool is None:
+            self.worker_pool = WorkerPool(1, 10, model_manager)
+            self.worker_pool.start()
+        self.process_executor = process_executor
+        self.model_registry = model_registry
+        self.model_host = model_host
+        self.rtf_tracker = rtf_tracker or RealtimeFactorTracker()
+        self.result_cache = result_cache
+        # Computations by request key; identical concurrent requests await the same task
+        self._pending: Dict[str, asyncio.Task] = {}
+        # Requests between arrival and response, including validation and queueing
+        self.in_flight_requests = 0
 
     async def transcribe(
         self,
         audio_data: bytes,
         filename: str,
         parameters: Dict[str, Any],
-        request_id: str
+        request_id: str,
+        client_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Transcribe audio data.
+        """Transcribe in-memory audio data.
 
         Args:
             audio_data: Raw audio data
             filename: Original filename
             parameters: Transcription parameters
             request_id: Request ID for tracking
+            client_id: Client identity (API key) used for fair-share scheduling
 
         Returns:
             Transcription result
@@ -46,13 +92,6 @@ class TranscriptionService:
         Raises:
             TranscriptionError: If transcription fails
         """
-        logger.info(
-            "Starting transcription request",
-            filename=filename,
-            size_bytes=len(audio_data),
-            request_id=request_id
-        )
-
         # Create temporary file
         temp_path = None
         try:
@@ -60,42 +99,111 @@ class TranscriptionService:
                 tmp.write(audio_data)
                 temp_path = tmp.name
 
-            # Validate file
-            logger.debug("Validating file", request_id=request_id)
-            format, duration = self.validator.validate_file(temp_path, len(audio_data))
-            logger.debug(
-                "File validated",
-                format=format,
-                duration=duration,
-                request_id=request_id
+            content_hash = hashlib.sha256(audio_data).hexdigest()
+            return await self.transcribe_file(
+                temp_path,
+                len(audio_data),
+                filename,
+                parameters,
+                request_id,
+                client_id,
+                content_hash
             )
 
-            # Get model
-            logger.debug("Loading model", request_id=request_id)
-            model: Any = self.model_manager.get_model()
+        finally:
+            # Cleanup temporary file
+            if temp_path and Path(temp_path).exists():
+                try:
+                    Path(temp_path).unlink()
+                    logger.debug("Temporary file cleaned up", request_id=request_id)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to cleanup temporary file",
+                        file_path=temp_path,
+                        error=str(e),
+                        request_id=request_id
+                    )
 
-            # Run transcription
-            logger.info("Running transcription", request_id=request_id)
-            result = model.transcribe(
-                temp_path,
-                path_or_hf_repo=self.model_manager.get_model_name(),
-                fp16=True,
-                #language=parameters.get("language"),
-                #response_format=parameters.get("response_format", "json"),
-                #temperature=parameters.get("temperature", 0.0)
-            )
+    async def transcribe_file(
+        self,
+        audio_path: str,
+        file_size: int,
+        filename: str,
+        parameters: Dict[str, Any],
+        request_id: str,
+        client_id: Optional[str] = None,
+        content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Transcribe audio already stored on disk.
 
-            # Add duration from validation
-            if isinstance(result, dict) and "duration" not in result:
-                result["duration"] = duration
+        Args:
+            audio_path: Path to audio file (owned by the caller)
+            file_size: File size in bytes
+            filename: Original filename
+            parameters: Transcription parameters
+            request_id: Request ID for tracking
+            client_id: Client identity (API key) used for fair-share scheduling
+            content_hash: SHA-256 of the file if already computed (it is
+                hashed here otherwise)
 
-            logger.info(
-                "Transcription completed",
-                text_length=len(result.get("text", "")),
-                request_id=request_id
-            )
+        Returns:
+            Transcription result
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        logger.info(
+            "Starting transcription request",
+            filename=filename,
+            size_bytes=file_size,
+            request_id=request_id
+        )
+
+        # Only touched on the event loop, so no lock is needed
+        self.in_flight_requests += 1
+        coalesced = False
+        try:
+            # Reject unknown models before spending time on the audio
+            checkpoint = None
+            if self.model_registry is not None:
+                checkpoint = self.model_registry.resolve(parameters.get("model"), request_id)
+
+            if content_hash is None:
+                content_hash = await asyncio.to_thread(hash_file, audio_path)
+            key = make_cache_key(content_hash, checkpoint or self.model_manager.get_model_name(), parameters)
+
+            # Identical audio and parameters are served from the cache without validation or inference
+            if self.result_cache is not None:
+                cached = await self._cache_get(key)
+                if cached is not None:
+                    logger.info("Transcription served from cache", request_id=request_id)
+                    return cached
+
+            # Identical requests already running share that computation and its worker slot
+            task = self._pending.get(key)
+            if task is None:
+                task = asyncio.create_task(
+                    self._transcribe_once(audio_path, file_size, parameters, request_id, client_id, checkpoint, key)
+                )
+                self._pending[key] = task
+                task.add_done_callback(lambda done: self._finish_pending(key, done))
+            else:
+                coalesced = True
+                logger.info("Coalesced with in-flight transcription", request_id=request_id)
 
-            return result
+            # Shielded so one caller going away does not cancel the others' result
+            result = await asyncio.shield(task)
+            return copy.deepcopy(result) if coalesced else result
+
+        except TranscribeError as e:
+            # Validation and admission errors keep their own status codes
+            if coalesced:
+                e = copy.copy(e)
+                e.request_id = request_id
+                raise e
+            if e.request_id is None:
+                e.request_id = request_id
+            raise
 
         except Exception as e:
             logger.error(
@@ -107,15 +215,206 @@ class TranscriptionService:
             raise TranscriptionError(str(e), request_id=request_id)
 
         finally:
-            # Cleanup temporary file
-            if temp_path and Path(temp_path).exists():
-                try:
-                    Path(temp_path).unlink()
-                    logger.debug("Temporary file cleaned up", request_id=request_id)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to cleanup temporary file",
-                        file_path=temp_path,
-                        error=str(e),
-                        request_id=request_id
-                    )
+            self.in_flight_requests -= 1
+
+    async def _transcribe_once(
+        self,
+        audio_path: str,
+        file_size: int,
+        parameters: Dict[str, Any],
+        request_id: str,
+        client_id: Optional[str],
+        checkpoint: Optional[str],
+        key: str
+    ) -> Dict[str, Any]:
+        """Validate, decode and transcribe one file, caching the result.
+
+        Args:
+            audio_path: Path to audio file
+            file_size: File size in bytes
+            parameters: Transcription parameters
+            request_id: ID of the request that started the computation
+            client_id: Client identity used for fair-share scheduling
+            checkpoint: Registry checkpoint (None for model_manager)
+            key: Request key from make_cache_key()
+
+        Returns:
+            Transcription result
+        """
+        # Validate and decode in one pass (CPU bound, so keep it off the event loop)
+        logger.debug("Preparing audio", request_id=request_id)
+        with METRICS.time_stage("validation"):
+            audio = await asyncio.to_thread(
+                self.validator.prepare_file, audio_path, file_size
+            )
+        logger.debug(
+            "Audio prepared",
+            format=audio.format,
+            duration=audio.duration,
+            request_id=request_id
+        )
+
+        # Run transcription on the inference executor
+        logger.info("Running transcription", request_id=request_id)
+        result = await self._run_inference(audio, request_id, client_id, checkpoint)
+
+        # Add exact duration from the decoded samples
+        if isinstance(result, dict) and "duration" not in result:
+            result["duration"] = audio.duration
+
+        if self.result_cache is not None:
+            await self._cache_put(key, result)
+
+        logger.info(
+            "Transcription completed",
+            text_length=len(result.get("text", "")),
+            request_id=request_id
+        )
+
+        return result
+
+    def _finish_pending(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished computation.
+
+        Args:
+            key: Request key
+            task: Finished computation
+        """
+        self._pending.pop(key, None)
+        # Retrieve the exception so it is not reported as unhandled when every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    async def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result, reading the disk tier off the event loop.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        if self.result_cache.has_disk_tier:
+            return await asyncio.to_thread(self.result_cache.get, key)
+        return self.result_cache.get(key)
+
+    async def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result, writing the disk tier off the event loop.
+
+        Args:
+            key: Cache key
+            result: Transcription result
+        """
+        if self.result_cache.has_disk_tier:
+            await asyncio.to_thread(self.result_cache.put, key, result)
+        else:
+            self.result_cache.put(key, result)
+
+    async def _run_inference(
+        self,
+        audio: PreparedAudio,
+        request_id: str,
+        client_id: Optional[str] = None,
+        checkpoint: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run blocking model inference on the worker pool.
+
+        The PCM decoded during validation is handed straight to the model,
+        so no backend decodes the file a second time.
+
+        Args:
+            audio: Prepared audio; its duration is used by the scheduling policy
+            request_id: Request ID for tracking
+            client_id: Client identity, used by the scheduling policy
+            checkpoint: Registry checkpoint to transcribe with (None for model_manager)
+
+        Returns:
+            Transcription result
+
+        Raises:
+            ServerBusyError: If the worker pool is at capacity
+        """
+        options: Dict[str, Any] = {
+            #"language": parameters.get("language"),
+            #"temperature": parameters.get("temperature", 0.0)
+        }
+
+        if self.model_host is not None:
+            # The host owns the models and adds their dtype options itself
+            def task() -> Dict[str, Any]:
+                return self.model_host.transcribe(audio.samples, checkpoint, options, request_id, client_id)
+
+            return await self._submit(task, audio, checkpoint or self.model_manager.get_model_name(),
+                                      request_id, client_id)
+
+        model_manager = self.model_manager
+        if checkpoint is not None:
+            # May download the checkpoint on first use
+            model_manager = await asyncio.to_thread(self.model_registry.get_manager, checkpoint)
+        options.update(model_manager.get_transcribe_options())
+
+        if self.process_executor is not None:
+            model_name = model_manager.get_model_name()
+
+            # Worker processes hold their own model; the PCM array is pickled across
+            def task() -> Dict[str, Any]:
+                return self.process_executor.submit(
+                    transcribe_in_process, audio.samples, model_name, options
+                ).result()
+        else:
+            # The model is loaded on first use on the worker thread, not the event loop
+            def task() -> Dict[str, Any]:
+                if checkpoint is not None:
+                    # Loads the model if needed and keeps it from being evicted meanwhile
+                    return self.model_registry.transcribe(checkpoint, audio.samples, **options)
+                return model_manager.transcribe(audio.samples, **options)
+
+        return await self._submit(task, audio, model_manager.get_model_name(), request_id, client_id)
+
+    async def _submit(
+        self,
+        task: Callable[[], Dict[str, Any]],
+        audio: PreparedAudio,
+        model_name: str,
+        request_id: str,
+        client_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Run an inference task on the worker pool, recording its queue wait and run time.
+
+        The request's real-time factor (audio seconds per inference second,
+        queue wait excluded) is added to the result as processing_rtf.
+
+        Args:
+            task: Blocking inference callable
+            audio: Prepared audio the task transcribes
+            model_name: Model the task runs, for per-model throughput
+            request_id: Request ID for tracking
+            client_id: Client identity, used by the scheduling policy
+
+        Returns:
+            Transcription result
+        """
+        submitted = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        def timed_task() -> Dict[str, Any]:
+            started = time.perf_counter()
+            METRICS.observe_stage("queue_wait", started - submitted)
+            try:
+                return task()
+            finally:
+                timings["inference"] = time.perf_counter() - started
+
+        result = await self.worker_pool.run(timed_task, request_id, audio.duration, client_id)
+        METRICS.observe_stage("inference", timings["inference"])
+        METRICS.record_transcription(audio.duration, timings["inference"])
+        rtf = self.rtf_tracker.record(model_name, audio.duration, timings["inference"])
+        if isinstance(result, dict) and rtf is not None:
+            result["processing_rtf"] = round(rtf, 3)
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and any inference processes."""
+        self.worker_pool.stop()
+        if self.process_executor is not None:
+            self.process_executor.shutdown(wait=False, cancel_futures=True)
@@ -2,10 +2,13 @@
 
 import mimetypes
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..core.exceptions import CorruptedAudioFileError, FileTooLargeError, FileTooLongError, InvalidFileFormatError
 from ..core.logging import get_logger
+from .decoding import PreparedAudio, decode_audio
+from .metrics import METRICS
+from .probing import probe_duration
 
 logger = get_logger(__name__)
 
@@ -92,6 +95,61 @@ class AudioValidator:
 
         return format, duration
 
+    def prepare_file(self, file_path: str, file_size: int) -> PreparedAudio:
+        """Validate and decode an audio file in a single pass.
+
+        The payload is read and decoded once; format detection and the
+        header check reuse the in-memory bytes, and the duration limit is
+        enforced on the exact decoded sample count. Container headers are
+        still probed first so over-long files are rejected without decoding.
+
+        Args:
+            file_path: Path to the file
+            file_size: File size in bytes
+
+        Returns:
+            Prepared audio holding format, exact duration and 16 kHz PCM
+
+        Raises:
+            FileTooLargeError: If file exceeds size limit
+            InvalidFileFormatError: If file format is not supported
+            CorruptedAudioFileError: If file is corrupted or cannot be decoded
+            FileTooLongError: If audio duration exceeds limit
+        """
+        self._validate_file_size(file_size)
+
+        try:
+            data = Path(file_path).read_bytes()
+        except OSError as e:
+            raise CorruptedAudioFileError(f"Unable to read file: {str(e)}")
+
+        format = self._detect_format(file_path, data[:12])
+        logger.debug("Format detected", file_path=file_path, format=format)
+
+        if format not in self.allowed_formats:
+            raise InvalidFileFormatError(format, self.allowed_formats)
+
+        self._check_header(data[:1024], format)
+
+        # Reject files whose headers already exceed the limit before decoding them
+        with METRICS.time_stage("probe"):
+            header_duration = probe_duration(file_path, format)
+        if header_duration is not None:
+            self._validate_duration(header_duration)
+
+        try:
+            with METRICS.time_stage("audio_decode"):
+                samples = decode_audio(data, format)
+        except RuntimeError as e:
+            raise CorruptedAudioFileError(f"Unable to decode audio: {str(e)}")
+
+        audio = PreparedAudio(format, samples, file_path)
+        logger.debug("Audio decoded", file_path=file_path, duration=audio.duration)
+
+        self._validate_duration(audio.duration)
+
+        return audio
+
     def _validate_file_size(self, file_size: int) -> None:
         """Validate file size.
 
@@ -104,11 +162,12 @@ class AudioValidator:
         if file_size > self.max_file_size:
             raise FileTooLargeError(file_size, self.max_file_size)
 
-    def _detect_format(self, file_path: str) -> str:
+    def _detect_format(self, file_path: str, header: Optional[bytes] = None) -> str:
         """Detect audio format from file.
 
         Args:
             file_path: Path to the file
+            header: Leading file bytes, if already read
 
         Returns:
             Detected format (e.g., 'mp3', 'wav')
@@ -129,25 +188,27 @@ class AudioValidator:
                 return format_from_mime
 
         # Try by magic number
-        format_from_magic = self._detect_by_magic_number(file_path)
+        format_from_magic = self._detect_by_magic_number(file_path, header)
         if format_from_magic and format_from_magic in self.allowed_formats:
             return format_from_magic
 
         raise InvalidFileFormatError("unknown", self.allowed_formats)
 
-    def _detect_by_magic_number(self, file_path: str) -> str | None:
+    def _detect_by_magic_number(self, file_path: str, header: Optional[bytes] = None) -> str | None:
         """Detect format by reading magic number.
 
         Args:
             file_path: Path to the file
+            header: Leading file bytes, if already read
 
         Returns:
             Detected format or None if not detected
         """
         try:
-            with open(file_path, "rb") as f:
-                # Read first 12 bytes for magic number
-                header = f.read(12)
+            if header is None:
+                with open(file_path, "rb") as f:
+                    # Read first 12 bytes for magic number
+                    header = f.read(12)
 
             # Check magic numbers
             for magic, format in self.MAGIC_NUMBERS.items():
@@ -175,32 +236,7 @@ class AudioValidator:
                 # Read a small chunk to verify file is readable
                 chunk = f.read(1024)
 
-                if not chunk:
-                    raise CorruptedAudioFileError("File is empty")
-
-                # Format-specific validation
-                if format == "mp3":
-                    # Check for valid MP3 frame
-                    if not (chunk.startswith(b"ID3") or
-                            chunk.startswith(b"\xff\xfb") or
-                            chunk.startswith(b"\xff\xf3")):
-                        # Could still be a valid MP3, just not detected
-                        pass
-
-                elif format == "wav":
-                    # Check RIFF header
-                    if not chunk.startswith(b"RIFF"):
-                        raise CorruptedAudioFileError("Invalid WAV file header")
-
-                elif format == "mp4" or format == "m4a":
-                    # Check for MP4/M4A header
-                    if not (b"ftyp" in chunk):
-                        raise CorruptedAudioFileError("Invalid MP4/M4A file header")
-
-                elif format == "webm":
-                    # Check for WebM header
-                    if not (b"WEBm" in chunk or b"\x1a\x45\xdf\xa3" in chunk):
-                        raise CorruptedAudioFileError("Invalid WebM file header")
+            self._check_header(chunk, format)
 
         except CorruptedAudioFileError:
             raise
@@ -208,6 +244,43 @@ class AudioValidator:
             logger.error("Failed to validate file integrity", file_path=file_path, format=format, error=str(e))
             raise CorruptedAudioFileError(f"Unable to read file: {str(e)}")
 
+    def _check_header(self, chunk: bytes, format: str) -> None:
+        """Check the leading bytes of a file against its format.
+
+        Args:
+            chunk: Up to the first 1 KB of the file
+            format: Detected file format
+
+        Raises:
+            CorruptedAudioFileError: If the header does not match the format
+        """
+        if not chunk:
+            raise CorruptedAudioFileError("File is empty")
+
+        # Format-specific validation
+        if format == "mp3":
+            # Check for valid MP3 frame
+            if not (chunk.startswith(b"ID3") or
+                    chunk.startswith(b"\xff\xfb") or
+                    chunk.startswith(b"\xff\xf3")):
+                # Could still be a valid MP3, just not detected
+                pass
+
+        elif format == "wav":
+            # Check RIFF header
+            if not chunk.startswith(b"RIFF"):
+                raise CorruptedAudioFileError("Invalid WAV file header")
+
+        elif format == "mp4" or format == "m4a":
+            # Check for MP4/M4A header
+            if not (b"ftyp" in chunk):
+                raise CorruptedAudioFileError("Invalid MP4/M4A file header")
+
+        elif format == "webm":
+            # Check for WebM header
+            if not (b"WEBm" in chunk or b"\x1a\x45\xdf\xa3" in chunk):
+                raise CorruptedAudioFileError("Invalid WebM file header")
+
     def _get_duration(self, file_path: str, format: str) -> float:
         """Get audio duration in seconds.
 
@@ -219,11 +292,15 @@ class AudioValidator:
             Duration in seconds
 
         Note:
-            For now, this returns a placeholder. In a real implementation,
-            you would use a library like pydub or librosa to get the actual duration.
-            For simplicity and to avoid heavy dependencies, we'll use a simple approach.
+            Container headers are parsed in-process first (see probing.py).
+            ffprobe is only forked for formats or files the probes cannot
+            handle, and the size-based estimate is the last resort.
         """
-        # Simple approach: try to use ffprobe if available
+        duration = probe_duration(file_path, format)
+        if duration is not None:
+            return duration
+
+        # Fall back to ffprobe if available
         try:
             import subprocess
 
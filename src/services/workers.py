@@ -2,30 +2,35 @@
 
 import asyncio
 import threading
-from queue import Queue, Empty
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, Optional
 
 from ..core.exceptions import ServerBusyError
 from ..core.logging import get_logger
+from .scheduling import AsyncSchedulingQueue, FifoPolicy, SchedulingPolicy, SchedulingQueue
 
 logger = get_logger(__name__)
 
+# Queued after pending work to make a worker exit once the queue is drained
+_STOP = object()
+
 
 class Worker:
     """Single worker for handling transcription requests."""
 
-    def __init__(self, worker_id: int, model_manager: Any):
+    def __init__(self, worker_id: int, model_manager: Any, policy: Optional[SchedulingPolicy] = None):
         """Initialize worker.
 
         Args:
             worker_id: Unique worker ID
             model_manager: Model manager instance
+            policy: Scheduling policy ordering the worker queue (defaults to FIFO)
         """
         self.worker_id = worker_id
         self.model_manager = model_manager
         self.running = False
         self.thread: Optional[threading.Thread] = None
-        self.queue: Queue = Queue()
+        self.queue: SchedulingQueue = SchedulingQueue(policy)
         self.current_request: Optional[Dict[str, Any]] = None
 
     def start(self) -> None:
@@ -38,30 +43,37 @@ class Worker:
         self.thread.start()
         logger.info("Worker started", worker_id=self.worker_id)
 
-    def stop(self) -> None:
-        """Stop the worker thread."""
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker thread after draining queued requests.
+
+        Args:
+            timeout: Maximum seconds to wait for the drain (None waits until done)
+        """
         if not self.running:
             return
 
         self.running = False
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=5)
+        self.queue.put(_STOP)
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
         logger.info("Worker stopped", worker_id=self.worker_id)
 
     def _run(self) -> None:
-        """Main worker loop."""
-        while self.running:
-            try:
-                # Get request from queue (with timeout)
-                request = self.queue.get(timeout=1)
-                self.current_request = request
+        """Main worker loop.
+
+        Blocks on the queue until work or the stop sentinel arrives, so idle
+        workers never wake up and new requests start immediately.
+        """
+        while True:
+            request = self.queue.get()
+            if request is _STOP:
+                self.queue.task_done()
+                break
 
+            self.current_request = request
+            try:
                 # Process request
                 self._process_request(request)
-
-            except Empty:
-                # No requests, continue
-                continue
             except Exception as e:
                 logger.error(
                     "Worker error",
@@ -78,11 +90,22 @@ class Worker:
 
         Args:
             request: Request dictionary containing:
-                - audio_path: Path to audio file
-                - callback: Callback function to call with result
+                - task: Callable running the inference
+                - future: Future receiving the task result or exception
                 - request_id: Request ID for logging
         """
         request_id = request.get("request_id", "unknown")
+        future: Future = request["future"]
+
+        # Skip requests whose caller went away while queued
+        if not future.set_running_or_notify_cancel():
+            logger.info(
+                "Request cancelled before processing",
+                worker_id=self.worker_id,
+                request_id=request_id
+            )
+            return
+
         logger.info(
             "Worker processing request",
             worker_id=self.worker_id,
@@ -90,32 +113,17 @@ class Worker:
         )
 
         try:
-            # Get model
-            model = self.model_manager.get_model()
-
-            # Run transcription
-            # Note: This would call the actual transcription service
-            result = {
-                "status": "success",
-                "text": "Transcription result",
-                "worker_id": self.worker_id
-            }
-
-            # Call callback with result
-            if "callback" in request:
-                request["callback"](result)
-
-        except Exception as e:
+            result = request["task"]()
+        except BaseException as e:
             logger.error(
                 "Request processing failed",
                 worker_id=self.worker_id,
                 request_id=request_id,
                 error=str(e)
             )
-
-            # Call callback with error
-            if "callback" in request:
-                request["callback"]({"status": "error", "error": str(e)})
+            future.set_exception(e)
+        else:
+            future.set_result(result)
 
     def submit(self, request: Dict[str, Any]) -> None:
         """Submit a request to the worker queue.
@@ -152,7 +160,8 @@ class WorkerPool:
         self,
         num_workers: int,
         max_concurrent: int,
-        model_manager: Any
+        model_manager: Any,
+        policy_factory: Optional[Callable[[], SchedulingPolicy]] = None
     ):
         """Initialize worker pool.
 
@@ -160,17 +169,20 @@ class WorkerPool:
             num_workers: Number of worker processes
             max_concurrent: Maximum concurrent requests across all workers
             model_manager: Model manager instance
+            policy_factory: Builds the scheduling policy for each worker queue
+                (defaults to FIFO)
         """
         self.num_workers = num_workers
         self.max_concurrent = max_concurrent
         self.model_manager = model_manager
+        self.policy_factory = policy_factory or FifoPolicy
         self.workers: list[Worker] = []
         self._active_requests = 0
         self._lock = threading.Lock()
 
         # Create workers
         for i in range(num_workers):
-            worker = Worker(i, model_manager)
+            worker = Worker(i, model_manager, self.policy_factory())
             self.workers.append(worker)
 
     def start(self) -> None:
@@ -179,24 +191,33 @@ class WorkerPool:
         for worker in self.workers:
             worker.start()
 
-    def stop(self) -> None:
-        """Stop all workers."""
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop all workers after draining queued requests.
+
+        Args:
+            timeout: Maximum seconds to wait per worker (None waits until done)
+        """
         logger.info("Stopping worker pool")
         for worker in self.workers:
-            worker.stop()
+            worker.stop(timeout)
 
     def submit(
         self,
-        audio_path: str,
-        callback: Callable[[Dict[str, Any]], None],
-        request_id: str
-    ) -> None:
+        task: Callable[[], Any],
+        request_id: str,
+        duration: float = 0.0,
+        client_id: Optional[str] = None
+    ) -> Future:
         """Submit a transcription request.
 
         Args:
-            audio_path: Path to audio file
-            callback: Callback function for result
+            task: Callable running the inference on a worker thread
             request_id: Request ID for tracking
+            duration: Validated audio duration in seconds, used for scheduling
+            client_id: Client identity (API key), used for fair share
+
+        Returns:
+            Future resolved with the task result
 
         Raises:
             ServerBusyError: If at capacity
@@ -206,37 +227,84 @@ class WorkerPool:
                 raise ServerBusyError(self.max_concurrent, request_id)
             self._active_requests += 1
 
+        future: Future = Future()
         request = {
-            "audio_path": audio_path,
-            "callback": lambda result: self._handle_result(result, request_id),
-            "request_id": request_id
+            "task": task,
+            "future": future,
+            "request_id": request_id,
+            "duration": duration,
+            "client_id": client_id
         }
 
         # Find least busy worker
         worker = self._get_least_busy_worker()
-        worker.submit(request)
+        try:
+            worker.submit(request)
+        except Exception:
+            self._release_slot()
+            raise
+
+        # Release the slot once the worker resolves (or the caller cancels) the future
+        future.add_done_callback(lambda f: self._handle_result(f, request_id))
 
         logger.info(
             "Request submitted",
             request_id=request_id,
             worker_id=worker.worker_id,
-            active_requests=self._active_requests
+            active_requests=self._active_requests,
+            queue_size=worker.queue_size()
         )
 
-    def _handle_result(self, result: Dict[str, Any], request_id: str) -> None:
-        """Handle request completion.
+        return future
+
+    async def run(
+        self,
+        task: Callable[[], Any],
+        request_id: str,
+        duration: float = 0.0,
+        client_id: Optional[str] = None
+    ) -> Any:
+        """Submit a request and await its result from the event loop.
 
         Args:
-            result: Request result
-            request_id: Request ID
+            task: Callable running the inference on a worker thread
+            request_id: Request ID for tracking
+            duration: Validated audio duration in seconds, used for scheduling
+            client_id: Client identity (API key), used for fair share
+
+        Returns:
+            Task result
+
+        Raises:
+            ServerBusyError: If at capacity
         """
+        return await asyncio.wrap_future(self.submit(task, request_id, duration, client_id))
+
+    def _release_slot(self) -> None:
+        """Release one concurrency slot."""
         with self._lock:
             self._active_requests = max(0, self._active_requests - 1)
 
+    def _handle_result(self, future: Future, request_id: str) -> None:
+        """Handle request completion.
+
+        Args:
+            future: Completed request future
+            request_id: Request ID
+        """
+        self._release_slot()
+
+        if future.cancelled():
+            status = "cancelled"
+        elif future.exception() is not None:
+            status = "error"
+        else:
+            status = "success"
+
         logger.info(
             "Request completed",
             request_id=request_id,
-            status=result.get("status"),
+            status=status,
             active_requests=self._active_requests
         )
 
@@ -265,6 +333,7 @@ class WorkerPool:
                 "num_workers": self.num_workers,
                 "max_concurrent": self.max_concurrent,
                 "active_requests": self._active_requests,
+                "queue_depth": sum(w.queue_size() for w in self.workers),
                 "workers": [
                     {
                         "worker_id": w.worker_id,
@@ -284,3 +353,174 @@ class WorkerPool:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.stop()
+
+
+class AsyncWorkerPool:
+    """Worker pool fed by a bounded asyncio queue.
+
+    Submission happens entirely on the event loop: callers await a slot in
+    the queue (backpressure when it is full) and then the result, without a
+    thread hop. Each worker is a coroutine that hands its task to a dedicated
+    inference thread. Must be started from within the running event loop.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        max_concurrent: int,
+        model_manager: Any,
+        queue_size: int = 0,
+        policy_factory: Optional[Callable[[], SchedulingPolicy]] = None
+    ):
+        """Initialize async worker pool.
+
+        Args:
+            num_workers: Number of workers (inference threads)
+            max_concurrent: Maximum concurrent requests across all workers
+            model_manager: Model manager instance
+            queue_size: Maximum queued requests (0 for unbounded)
+            policy_factory: Builds the scheduling policy for the shared queue
+                (defaults to FIFO)
+        """
+        self.num_workers = num_workers
+        self.max_concurrent = max_concurrent
+        self.model_manager = model_manager
+        self.queue_size = queue_size
+        self.policy_factory = policy_factory or FifoPolicy
+        self.running = False
+        self._active_requests = 0
+        self._busy: list[Optional[str]] = [None] * num_workers
+        self._queue: Optional[AsyncSchedulingQueue] = None
+        self._tasks: list[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self) -> None:
+        """Start the worker coroutines on the running event loop."""
+        if self.running:
+            return
+
+        loop = asyncio.get_running_loop()
+        logger.info("Starting async worker pool", num_workers=self.num_workers, queue_size=self.queue_size)
+        self._queue = AsyncSchedulingQueue(self.queue_size, self.policy_factory())
+        self._executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="inference")
+        self._tasks = [loop.create_task(self._run(i)) for i in range(self.num_workers)]
+        self.running = True
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers, cancelling requests that have not started.
+
+        Args:
+            timeout: Unused; running inference finishes on its thread
+        """
+        if not self.running:
+            return
+
+        logger.info("Stopping async worker pool")
+        self.running = False
+        for task in self._tasks:
+            task.cancel()
+        while not self._queue.empty():
+            self._queue.get_nowait()["future"].cancel()
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, worker_id: int) -> None:
+        """Worker coroutine: wait for a request and run it on the inference thread.
+
+        Args:
+            worker_id: Worker index
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            request = await self._queue.get()
+            future, request_id = request["future"], request["request_id"]
+            if future.cancelled():
+                continue
+
+            self._busy[worker_id] = request_id
+            logger.info("Worker processing request", worker_id=worker_id, request_id=request_id)
+            try:
+                result = await loop.run_in_executor(self._executor, request["task"])
+            except Exception as e:
+                logger.error(
+                    "Request processing failed",
+                    worker_id=worker_id,
+                    request_id=request_id,
+                    error=str(e)
+                )
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._busy[worker_id] = None
+
+    async def run(
+        self,
+        task: Callable[[], Any],
+        request_id: str,
+        duration: float = 0.0,
+        client_id: Optional[str] = None
+    ) -> Any:
+        """Submit a request and await its result.
+
+        Args:
+            task: Callable running the inference on a worker thread
+            request_id: Request ID for tracking
+            duration: Validated audio duration in seconds, used for scheduling
+            client_id: Client identity (API key), used for fair share
+
+        Returns:
+            Task result
+
+        Raises:
+            ServerBusyError: If at capacity
+            RuntimeError: If the pool is not running
+        """
+        if not self.running:
+            raise RuntimeError("Worker pool is not running")
+        if self._active_requests >= self.max_concurrent:
+            raise ServerBusyError(self.max_concurrent, request_id)
+        self._active_requests += 1
+
+        try:
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put({
+                "task": task,
+                "future": future,
+                "request_id": request_id,
+                "duration": duration,
+                "client_id": client_id
+            })
+            logger.info(
+                "Request submitted",
+                request_id=request_id,
+                active_requests=self._active_requests,
+                queue_size=self._queue.qsize()
+            )
+            return await future
+        finally:
+            self._active_requests -= 1
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get worker pool status.
+
+        Returns:
+            Dictionary with status information
+        """
+        queue_depth = self._queue.qsize() if self._queue is not None else 0
+        return {
+            "num_workers": self.num_workers,
+            "max_concurrent": self.max_concurrent,
+            "active_requests": self._active_requests,
+            "queue_depth": queue_depth,
+            "workers": [
+                {
+                    "worker_id": i,
+                    "busy": request_id is not None,
+                    "queue_size": 0,
+                    "running": self.running
+                }
+                for i, request_id in enumerate(self._busy)
+            ]
+        }
@@ -0,0 +1,81 @@
+"""Builders for small synthetic audio containers used in tests.
+
+The files carry valid container headers with silent or zeroed payloads,
+which is enough for format detection, duration probing and WAV decoding.
+"""
+
+import io
+import struct
+import wave
+
+import numpy as np
+
+
+def make_wav(seconds: float, sample_rate: int = 16000, channels: int = 1) -> bytes:
+    """16-bit PCM WAV of silence."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(np.zeros(int(seconds * sample_rate) * channels, "<i2").tobytes())
+    return buffer.getvalue()
+
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo, no padding: 417-byte frames
+_MP3_HEADER = b"\xff\xfb\x90\x00"
+_MP3_FRAME_LENGTH = 417
+_MP3_SAMPLES_PER_FRAME = 1152
+
+
+def make_mp3(seconds: float, xing: bool = False, id3: bool = True) -> bytes:
+    """CBR MP3 made of empty frames, optionally with a Xing header frame."""
+    frames = round(seconds * 44100 / _MP3_SAMPLES_PER_FRAME)
+    frame = _MP3_HEADER + b"\x00" * (_MP3_FRAME_LENGTH - 4)
+    parts = []
+    if id3:
+        parts.append(b"ID3\x04\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10)
+    if xing:
+        # Xing tag lives after the 32-byte stereo side info
+        body = bytearray(frame)
+        body[36:48] = b"Xing" + struct.pack(">II", 0x1, frames)
+        parts.append(bytes(body))
+    parts.append(frame * frames)
+    return b"".join(parts)
+
+
+def make_flac(seconds: float, sample_rate: int = 44100) -> bytes:
+    """FLAC stream with only a STREAMINFO block and zero padding."""
+    total_samples = int(seconds * sample_rate)
+    packed = (sample_rate << 44) | (1 << 41) | (15 << 36) | total_samples
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\x00" * 6 + packed.to_bytes(8, "big") + b"\x00" * 16
+    return b"fLaC" + bytes([0x80]) + len(streaminfo).to_bytes(3, "big") + streaminfo + b"\x00" * 1024
+
+
+def _ogg_page(header_type: int, granule: int, sequence: int, packet: bytes) -> bytes:
+    """Single-segment Ogg page (CRC left as zero)."""
+    return (b"OggS" + bytes([0, header_type]) + struct.pack("<qII", granule, 0x1234, sequence)
+            + b"\x00" * 4 + bytes([1, len(packet)]) + packet)
+
+
+def make_ogg_vorbis(seconds: float, sample_rate: int = 44100) -> bytes:
+    """Ogg Vorbis stream with an ID header page and a final page."""
+    id_header = (b"\x01vorbis" + struct.pack("<IBIiii", 0, 2, sample_rate, 0, 0, 0)
+                 + bytes([0xB8, 0x01]))
+    return (_ogg_page(0x02, 0, 0, id_header)
+            + _ogg_page(0x00, -1, 1, b"\x00" * 200) * 20
+            + _ogg_page(0x04, int(seconds * sample_rate), 2, b"\x00" * 100))
+
+
+def _atom(kind: bytes, body: bytes) -> bytes:
+    """MP4 atom with a 32-bit size."""
+    return struct.pack(">I", 8 + len(body)) + kind + body
+
+
+def make_m4a(seconds: float, timescale: int = 44100, mdat_size: int = 64 * 1024) -> bytes:
+    """M4A with ftyp, a zeroed mdat, then moov/mvhd at the end."""
+    mvhd = (b"\x00\x00\x00\x00" + struct.pack(">IIII", 0, 0, timescale, int(seconds * timescale))
+            + b"\x00" * 80)
+    return (_atom(b"ftyp", b"M4A \x00\x00\x00\x00M4A isom")
+            + _atom(b"mdat", b"\x00" * mdat_size)
+            + _atom(b"moov", _atom(b"mvhd", mvhd)))
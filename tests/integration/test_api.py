@@ -36,6 +36,9 @@ class TestTranscribeAPI:
         assert "workers" in data
         assert "model_loaded" in data
         assert "uptime_seconds" in data
+        assert "queue_depth" in data
+        assert "in_flight_requests" in data
+        assert data["peak_rss_bytes"] > 0
 
     def test_root_endpoint(self, client):
         """Test root endpoint."""
@@ -415,3 +418,50 @@ class TestConcurrentRequestHandling:
         assert "total" in data["workers"]
         assert "active" in data["workers"]
         assert "available" in data["workers"]
+
+
+class TestProcessingRTF:
+    """Test real-time factor reporting through the API."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Router-only app whose fake model returns immediately."""
+        import numpy as np
+        from unittest.mock import MagicMock
+        from fastapi import FastAPI
+
+        from src.api.dependencies import ServiceContainer
+        from src.api.routes import router
+        from src.core.config import AppConfig, TranscriptionConfig, config
+        from src.services.decoding import PreparedAudio
+        from src.services.transcription import TranscriptionService
+
+        monkeypatch.setattr(config, "_config", AppConfig(transcription=TranscriptionConfig(model="fake")))
+        validator = MagicMock()
+        validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(10 * 16000, np.float32))
+        model_manager = MagicMock()
+        model_manager.get_model_name.return_value = "fake"
+        model_manager.get_status.return_value = {"model_name": "fake", "loaded": True}
+        model_manager.transcribe.return_value = {"text": "hello", "segments": [{"id": 0, "text": "hello"}]}
+        service = TranscriptionService(validator, model_manager)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.state.services = ServiceContainer(validator, model_manager, service)
+        yield TestClient(app)
+        service.shutdown()
+
+    def test_rtf_header_verbose_body_and_status(self, client):
+        """Test the RTF header, the verbose_json field and the per-model rolling status."""
+        files = {"file": ("audio.wav", b"RIFF" + b"\x00" * 100, "audio/wav")}
+
+        plain = client.post("/v1/audio/transcriptions", files=files)
+        verbose = client.post("/v1/audio/transcriptions?response_format=verbose_json", files=files)
+        status = client.get("/status").json()
+
+        assert plain.status_code == 200
+        assert float(plain.headers["X-Processing-RTF"]) > 0
+        assert "processing_rtf" not in plain.json()
+        assert verbose.json()["processing_rtf"] == float(verbose.headers["X-Processing-RTF"])
+        assert verbose.json()["segments"] == [{"id": 0, "text": "hello"}]
+        assert status["realtime_factor"]["fake"]["window_requests"] == 2
@@ -0,0 +1,95 @@
+"""Integration tests proving inference does not block the event loop."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import numpy as np
+import pytest
+from fastapi import FastAPI
+
+from src.api.dependencies import ServiceContainer
+from src.api.routes import router
+from src.core.config import AppConfig, TranscriptionConfig, config
+from src.services.decoding import PreparedAudio
+from src.services.transcription import TranscriptionService
+
+
+class SlowModel:
+    """Fake model whose transcribe blocks like a long MLX decode."""
+
+    def __init__(self, max_seconds: float):
+        self.max_seconds = max_seconds
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def transcribe(self, audio_path, **kwargs):
+        self.started.set()
+        # Blocks for up to max_seconds unless released earlier by the test
+        self.release.wait(self.max_seconds)
+        return {"text": "slow result"}
+
+
+class TestEventLoopResponsiveness:
+    """Test that /health stays responsive during a long transcription."""
+
+    @pytest.fixture
+    def slow_model(self):
+        """Fake model simulating a 30 s transcription."""
+        model = SlowModel(max_seconds=30.0)
+        yield model
+        model.release.set()
+
+    @pytest.fixture
+    def app(self, monkeypatch, slow_model):
+        """Application wired with the slow fake model."""
+        monkeypatch.setattr(config, "_config", AppConfig(transcription=TranscriptionConfig(model="fake")))
+
+        validator = MagicMock()
+        validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(30 * 16000, np.float32))
+        model_manager = MagicMock()
+        model_manager.transcribe.side_effect = slow_model.transcribe
+        model_manager.get_status.return_value = {"model_name": "fake", "loaded": True}
+        service = TranscriptionService(validator, model_manager)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.state.services = ServiceContainer(validator, model_manager, service)
+        yield app
+        service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_health_latency_flat_during_transcription(self, app, slow_model):
+        """Health checks complete quickly while inference is running."""
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            async def health_latency() -> float:
+                start = time.perf_counter()
+                response = await client.get("/health")
+                assert response.status_code == 200
+                return time.perf_counter() - start
+
+            baseline = [await health_latency() for _ in range(5)]
+
+            transcription = asyncio.create_task(client.post(
+                "/v1/audio/transcriptions",
+                files={"file": ("audio.wav", b"RIFF" + b"\x00" * 100, "audio/wav")}
+            ))
+            while not slow_model.started.is_set():
+                await asyncio.sleep(0.01)
+
+            during = [await health_latency() for _ in range(20)]
+            assert not transcription.done()
+
+            slow_model.release.set()
+            response = await transcription
+
+        assert response.status_code == 200
+        assert response.json()["text"] == "slow result"
+
+        print(f"\nHealth latency baseline max: {max(baseline) * 1000:.1f}ms, "
+              f"during transcription max: {max(during) * 1000:.1f}ms")
+        # Flat latency: no health check waits on the blocked decode
+        assert max(during) < 0.5
@@ -0,0 +1,72 @@
+"""
+Encoder throughput versus batch size with a small random-weight Whisper.
+
+Four threads each encode a series of 30 s mel windows through an
+EncoderBatcher; the model is tiny so the benchmark runs on CPU.
+"""
+
+import threading
+import time
+
+import mlx.core as mx
+import numpy as np
+import pytest
+from mlx_whisper.audio import N_FRAMES
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+from src.mlx.batching import install_encoder_batching
+
+CALLERS = 4
+WINDOWS_PER_CALLER = 2
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=2,
+    n_vocab=51865, n_text_ctx=448, n_text_state=64, n_text_head=2, n_text_layer=2
+)
+
+
+def _run_callers(model, windows):
+    """Encode every caller's windows concurrently and return elapsed seconds."""
+    def caller(i):
+        for window in windows[i]:
+            mx.eval(model.encoder(window))
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(CALLERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+class TestEncoderBatching:
+    """Benchmark dynamic encoder batching."""
+
+    @pytest.mark.benchmark
+    def test_throughput_versus_batch_size(self):
+        """Windows/s for concurrent callers at increasing max batch sizes."""
+        model = Whisper(DIMS, mx.float32)
+        mx.eval(model.parameters())
+        original = model.encoder
+        rng = np.random.default_rng(0)
+        windows = [
+            [mx.array(rng.standard_normal((1, N_FRAMES, DIMS.n_mels), dtype=np.float32))
+             for _ in range(WINDOWS_PER_CALLER)]
+            for _ in range(CALLERS)
+        ]
+        total = CALLERS * WINDOWS_PER_CALLER
+
+        print(f"\n=== Encoder Throughput ({CALLERS} concurrent callers, {total} windows, CPU) ===")
+        for batch_size in (1, 2, 4):
+            batcher = install_encoder_batching(model, batch_size, 0.01)
+            try:
+                elapsed = _run_callers(model, windows)
+                status = batcher.get_status()
+            finally:
+                batcher.stop()
+                model.encoder = original
+
+            assert status["windows"] == total
+            print(f"max_batch_size={batch_size}: {total / elapsed:6.1f} windows/s, "
+                  f"avg batch {status['avg_batch_size']:.1f}")
@@ -0,0 +1,133 @@
+"""
+Memory and throughput of per-worker models versus one model host process.
+
+Simulates N HTTP worker processes transcribing concurrently. In the
+current topology every worker loads its own model; in the host topology
+the workers import the same server modules but forward decoded PCM over
+a Unix socket to a single model host process. Reports total RSS across
+all processes and aggregate requests per second.
+"""
+
+import dataclasses
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import mlx.core as mx
+import pytest
+from mlx.utils import tree_flatten
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+from src.core.config import AppConfig, TranscriptionConfig
+from src.host import run_model_host
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=256, n_audio_head=4, n_audio_layer=1,
+    n_vocab=51865, n_text_ctx=448, n_text_state=256, n_text_head=4, n_text_layer=1
+)
+
+REQUESTS_PER_WORKER = 2
+
+# Short greedy decode so the benchmark measures topology rather than decode length
+OPTIONS = {"language": "en", "temperature": 0.0, "sample_len": 16, "without_timestamps": True,
+           "condition_on_previous_text": False}
+
+WORKER = """
+import json, sys, time
+import numpy as np
+from src.api.dependencies import ServiceContainer  # what an HTTP worker imports
+mode, model_path, socket_path, requests, options = sys.argv[1:6]
+options = json.loads(options)
+audio = np.random.default_rng(0).standard_normal(5 * 16000).astype(np.float32) * 0.1
+if mode == "host":
+    from src.services.model_host import ModelHostClient
+    client = ModelHostClient(socket_path, timeout=120)
+    transcribe = lambda: client.transcribe(audio, None, options)
+else:
+    from src.mlx.model_manager import ModelManager
+    manager = ModelManager(model_path, False, dtype="float32")
+    manager.get_model()
+    transcribe = lambda: manager.transcribe(audio, **options)
+print("READY", flush=True)
+sys.stdin.readline()
+for _ in range(int(requests)):
+    transcribe()
+status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+print(json.dumps({"rss_mb": int(status["VmRSS"].split()[0]) / 1024}), flush=True)
+"""
+
+
+def _rss_mb(pid):
+    """Resident memory of a process in MB."""
+    with open(f"/proc/{pid}/status") as f:
+        status = dict(line.split(":", 1) for line in f)
+    return int(status["VmRSS"].split()[0]) / 1024
+
+
+def _run_workers(mode, model_path, socket_path, workers):
+    """Start workers, release them together and return (seconds, summed worker RSS MB)."""
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER, mode, str(model_path), str(socket_path),
+             str(REQUESTS_PER_WORKER), json.dumps(OPTIONS)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=os.getcwd()
+        )
+        for _ in range(workers)
+    ]
+    # Wait for model loads (or imports) so only request handling is timed
+    for proc in procs:
+        while proc.stdout.readline().strip() != "READY":
+            pass
+
+    start = time.perf_counter()
+    for proc in procs:
+        proc.stdin.write("go\n")
+        proc.stdin.flush()
+    reports = [json.loads(proc.communicate()[0].splitlines()[-1]) for proc in procs]
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(report["rss_mb"] for report in reports)
+
+
+class TestModelHost:
+    """Benchmark the model host topology."""
+
+    @pytest.mark.benchmark
+    def test_rss_and_throughput(self, tmp_path):
+        """Total RSS and requests/s for 2 and 4 workers, per-worker models vs one host."""
+        model = Whisper(DIMS, mx.float32)
+        (tmp_path / "config.json").write_text(json.dumps(dataclasses.asdict(DIMS)))
+        mx.save_safetensors(str(tmp_path / "weights.safetensors"), dict(tree_flatten(model.parameters())))
+        del model
+        socket_path = tmp_path / "host.sock"
+
+        cfg = AppConfig(transcription=TranscriptionConfig(
+            model=str(tmp_path),
+            use_modelscope=False,
+            dtype="float32",
+            model_host_socket=str(socket_path),
+            inference_workers=4,
+            model_warmup=False
+        ))
+        context = multiprocessing.get_context("spawn")
+        ready = context.Event()
+        host = context.Process(target=run_model_host, args=(cfg, ready))
+        host.start()
+        assert ready.wait(120)
+
+        try:
+            print(f"\nweights {(tmp_path / 'weights.safetensors').stat().st_size / 1e6:.0f} MB, "
+                  f"{REQUESTS_PER_WORKER} requests per worker")
+            print("topology    | workers | total RSS MB | req/s")
+            for workers in (2, 4):
+                elapsed, rss = _run_workers("per-worker", tmp_path, socket_path, workers)
+                print(f"per-worker  | {workers:7d} | {rss:12.0f} | {workers * REQUESTS_PER_WORKER / elapsed:5.2f}")
+
+                elapsed, rss = _run_workers("host", tmp_path, socket_path, workers)
+                rss += _rss_mb(host.pid)
+                print(f"model host  | {workers:7d} | {rss:12.0f} | {workers * REQUESTS_PER_WORKER / elapsed:5.2f}")
+        finally:
+            host.terminate()
+            host.join()
@@ -0,0 +1,71 @@
+"""
+Weight memory and latency per model dtype and quantization.
+
+A small random-weight Whisper model is prepared as float16, bfloat16 and
+float32, and as 8-bit and 4-bit quantized float16, then timed on one 30 s
+encoder window and a fixed-length greedy decode on CPU.
+"""
+
+import time
+
+import mlx.core as mx
+import pytest
+from mlx_whisper.decoding import DecodingOptions, decode
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+from src.mlx.model_manager import model_nbytes, prepare_model
+
+SAMPLE_LEN = 16
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=256, n_audio_head=4, n_audio_layer=2,
+    n_vocab=51865, n_text_ctx=448, n_text_state=256, n_text_head=4, n_text_layer=2
+)
+
+VARIANTS = [
+    ("float16", mx.float16, None),
+    ("bfloat16", mx.bfloat16, None),
+    ("float32", mx.float32, None),
+    ("float16 q8", mx.float16, 8),
+    ("float16 q4", mx.float16, 4),
+]
+
+
+class TestModelVariants:
+    """Benchmark model dtype and quantization options."""
+
+    @pytest.mark.benchmark
+    def test_memory_and_latency(self):
+        """Report parameter bytes, encoder latency and decode tokens/s per variant."""
+        print("\nvariant      | weights MB | encode ms | decode tok/s")
+        baseline = None
+        for name, dtype, bits in VARIANTS:
+            mx.random.seed(0)
+            model = prepare_model(Whisper(DIMS, dtype), dtype, quantize_bits=bits)
+            mx.eval(model.state)
+            fp16 = dtype == mx.float16
+            # Same activation dtype rule as ModelManager.get_transcribe_options
+            mel = mx.random.normal((1, 2 * DIMS.n_audio_ctx, DIMS.n_mels)).astype(
+                mx.float16 if fp16 else mx.float32
+            )
+            mx.eval(mel)
+
+            mx.eval(model.encoder(mel))
+            start = time.perf_counter()
+            features = model.encoder(mel)
+            mx.eval(features)
+            encode_ms = (time.perf_counter() - start) * 1000
+
+            options = DecodingOptions(language="en", sample_len=SAMPLE_LEN, without_timestamps=True,
+                                      suppress_tokens=[50257], fp16=fp16)
+            start = time.perf_counter()
+            result = decode(model, features, options)
+            elapsed = time.perf_counter() - start
+            tokens = len(result[0].tokens) + 1
+
+            nbytes = model_nbytes(model)
+            baseline = baseline or nbytes
+            print(f"{name:<12} | {nbytes / 1e6:10.1f} | {encode_ms:9.1f} | {tokens / elapsed:12.1f}")
+
+            if bits is not None:
+                assert nbytes < baseline
@@ -0,0 +1,97 @@
+"""
+Scheduling simulation for a mixed long/short workload.
+
+A fake model sleeps in proportion to audio duration, so queue order alone
+decides latency. Compares FIFO, shortest-job-first with aging and weighted
+fair share on the same arrival sequence.
+"""
+
+import statistics
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.scheduling import create_policy_factory
+from src.services.workers import WorkerPool
+
+# Wall seconds of fake inference per second of audio
+SECONDS_PER_AUDIO_SECOND = 0.0005
+
+
+def _workload():
+    """Mixed workload: a few 10-minute files among many 5-second voice notes."""
+    jobs = []
+    for i in range(44):
+        if i % 11 == 0:
+            jobs.append(("long", 600.0, "bulk"))
+        else:
+            jobs.append(("short", 5.0, "bulk" if i % 2 else "voice"))
+    return jobs
+
+
+def _simulate(policy_name):
+    """Run the workload through a single-worker pool and collect latencies."""
+    pool = WorkerPool(1, 100, MagicMock(), create_policy_factory(policy_name))
+    pool.start()
+
+    # Hold the worker so the whole burst is queued before scheduling starts
+    gate = threading.Event()
+    blocker = pool.submit(gate.wait, "gate")
+
+    submitted = []
+    for i, (kind, duration, client_id) in enumerate(_workload()):
+        start = time.perf_counter()
+        future = pool.submit(
+            lambda d=duration: time.sleep(d * SECONDS_PER_AUDIO_SECOND) or time.perf_counter(),
+            f"req-{i}",
+            duration,
+            client_id
+        )
+        submitted.append((kind, client_id, start, future))
+
+    gate.set()
+    blocker.result()
+    latencies = [
+        (kind, client_id, future.result(timeout=30) - start)
+        for kind, client_id, start, future in submitted
+    ]
+    pool.stop()
+
+    return latencies
+
+
+def _p(values, q):
+    """Percentile of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+class TestSchedulingSimulation:
+    """Compare scheduling policies on a mixed workload."""
+
+    @pytest.mark.benchmark
+    def test_policies_on_mixed_workload(self):
+        """Shortest-job-first cuts p50 without starving long files."""
+        results = {}
+        print(f"\n=== Scheduling Simulation (1 worker, 4 x 600s + 40 x 5s) ===")
+        for policy_name in ("fifo", "sjf", "fair"):
+            latencies = _simulate(policy_name)
+            overall = [l for _, _, l in latencies]
+            long_files = [l for kind, _, l in latencies if kind == "long"]
+            voice = [l for _, client_id, l in latencies if client_id == "voice"]
+            results[policy_name] = {
+                "p50": statistics.median(overall),
+                "p95": _p(overall, 0.95),
+                "long_max": max(long_files),
+                "voice_p50": statistics.median(voice),
+            }
+            r = results[policy_name]
+            print(f"{policy_name:>5}: p50={r['p50'] * 1000:.0f}ms p95={r['p95'] * 1000:.0f}ms "
+                  f"long max={r['long_max'] * 1000:.0f}ms voice-client p50={r['voice_p50'] * 1000:.0f}ms")
+
+        assert results["sjf"]["p50"] < results["fifo"]["p50"]
+        # Long files only wait for the short work that overtook them
+        assert results["sjf"]["long_max"] < results["fifo"]["long_max"] * 1.25
+        assert results["fair"]["voice_p50"] < results["fifo"]["voice_p50"]
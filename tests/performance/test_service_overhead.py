@@ -0,0 +1,74 @@
+"""
+Microbenchmark for per-request service construction overhead.
+
+Compares building AudioValidator/ModelManager/TranscriptionService on every
+request (previous behaviour) with resolving the shared instances through the
+FastAPI dependency created at startup.
+"""
+
+import sys
+import time
+import types
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.api.dependencies import ServiceContainer, get_transcription_service
+from src.core.config import AppConfig, TranscriptionConfig
+from src.mlx.model_manager import ModelManager
+from src.services.transcription import TranscriptionService
+from src.services.validation import AudioValidator
+
+# Simulated cost of a cached modelscope snapshot lookup (metadata round trip)
+SNAPSHOT_LOOKUP_SECONDS = 0.002
+
+
+class TestServiceOverhead:
+    """Benchmark per-request service overhead."""
+
+    @pytest.fixture
+    def cfg(self, monkeypatch):
+        """Configuration with a simulated modelscope snapshot lookup."""
+        def snapshot_download(model_id):
+            time.sleep(SNAPSHOT_LOOKUP_SECONDS)
+            return f"/cache/{model_id}"
+
+        fake_modelscope = types.ModuleType("modelscope")
+        fake_modelscope.snapshot_download = snapshot_download
+        monkeypatch.setitem(sys.modules, "modelscope", fake_modelscope)
+
+        return AppConfig(transcription=TranscriptionConfig(model="whisper", use_modelscope=True))
+
+    @pytest.mark.benchmark
+    def test_per_request_overhead_before_and_after(self, cfg):
+        """Shared services remove the per-request construction cost."""
+        iterations = 200
+
+        # Before: services built inside the request handler
+        start = time.perf_counter()
+        for _ in range(iterations):
+            validator = AudioValidator(
+                cfg.transcription.max_file_size,
+                cfg.transcription.max_duration,
+                cfg.transcription.allowed_formats
+            )
+            model_manager = ModelManager(cfg.transcription.model, cfg.transcription.use_modelscope)
+            TranscriptionService(validator, model_manager)
+        before = (time.perf_counter() - start) / iterations
+
+        # After: services built once, resolved through the dependency
+        services = ServiceContainer.from_config(cfg)
+        request = MagicMock()
+        request.app.state = types.SimpleNamespace(services=services)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            get_transcription_service(request)
+        after = (time.perf_counter() - start) / iterations
+
+        print(f"\n=== Per-request Service Overhead ===")
+        print(f"Before (construct per request): {before * 1e6:.1f}us")
+        print(f"After (shared via dependency): {after * 1e6:.1f}us")
+        print(f"Speedup: {before / after:.0f}x")
+
+        assert after < before
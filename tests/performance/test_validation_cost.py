@@ -0,0 +1,92 @@
+"""
+Validation cost per format: in-process header probes versus ffprobe.
+
+Each format is validated repeatedly; ffprobe timings are reported only when
+the binary is installed.
+"""
+
+import shutil
+import statistics
+import subprocess
+import time
+
+import pytest
+
+from src.services.probing import probe_duration
+from src.services.validation import AudioValidator
+from tests.fixtures.synthetic_audio import make_flac, make_m4a, make_mp3, make_ogg_vorbis, make_wav
+
+FORMATS = {
+    "wav": ("sample.wav", lambda: make_wav(60.0)),
+    "mp3 (frame scan)": ("sample.mp3", lambda: make_mp3(60.0)),
+    "mp3 (xing)": ("sample.mp3", lambda: make_mp3(60.0, xing=True)),
+    "flac": ("sample.flac", lambda: make_flac(60.0)),
+    "ogg": ("sample.ogg", lambda: make_ogg_vorbis(60.0)),
+    "m4a": ("sample.m4a", lambda: make_m4a(60.0, mdat_size=1024 * 1024)),
+}
+
+
+def _time(fn, iterations):
+    """Median seconds per call."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+class TestValidationCost:
+    """Benchmark duration probing per format."""
+
+    @pytest.mark.benchmark
+    def test_validation_cost_per_format(self, tmp_path):
+        """Header probes validate every format without forking ffprobe."""
+        validator = AudioValidator(25 * 1024 * 1024, 1500, ["wav", "mp3", "flac", "ogg", "m4a"])
+        has_ffprobe = shutil.which("ffprobe") is not None
+
+        print(f"\n=== Validation Cost per Format (60s audio) ===")
+        for label, (filename, build) in FORMATS.items():
+            path = tmp_path / label.split()[0] / filename
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(build())
+            format = path.suffix.lstrip(".")
+
+            duration = probe_duration(str(path), format)
+            assert duration == pytest.approx(60.0, abs=0.05)
+
+            native = _time(lambda: validator.validate_file(str(path), path.stat().st_size), 50)
+            line = f"{label:>17}: validate_file {native * 1e6:8.0f}us"
+
+            if has_ffprobe:
+                ffprobe = _time(lambda: subprocess.run(
+                    ["ffprobe", "-v", "quiet", "-show_entries", "format=duration",
+                     "-of", "default=noprint_wrappers=1:nokey=1", str(path)],
+                    capture_output=True, timeout=5
+                ), 5)
+                line += f", ffprobe alone {ffprobe * 1e6:8.0f}us"
+            print(line)
+
+        if not has_ffprobe:
+            print("ffprobe not installed: previous path fell back to the size estimate")
+
+    @pytest.mark.benchmark
+    def test_prepare_versus_validate_then_decode(self, tmp_path):
+        """One prepare_file pass against validation followed by a separate decode."""
+        from src.services.decoding import decode_audio
+
+        validator = AudioValidator(25 * 1024 * 1024, 1500, ["wav"])
+        path = tmp_path / "sample.wav"
+        path.write_bytes(make_wav(120.0, sample_rate=44100, channels=2))
+        size = path.stat().st_size
+
+        def two_pass():
+            format, _ = validator.validate_file(str(path), size)
+            decode_audio(str(path), format)
+
+        separate = _time(two_pass, 10)
+        prepared = _time(lambda: validator.prepare_file(str(path), size), 10)
+
+        print(f"\n=== Validate + Decode (120s 44.1kHz stereo WAV) ===")
+        print(f"validate_file then decode_audio: {separate * 1000:7.1f}ms")
+        print(f"prepare_file:                    {prepared * 1000:7.1f}ms")
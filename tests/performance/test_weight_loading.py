@@ -0,0 +1,81 @@
+"""
+Startup time and per-process memory for mlx_whisper's loader versus mmap.
+
+A random-weight Whisper checkpoint is written in the mlx-community layout,
+then N processes load it concurrently, like uvicorn workers each running
+the application lifespan. Every process reports its load time, peak RSS
+and how much of its resident memory is anonymous versus file-backed.
+"""
+
+import dataclasses
+import json
+import os
+import subprocess
+import sys
+
+import mlx.core as mx
+import pytest
+from mlx.utils import tree_flatten
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=768, n_audio_head=12, n_audio_layer=6,
+    n_vocab=51865, n_text_ctx=448, n_text_state=768, n_text_head=12, n_text_layer=6
+)
+
+CHILD = """
+import json, resource, sys, time
+import mlx.core as mx
+start = time.perf_counter()
+if sys.argv[2] == "mmap":
+    from src.mlx.weights import load_whisper_mmap as loader
+else:
+    from mlx_whisper.load_models import load_model as loader
+model = loader(sys.argv[1], mx.float16)
+elapsed = time.perf_counter() - start
+status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+kb = lambda key: int(status.get(key, "0 kB").split()[0])
+print(json.dumps({
+    "seconds": elapsed,
+    "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "anon_mb": kb("RssAnon") / 1024,
+    "file_mb": kb("RssFile") / 1024,
+}))
+"""
+
+
+def _load_in_processes(path, loader, workers):
+    """Load the checkpoint in parallel child processes; return their reports."""
+    procs = [
+        subprocess.Popen([sys.executable, "-c", CHILD, str(path), loader],
+                         stdout=subprocess.PIPE, cwd=os.getcwd())
+        for _ in range(workers)
+    ]
+    # The report is the last line; log output may precede it
+    return [json.loads(proc.communicate()[0].splitlines()[-1]) for proc in procs]
+
+
+class TestWeightLoading:
+    """Benchmark weight loading paths."""
+
+    @pytest.mark.benchmark
+    def test_startup_and_rss(self, tmp_path):
+        """Load time and RSS per process for 1, 2 and 4 workers."""
+        model = Whisper(DIMS, mx.float16)
+        model.set_dtype(mx.float16)
+        weights = dict(tree_flatten(model.parameters()))
+        (tmp_path / "config.json").write_text(json.dumps(dataclasses.asdict(DIMS)))
+        mx.save_safetensors(str(tmp_path / "weights.safetensors"), weights)
+        file_mb = (tmp_path / "weights.safetensors").stat().st_size / 1e6
+        del model, weights
+
+        print(f"\ncheckpoint {file_mb:.0f} MB")
+        print("loader   | workers | load s (max) | peak RSS MB | anon MB | file MB")
+        for workers in (1, 2, 4):
+            for loader in ("mx.load", "mmap"):
+                reports = _load_in_processes(tmp_path, loader, workers)
+                mean = lambda key: sum(report[key] for report in reports) / len(reports)
+                print(
+                    f"{loader:<8} | {workers:7d} | {max(report['seconds'] for report in reports):12.2f} | "
+                    f"{mean('peak_mb'):11.0f} | {mean('anon_mb'):7.0f} | {mean('file_mb'):7.0f}"
+                )
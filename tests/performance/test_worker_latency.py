@@ -0,0 +1,120 @@
+"""
+Submit-to-start latency and shutdown benchmarks for the worker pools.
+
+Compares the previous polling worker loop (queue.get(timeout=1)) with the
+event-driven sentinel loop and the asyncio-queue pool.
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from queue import Empty
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.workers import AsyncWorkerPool, Worker, WorkerPool
+
+
+class PollingWorker(Worker):
+    """Worker reproducing the previous polling loop, for comparison."""
+
+    def __init__(self, worker_id, model_manager):
+        super().__init__(worker_id, model_manager)
+        self.idle_wakeups = 0
+
+    def stop(self, timeout=None):
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=5)
+
+    def _run(self):
+        while self.running:
+            try:
+                request = self.queue.get(timeout=1)
+            except Empty:
+                self.idle_wakeups += 1
+                continue
+            try:
+                self._process_request(request)
+            finally:
+                self.queue.task_done()
+
+
+def _summary(latencies):
+    """Format latency statistics in microseconds."""
+    ordered = sorted(latencies)
+    return (f"p50={statistics.median(ordered) * 1e6:.0f}us "
+            f"p99={ordered[int(len(ordered) * 0.99) - 1] * 1e6:.0f}us")
+
+
+def _measure_thread_pool(pool, iterations):
+    """Measure submit-to-start latency for a thread worker pool."""
+    latencies = []
+    for i in range(iterations):
+        started = threading.Event()
+        submitted = time.perf_counter()
+        started_at = []
+
+        def task():
+            started_at.append(time.perf_counter())
+            started.set()
+
+        pool.submit(task, f"req-{i}").result(timeout=5)
+        latencies.append(started_at[0] - submitted)
+    return latencies
+
+
+class TestWorkerLatency:
+    """Benchmark worker wake-up and shutdown behaviour."""
+
+    @pytest.mark.benchmark
+    def test_submit_to_start_latency_before_and_after(self):
+        """Event-driven workers start work immediately and stop without polling delay."""
+        iterations = 200
+
+        # Before: polling worker loop
+        before_pool = WorkerPool(1, 10, MagicMock())
+        before_pool.workers = [PollingWorker(0, MagicMock())]
+        before_pool.start()
+        before = _measure_thread_pool(before_pool, iterations)
+        time.sleep(1.2)
+        idle_wakeups = before_pool.workers[0].idle_wakeups
+        stop_start = time.perf_counter()
+        before_pool.stop()
+        before_stop = time.perf_counter() - stop_start
+
+        # After: sentinel/event-driven worker loop
+        after_pool = WorkerPool(1, 10, MagicMock())
+        after_pool.start()
+        after = _measure_thread_pool(after_pool, iterations)
+        time.sleep(1.2)
+        stop_start = time.perf_counter()
+        after_pool.stop()
+        after_stop = time.perf_counter() - stop_start
+
+        # After: asyncio-native queue
+        async def measure_async():
+            pool = AsyncWorkerPool(1, 10, MagicMock(), queue_size=10)
+            pool.start()
+            latencies = []
+            for i in range(iterations):
+                submitted = time.perf_counter()
+                started_at = await pool.run(time.perf_counter, f"req-{i}")
+                latencies.append(started_at - submitted)
+            pool.stop()
+            return latencies
+
+        async_after = asyncio.run(measure_async())
+
+        print(f"\n=== Submit-to-start Latency ===")
+        print(f"Polling worker (before): {_summary(before)}, "
+              f"idle wakeups in 1.2s: {idle_wakeups}, stop: {before_stop * 1000:.0f}ms")
+        print(f"Event-driven worker (after): {_summary(after)}, stop: {after_stop * 1000:.1f}ms")
+        print(f"Asyncio queue pool (after): {_summary(async_after)}")
+
+        assert idle_wakeups >= 1
+        assert after_stop < before_stop
+        assert statistics.median(after) < 0.05
+        assert statistics.median(async_after) < 0.05
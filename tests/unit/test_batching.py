@@ -0,0 +1,120 @@
+"""Tests for dynamic encoder batching."""
+
+import threading
+
+import mlx.core as mx
+import numpy as np
+import pytest
+
+from src.mlx.batching import BatchedEncoder, EncoderBatcher, install_encoder_batching
+
+
+class RecordingEncoder:
+    """Fake encoder doubling its input and recording batch sizes."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, mel):
+        self.batch_sizes.append(mel.shape[0])
+        return mel * 2
+
+
+class TestEncoderBatcher:
+    """Test EncoderBatcher class."""
+
+    @pytest.fixture
+    def encoder(self):
+        """Create recording encoder."""
+        return RecordingEncoder()
+
+    def test_encode_without_thread_calls_encoder(self, encoder):
+        """Test a stopped batcher encodes inline."""
+        batcher = EncoderBatcher(encoder)
+        mel = mx.ones((1, 4, 2))
+
+        result = batcher.encode(mel)
+
+        assert np.array_equal(np.array(result), np.full((1, 4, 2), 2.0))
+        assert encoder.batch_sizes == [1]
+
+    def test_concurrent_windows_share_one_call(self, encoder):
+        """Test windows from concurrent callers are stacked and scattered back."""
+        batcher = EncoderBatcher(encoder, max_batch_size=4, max_wait=0.5)
+        batcher.start()
+        results = {}
+
+        def worker(i):
+            results[i] = np.array(batcher.encode(mx.full((4, 2), float(i))))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.stop()
+
+        assert encoder.batch_sizes == [4]
+        for i in range(4):
+            assert results[i].shape == (4, 2)
+            assert np.all(results[i] == 2.0 * i)
+        assert batcher.get_status()["avg_batch_size"] == 4.0
+
+    def test_max_wait_flushes_partial_batch(self, encoder):
+        """Test a lone window is encoded once max_wait expires."""
+        batcher = EncoderBatcher(encoder, max_batch_size=8, max_wait=0.01)
+        batcher.start()
+
+        result = batcher.encode(mx.ones((1, 4, 2)))
+        batcher.stop()
+
+        assert result.shape == (1, 4, 2)
+        assert encoder.batch_sizes == [1]
+
+    def test_mismatched_shapes_encoded_separately(self, encoder):
+        """Test windows of different shapes are not concatenated."""
+        batcher = EncoderBatcher(encoder, max_batch_size=2, max_wait=0.5)
+        batcher.start()
+        results = {}
+
+        def worker(shape):
+            results[shape] = batcher.encode(mx.ones(shape)).shape
+
+        threads = [threading.Thread(target=worker, args=(shape,)) for shape in [(1, 4, 2), (1, 6, 2)]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.stop()
+
+        assert sorted(encoder.batch_sizes) == [1, 1]
+        assert results == {(1, 4, 2): (1, 4, 2), (1, 6, 2): (1, 6, 2)}
+
+    def test_encoder_error_reaches_every_caller(self):
+        """Test an encoder failure is raised in the callers of that batch."""
+        def failing(mel):
+            raise RuntimeError("encoder failed")
+
+        batcher = EncoderBatcher(failing, max_batch_size=2, max_wait=0.01)
+        batcher.start()
+
+        with pytest.raises(RuntimeError, match="encoder failed"):
+            batcher.encode(mx.ones((1, 4, 2)))
+        batcher.stop()
+
+    def test_install_replaces_model_encoder(self, encoder):
+        """Test installation wraps the model's encoder once."""
+        class Model:
+            pass
+
+        model = Model()
+        model.encoder = encoder
+
+        first = install_encoder_batching(model, 4, 0.01)
+        second = install_encoder_batching(model, 4, 0.01)
+
+        assert isinstance(model.encoder, BatchedEncoder)
+        assert model.encoder.batcher is second
+        assert second.encoder is encoder
+        assert first.get_status()["running"] is False
+        second.stop()
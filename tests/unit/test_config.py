@@ -48,6 +48,19 @@ class TestTranscriptionConfig:
         assert config.max_duration == 3000
         assert config.model == "mlx-community/whisper-medium"
 
+    def test_inference_backend(self):
+        """Test inference backend configuration."""
+        config = TranscriptionConfig(model="test-model")
+        assert config.inference_backend == "thread"
+        assert config.inference_workers == 1
+
+        config = TranscriptionConfig(model="test-model", inference_backend="process", inference_workers=2)
+        assert config.inference_backend == "process"
+        assert config.inference_workers == 2
+
+        with pytest.raises(ValueError):
+            TranscriptionConfig(model="test-model", inference_backend="gpu")
+
 
 class TestLoggingConfig:
     """Test LoggingConfig model."""
@@ -0,0 +1,146 @@
+"""Tests for continuous batching of decoder steps."""
+
+import threading
+
+import mlx.core as mx
+import pytest
+from mlx_whisper import decoding
+from mlx_whisper.decoding import DecodingOptions
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+from src.mlx.continuous_batching import DecodeSequence, DecoderScheduler, install_decoder_batching
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=1,
+    n_vocab=51865, n_text_ctx=448, n_text_state=64, n_text_head=2, n_text_layer=2
+)
+
+
+@pytest.fixture(scope="module")
+def model():
+    """Small random-weight Whisper model."""
+    mx.random.seed(0)
+    model = Whisper(DIMS, mx.float32)
+    mx.eval(model.parameters())
+    return model
+
+
+@pytest.fixture(scope="module")
+def features():
+    """Random encoder outputs for four audio windows."""
+    mx.random.seed(1)
+    features = [mx.random.normal((1, DIMS.n_audio_ctx, DIMS.n_audio_state)) for _ in range(4)]
+    mx.eval(features)
+    return features
+
+
+class TestDecoderScheduler:
+    """Test DecoderScheduler class."""
+
+    def test_matches_unbatched_decode(self, model, features):
+        """Test concurrent batched decoding reproduces per-request greedy results."""
+        options = DecodingOptions(language="en", sample_len=12, fp16=False)
+        expected = [decoding.decode(model, f, options)[0] for f in features]
+
+        scheduler = install_decoder_batching(model, 8)
+        results = {}
+
+        def worker(i):
+            results[i] = model.decode(features[i], options)[0]
+
+        try:
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(features))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            scheduler.stop()
+            del model.decode
+
+        for i, result in enumerate(expected):
+            assert results[i].tokens == result.tokens
+            assert results[i].no_speech_prob == pytest.approx(result.no_speech_prob)
+        assert scheduler.get_status()["completed"] == len(features)
+
+    def test_sequences_join_and_leave_between_steps(self, model, features):
+        """Test a short sequence leaves while a longer one keeps decoding."""
+        scheduler = DecoderScheduler(model, max_batch_size=4)
+        scheduler.start()
+        eot = 50257
+
+        def sequence(f, sample_len):
+            return DecodeSequence(f, [50258, 50259, 50359, 50363], [], 0.0, eot, sample_len, 448, 0)
+
+        long = sequence(features[0], 10)
+        short = sequence(features[1], 3)
+        scheduler.submit(long)
+        scheduler.submit(short)
+        short.future.result()
+        late = sequence(features[2], 4)
+        scheduler.submit(late)
+
+        for s in (long, late):
+            s.future.result()
+        scheduler.stop()
+
+        assert short.sampled <= 3
+        assert long.sampled <= 10
+        assert late.sampled <= 4
+        assert long.slot is None and short.slot is None
+        status = scheduler.get_status()
+        assert status["completed"] == 3
+        assert status["kv_cache_pool"]["in_use"] == 0
+        assert status["kv_cache_pool"]["checkouts"] == 3
+
+    def test_exhausted_pool_defers_admission(self, model, features):
+        """Test sequences wait for a free KV buffer instead of allocating one."""
+        from src.mlx.kv_cache import KVCachePool
+
+        pool = KVCachePool.for_model(model, 1)
+        scheduler = DecoderScheduler(model, max_batch_size=4, pool=pool)
+        scheduler.start()
+        sequences = [
+            DecodeSequence(f, [50258, 50259, 50359, 50363], [], 0.0, 50257, 5, 448, 0)
+            for f in features[:3]
+        ]
+        for sequence in sequences:
+            scheduler.submit(sequence)
+        for sequence in sequences:
+            sequence.future.result()
+        scheduler.stop()
+
+        status = pool.get_status()
+        assert status["peak_in_use"] == 1
+        assert status["checkouts"] == 3
+        assert status["allocations"] == 1
+        assert status["exhausted"] > 0
+
+    def test_fallback_retry_reuses_window(self, model, features):
+        """Test a retried window reuses encoder output and cross-attention keys/values."""
+        scheduler = install_decoder_batching(model, 2)
+        mel = mx.random.normal((3000, DIMS.n_mels))
+        calls = []
+        encoder = model.encoder
+
+        def counting_encoder(x):
+            calls.append(x.shape)
+            return encoder(x)
+
+        model.encoder = counting_encoder
+        try:
+            for temperature in (0.0, 0.2):
+                model.decode(mel, DecodingOptions(language="en", sample_len=4, fp16=False, temperature=temperature))
+        finally:
+            model.encoder = encoder
+            scheduler.stop()
+            del model.decode
+
+        assert len(calls) == 1
+        assert scheduler.get_status()["windows"]["hits"] == 1
+
+    def test_submit_requires_running_scheduler(self, model, features):
+        """Test submitting to a stopped scheduler fails fast."""
+        scheduler = DecoderScheduler(model)
+        with pytest.raises(RuntimeError):
+            scheduler.submit(DecodeSequence(features[0], [50258], [], 0.0, 50257, 4, 448, 0))
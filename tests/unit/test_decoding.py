@@ -0,0 +1,90 @@
+"""Tests for in-process audio decoding."""
+
+import struct
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.services.decoding import (
+    DECODERS,
+    SAMPLE_RATE,
+    UnsupportedEncodingError,
+    decode_audio,
+    decode_wav,
+    parse_wav_header,
+)
+
+
+def _pcm16_wav(path: Path, samples: np.ndarray, sample_rate: int = SAMPLE_RATE, channels: int = 1) -> Path:
+    """Write float samples as a 16-bit PCM WAV file."""
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes((samples * 32767).astype("<i2").tobytes())
+    return path
+
+
+def _float_wav_bytes(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Build a 32-bit IEEE float WAV file in memory."""
+    payload = samples.astype("<f4").tobytes()
+    fmt = struct.pack("<HHIIHH", 3, 1, sample_rate, sample_rate * 4, 4, 32)
+    return (b"RIFF" + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(payload)) + b"WAVE"
+            + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+            + b"data" + struct.pack("<I", len(payload)) + payload)
+
+
+class TestDecodeWav:
+    """Test the WAV decoder."""
+
+    def test_registered_for_wav(self):
+        """Test the decoder registry contains the WAV decoder."""
+        assert DECODERS["wav"] is decode_wav
+
+    def test_pcm16_mono_16k(self, tmp_path):
+        """Test 16-bit mono audio decodes without resampling."""
+        tone = np.sin(np.linspace(0, 100, SAMPLE_RATE)).astype(np.float32) * 0.5
+        path = _pcm16_wav(tmp_path / "tone.wav", tone)
+
+        samples = decode_audio(str(path), "wav")
+
+        assert isinstance(samples, np.ndarray)
+        assert samples.dtype == np.float32
+        assert samples.shape == (SAMPLE_RATE,)
+        assert np.allclose(samples, tone, atol=1e-3)
+
+    def test_stereo_44k_resampled(self, tmp_path):
+        """Test stereo 44.1 kHz audio is down-mixed and resampled."""
+        stereo = np.zeros((44100 * 2, 2), np.float32)
+        stereo[:, 0] = 0.5
+        path = _pcm16_wav(tmp_path / "stereo.wav", stereo.reshape(-1), sample_rate=44100, channels=2)
+
+        samples = decode_audio(str(path), "wav")
+
+        assert samples.shape == (SAMPLE_RATE * 2,)
+        assert np.allclose(samples[1000:-1000], 0.25, atol=1e-3)
+
+    def test_float32_from_bytes(self):
+        """Test IEEE float WAV decodes from in-memory bytes."""
+        ramp = np.linspace(-1, 1, 800, dtype=np.float32)
+        samples = decode_audio(_float_wav_bytes(ramp), "wav")
+        assert np.array_equal(samples, ramp)
+
+    def test_unsupported_encoding_falls_back_to_path(self, tmp_path):
+        """Test files the decoder cannot handle are left for ffmpeg."""
+        path = tmp_path / "broken.wav"
+        path.write_bytes(b"RIFF" + b"\x00" * 100)
+        assert decode_audio(str(path), "wav") == str(path)
+
+    def test_no_decoder_returns_path(self, tmp_path):
+        """Test formats without an in-process decoder are left for ffmpeg."""
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(b"ID3" + b"\x00" * 100)
+        assert decode_audio(str(path), "mp3") == str(path)
+
+    def test_parse_header_rejects_non_wav(self):
+        """Test header parsing rejects non-RIFF data."""
+        with pytest.raises(UnsupportedEncodingError):
+            parse_wav_header(b"NOTAWAVEFILE" * 4)
@@ -0,0 +1,146 @@
+"""Tests for API dependency providers."""
+
+import asyncio
+import sys
+import threading
+import types
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.api.dependencies import ServiceContainer, get_services, get_transcription_service
+from src.core.config import AppConfig, TranscriptionConfig
+from src.mlx.model_manager import ModelManager
+from src.services.workers import WorkerPool
+
+
+class InlineWorkerPool:
+    """Worker pool running tasks inline."""
+
+    def __init__(self):
+        self.request_ids = []
+
+    async def run(self, task, request_id, duration=0.0, client_id=None):
+        self.request_ids.append(request_id)
+        return task()
+
+
+def make_services(model_host=None):
+    """Service container over mocks with an inline worker pool."""
+    transcription_service = MagicMock(process_executor=None, model_host=model_host)
+    transcription_service.worker_pool = InlineWorkerPool()
+    model_registry = MagicMock()
+    model_registry.resolve.side_effect = lambda name: {None: "default", "whisper-1": "default", "fast": "tiny-ckpt"}.get(name, name)
+    return ServiceContainer(MagicMock(), MagicMock(), transcription_service, model_registry=model_registry)
+
+
+class TestServiceContainer:
+    """Test ServiceContainer class."""
+
+    def test_from_config_resolves_model_once(self, monkeypatch):
+        """Test that the modelscope lookup happens once at build time."""
+        fake_modelscope = types.ModuleType("modelscope")
+        fake_modelscope.snapshot_download = MagicMock(return_value="/models/whisper")
+        monkeypatch.setitem(sys.modules, "modelscope", fake_modelscope)
+
+        cfg = AppConfig(transcription=TranscriptionConfig(model="whisper", use_modelscope=True))
+        services = ServiceContainer.from_config(cfg)
+
+        assert services.model_manager.get_model_name() == "/models/whisper"
+        assert services.transcription_service.validator is services.validator
+        assert services.transcription_service.model_manager is services.model_manager
+        fake_modelscope.snapshot_download.assert_called_once_with("whisper")
+        assert services.transcription_service.model_registry is services.model_registry
+        assert services.model_registry.get_manager("whisper") is services.model_manager
+
+    def test_get_services_not_initialized(self):
+        """Test that missing services raise a clear error."""
+        request = MagicMock()
+        request.app.state = types.SimpleNamespace()
+
+        with pytest.raises(RuntimeError):
+            get_services(request)
+
+    def test_get_transcription_service(self):
+        """Test that the shared transcription service is returned."""
+        services = ServiceContainer(MagicMock(), MagicMock(), MagicMock())
+        request = MagicMock()
+        request.app.state = types.SimpleNamespace(services=services)
+
+        assert get_transcription_service(request) is services.transcription_service
+        assert get_transcription_service(request) is get_transcription_service(request)
+
+    def test_warmup_marks_ready(self):
+        """Test warm-up runs every configured model through the worker pool before ready."""
+        services = make_services()
+        cfg = AppConfig(transcription=TranscriptionConfig(
+            model="whisper",
+            warmup_models=["fast", "whisper-1"],
+            warmup_durations=[1.0, 60.0]
+        ))
+
+        assert not services.is_ready()
+        asyncio.run(services.warmup(cfg))
+
+        assert services.is_ready()
+        assert services.worker_pool.request_ids == ["warmup", "warmup"]
+        services.model_registry.acquire.assert_any_call("default", [1.0, 60.0])
+        services.model_registry.acquire.assert_any_call("tiny-ckpt", [1.0, 60.0])
+
+    def test_failed_warmup_stays_not_ready(self):
+        """Test a failing warm-up is recorded and keeps readiness false."""
+        services = make_services()
+        services.model_registry.acquire.side_effect = RuntimeError("out of memory")
+
+        asyncio.run(services.warmup(AppConfig(transcription=TranscriptionConfig(model="whisper"))))
+
+        assert not services.is_ready()
+        assert services.warmup_error == "out of memory"
+
+    def test_ready_requires_model_host(self):
+        """Test the host backend is ready only when the model host reports ready."""
+        model_host = MagicMock()
+        services = make_services(model_host)
+        services.mark_ready()
+
+        model_host.get_status.return_value = {"ready": False}
+        assert not services.is_ready()
+        model_host.get_status.return_value = {"ready": True}
+        assert services.is_ready()
+        model_host.get_status.side_effect = ConnectionError("no host")
+        assert not services.is_ready()
+
+    def test_health_reports_live_state_during_model_load(self):
+        """Test /health data comes back while a model load holds the load lock."""
+        model_manager = ModelManager("test-model", use_modelscope=False)
+        worker_pool = WorkerPool(2, 10, model_manager)
+        worker_pool.start()
+        transcription_service = MagicMock(model_host=None, worker_pool=worker_pool, in_flight_requests=3)
+        services = ServiceContainer(MagicMock(), model_manager, transcription_service)
+
+        result = {}
+        with model_manager._load_lock:
+            thread = threading.Thread(target=lambda: result.update(services.get_health()))
+            thread.start()
+            thread.join(5)
+
+        worker_pool.stop()
+        assert result["status"] == "healthy"
+        assert result["model_loaded"] is False
+        assert result["model"]["model_name"] == "test-model"
+        assert result["workers"]["num_workers"] == 2
+        assert result["queue_depth"] == 0
+        assert result["in_flight_requests"] == 3
+        assert result["peak_rss_bytes"] > 0
+
+    def test_health_unhealthy_when_model_host_unreachable(self):
+        """Test an unreachable model host makes the server unhealthy."""
+        model_host = MagicMock()
+        model_host.get_status.side_effect = ConnectionError("no host")
+        services = make_services(model_host)
+        services.worker_pool.get_status = lambda: {"queue_depth": 0, "workers": [{"running": True}]}
+
+        health = services.get_health()
+
+        assert health["status"] == "unhealthy"
+        assert health["model"]["error"] == "no host"
@@ -0,0 +1,70 @@
+"""Tests for streaming upload ingestion."""
+
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+
+from src.services.ingestion import spool_upload
+from src.core.exceptions import FileTooLargeError
+
+
+def _make_upload(size: int, filename: str = "audio.wav") -> UploadFile:
+    """Create an upload backed by a spooled file, like Starlette does."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    block = b"\x01" * (1024 * 1024)
+    remaining = size
+    while remaining > 0:
+        spooled.write(block[:remaining])
+        remaining -= len(block)
+    spooled.seek(0)
+    return UploadFile(file=spooled, filename=filename)
+
+
+class TestSpoolUpload:
+    """Test spool_upload context manager."""
+
+    @pytest.mark.asyncio
+    async def test_spools_to_temp_file(self):
+        """Test that the upload is copied to a temp file with its extension."""
+        upload = _make_upload(3 * 1024 * 1024 + 7)
+
+        async with spool_upload(upload, max_size=25 * 1024 * 1024, chunk_size=64 * 1024) as (path, size):
+            assert size == 3 * 1024 * 1024 + 7
+            assert Path(path).suffix == ".wav"
+            assert Path(path).stat().st_size == size
+
+        assert not Path(path).exists()
+
+    @pytest.mark.asyncio
+    async def test_enforces_max_size_while_streaming(self):
+        """Test that oversized uploads are rejected and cleaned up."""
+        upload = _make_upload(5 * 1024 * 1024)
+        created = []
+
+        with pytest.raises(FileTooLargeError) as exc_info:
+            async with spool_upload(upload, max_size=2 * 1024 * 1024, request_id="req-1", chunk_size=64 * 1024) as (path, _):
+                created.append(path)
+
+        assert exc_info.value.status_code == 413
+        assert exc_info.value.request_id == "req-1"
+        assert not created
+
+    @pytest.mark.asyncio
+    async def test_memory_bounded_by_chunk_size(self):
+        """Test that peak allocations track the chunk size, not the file size."""
+        upload = _make_upload(20 * 1024 * 1024)
+        chunk_size = 256 * 1024
+
+        tracemalloc.start()
+        try:
+            async with spool_upload(upload, max_size=25 * 1024 * 1024, chunk_size=chunk_size) as (_, size):
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert size == 20 * 1024 * 1024
+        assert peak < 4 * chunk_size
@@ -0,0 +1,79 @@
+"""Tests for the decoder KV cache pool and window cache."""
+
+import mlx.core as mx
+
+from src.mlx.kv_cache import KVCachePool, WindowCache
+
+
+class TestKVCachePool:
+    """Test KVCachePool class."""
+
+    def test_buffers_preallocated(self):
+        """Test slabs are allocated once at full capacity."""
+        pool = KVCachePool(n_layer=2, n_ctx=448, n_state=8, capacity=3, dtype=mx.float16)
+
+        assert len(pool.keys) == len(pool.values) == 2
+        assert pool.keys[0].shape == (3, 448, 8)
+        assert pool.nbytes == 2 * 2 * 3 * 448 * 8 * 2
+
+    def test_acquire_release_and_stats(self):
+        """Test slots are checked out, exhausted and returned."""
+        pool = KVCachePool(n_layer=1, n_ctx=4, n_state=2, capacity=2)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        assert {first, second} == {0, 1}
+        assert pool.acquire() is None
+
+        status = pool.get_status()
+        assert status["in_use"] == 2
+        assert status["occupancy"] == 1.0
+        assert status["exhausted"] == 1
+
+        pool.release(first)
+        assert pool.acquire() == first
+
+        status = pool.get_status()
+        assert status["checkouts"] == 3
+        assert status["peak_in_use"] == 2
+        assert status["allocations"] == 1
+
+
+class TestWindowCache:
+    """Test WindowCache class."""
+
+    def test_features_matched_by_identity(self):
+        """Test lookups hit only for the same mel array object."""
+        cache = WindowCache()
+        mel = mx.zeros((4, 2))
+        features = mx.ones((1, 3, 2))
+
+        assert cache.get_features(mel) is None
+        cache.put_features(mel, features)
+
+        assert cache.get_features(mel) is features
+        assert cache.get_features(mx.zeros((4, 2))) is None
+        assert cache.get_status() == {"entries": 1, "hits": 1, "misses": 2}
+
+    def test_cross_kv_attached_to_window(self):
+        """Test cross-attention keys/values are stored alongside features."""
+        cache = WindowCache()
+        mel = mx.zeros((4, 2))
+        features = mx.ones((1, 3, 2))
+        cache.put_features(mel, features)
+
+        assert cache.get_cross_kv(features) is None
+        cross_kv = [(mx.ones((1, 3, 2)), mx.ones((1, 3, 2)))]
+        cache.put_cross_kv(features, cross_kv)
+
+        assert cache.get_cross_kv(features) is cross_kv
+
+    def test_lru_eviction(self):
+        """Test the least recently used window is evicted."""
+        cache = WindowCache(max_entries=2)
+        mels = [mx.zeros((1,)) for _ in range(3)]
+        for mel in mels:
+            cache.put_features(mel, mx.ones((1,)))
+
+        assert cache.get_features(mels[0]) is None
+        assert cache.get_features(mels[2]) is not None
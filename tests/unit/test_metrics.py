@@ -0,0 +1,140 @@
+"""Tests for Prometheus metrics and stage timing."""
+
+import time
+
+import mlx.core as mx
+
+from src.mlx.instrumentation import TimedEncoder, install_stage_timing
+from src.services.metrics import Counter, Histogram, RealtimeFactorTracker, ServerMetrics
+
+
+class FakeWhisper:
+    """Model whose decode runs the encoder, like mlx_whisper's DecodingTask."""
+
+    def __init__(self, encode_seconds: float, decode_seconds: float):
+        self.encode_seconds = encode_seconds
+        self.decode_seconds = decode_seconds
+
+    def encoder(self, mel):
+        time.sleep(self.encode_seconds)
+        return mel * 2
+
+    def decode(self, mel, options=None):
+        features = self.encoder(mel)
+        time.sleep(self.decode_seconds)
+        return features
+
+
+class TestHistogram:
+    """Test Histogram class."""
+
+    def test_render_cumulative_buckets(self):
+        """Test buckets are cumulative with +Inf, sum and count per label."""
+        histogram = Histogram("stage_seconds", "Stage time", (0.1, 1.0), label="stage")
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value, "decode")
+
+        lines = histogram.render()
+
+        assert 'stage_seconds_bucket{stage="decode",le="0.1"} 2' in lines
+        assert 'stage_seconds_bucket{stage="decode",le="1.0"} 3' in lines
+        assert 'stage_seconds_bucket{stage="decode",le="+Inf"} 4' in lines
+        assert 'stage_seconds_sum{stage="decode"} 3.65' in lines
+        assert 'stage_seconds_count{stage="decode"} 4' in lines
+        assert lines[1] == "# TYPE stage_seconds histogram"
+
+
+class TestCounter:
+    """Test Counter class."""
+
+    def test_labels_are_escaped(self):
+        """Test label values with quotes render as valid exposition text."""
+        counter = Counter("errors_total", "Errors", label="error_type")
+        counter.inc(1.0, 'bad "type"')
+        counter.inc(2.0, 'bad "type"')
+
+        assert counter.render()[-1] == 'errors_total{error_type="bad \\"type\\""} 3.0'
+
+    def test_unlabelled_counter_renders_zero(self):
+        """Test an unlabelled counter is exported before its first increment."""
+        assert Counter("audio_seconds_total", "Audio").render()[-1] == "audio_seconds_total 0.0"
+
+
+class TestServerMetrics:
+    """Test ServerMetrics class."""
+
+    def test_record_transcription_and_gauges(self):
+        """Test throughput counters, real-time factor and scrape-time gauges."""
+        metrics = ServerMetrics()
+        metrics.record_transcription(30.0, 3.0)
+        metrics.record_error("file_too_large")
+
+        text = metrics.render({"queue_depth": ("Queued requests", 2)})
+
+        assert "mlx_whisper_audio_seconds_total 30.0" in text
+        assert 'mlx_whisper_realtime_factor_bucket{le="10.0"} 1' in text
+        assert 'mlx_whisper_realtime_factor_bucket{le="5.0"} 0' in text
+        assert 'mlx_whisper_errors_total{error_type="file_too_large"} 1.0' in text
+        assert "# TYPE queue_depth gauge\nqueue_depth 2.0" in text
+
+    def test_time_stage_records_on_error(self):
+        """Test a timed block is recorded even when it raises."""
+        metrics = ServerMetrics()
+        try:
+            with metrics.time_stage("probe"):
+                raise ValueError("bad header")
+        except ValueError:
+            pass
+
+        assert metrics.stage_seconds.get_count("probe") == 1
+
+
+class TestRealtimeFactorTracker:
+    """Test RealtimeFactorTracker class."""
+
+    def test_rolling_window_per_model(self):
+        """Test the rolling factor weights by audio and forgets requests outside the window."""
+        tracker = RealtimeFactorTracker(window=2)
+
+        assert tracker.record("small", 10.0, 1.0) == 10.0
+        tracker.record("small", 60.0, 2.0)
+        tracker.record("small", 30.0, 3.0)
+        tracker.record("large", 30.0, 10.0)
+
+        small = tracker.get_status()["small"]
+        assert small["window_requests"] == 2
+        assert small["rolling_rtf"] == 18.0
+        assert small["min_rtf"] == 10.0
+        assert small["max_rtf"] == 30.0
+        assert small["total_requests"] == 3
+        assert small["total_rtf"] == round(100 / 6, 3)
+        assert tracker.get_status()["large"]["rolling_rtf"] == 3.0
+
+    def test_unmeasured_request_ignored(self):
+        """Test a zero inference time yields no factor."""
+        tracker = RealtimeFactorTracker()
+
+        assert tracker.record("small", 10.0, 0.0) is None
+        assert tracker.get_status() == {}
+
+
+class TestStageTiming:
+    """Test install_stage_timing."""
+
+    def test_decode_excludes_encoder_time(self):
+        """Test encoder time inside decode is recorded as encode, not decode."""
+        metrics = ServerMetrics()
+        model = FakeWhisper(encode_seconds=0.05, decode_seconds=0.01)
+        install_stage_timing(model, metrics)
+        install_stage_timing(model, metrics)
+
+        model.decode(mx.ones((1, 4)))
+
+        assert isinstance(model.encoder, TimedEncoder)
+        assert not isinstance(model.encoder.encoder, TimedEncoder)
+        assert metrics.stage_seconds.get_count("encode") == 1
+        assert metrics.stage_seconds.get_count("decode") == 1
+        encode_sum = metrics.stage_seconds._series["encode"][1][0]
+        decode_sum = metrics.stage_seconds._series["decode"][1][0]
+        assert encode_sum >= 0.05
+        assert 0.01 <= decode_sum < 0.05
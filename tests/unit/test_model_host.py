@@ -0,0 +1,161 @@
+"""Tests for the model host transport."""
+
+import socket
+import threading
+from concurrent.futures import Future
+from functools import partial
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.core.exceptions import ModelNotFoundError, ServerBusyError, TranscribeError
+from src.services.model_host import (
+    ModelHostClient,
+    ModelHostServer,
+    handle_host_request,
+    recv_message,
+    send_message,
+)
+from src.services.workers import WorkerPool
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    """Unix socket path in a temporary directory."""
+    return str(tmp_path / "host.sock")
+
+
+@pytest.fixture
+def registry():
+    """Fake model registry echoing what it was asked to transcribe."""
+    registry = MagicMock()
+    registry.resolve.side_effect = lambda name, request_id=None: name or "default"
+    registry.get_transcribe_options.return_value = {"fp16": True}
+    registry.transcribe.side_effect = lambda checkpoint, samples, **options: {
+        "text": checkpoint,
+        "samples": len(samples),
+        "sum": np.float32(samples.sum()),
+        "options": options,
+    }
+    return registry
+
+
+@pytest.fixture
+def host(socket_path, registry):
+    """Running model host server backed by the fake registry."""
+    pool = WorkerPool(2, 4, None)
+    pool.start()
+    server = ModelHostServer(
+        socket_path,
+        partial(handle_host_request, model_registry=registry, worker_pool=pool, get_status=lambda: {"ok": True})
+    )
+    server.start()
+    yield server
+    server.stop()
+    pool.stop()
+
+
+class TestFraming:
+    """Test message framing."""
+
+    def test_round_trip(self):
+        """Test header and payload survive a socket pair."""
+        left, right = socket.socketpair()
+        samples = np.arange(100000, dtype=np.float32)
+
+        sender = threading.Thread(target=send_message, args=(left, {"a": [1, 2]}, samples))
+        sender.start()
+        header, payload = recv_message(right)
+        sender.join()
+
+        assert header == {"a": [1, 2]}
+        assert np.array_equal(np.frombuffer(payload, dtype=np.float32), samples)
+        left.close()
+        right.close()
+
+    def test_closed_connection(self):
+        """Test a truncated message raises ConnectionError."""
+        left, right = socket.socketpair()
+        left.sendall(b"\x05\x00")
+        left.close()
+
+        with pytest.raises(ConnectionError):
+            recv_message(right)
+        right.close()
+
+
+class TestModelHost:
+    """Test model host server and client."""
+
+    def test_transcribe(self, host, socket_path, registry):
+        """Test samples and options reach the host registry and the result comes back."""
+        client = ModelHostClient(socket_path)
+        samples = np.ones(16000, dtype=np.float32)
+
+        result = client.transcribe(samples, "small-ckpt", {"language": "en"}, "req-1", "key")
+
+        assert result == {"text": "small-ckpt", "samples": 16000, "sum": 16000.0,
+                          "options": {"fp16": True, "language": "en"}}
+        registry.resolve.assert_called_once_with("small-ckpt", "req-1")
+
+    def test_default_model(self, host, socket_path):
+        """Test no model selects the host's default."""
+        result = ModelHostClient(socket_path).transcribe(np.zeros(10, np.float32), None, {})
+
+        assert result["text"] == "default"
+
+    def test_errors_keep_type_and_status(self, host, socket_path, registry):
+        """Test host-side TranscribeErrors are re-raised with their status code."""
+        registry.resolve.side_effect = ModelNotFoundError("gpt", ["whisper-1"])
+
+        with pytest.raises(TranscribeError) as exc_info:
+            ModelHostClient(socket_path).transcribe(np.zeros(10, np.float32), "gpt", {}, "req-2")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.error_type == "model_not_found"
+        assert exc_info.value.request_id == "req-2"
+
+    def test_unexpected_errors_are_server_errors(self, host, socket_path, registry):
+        """Test other host failures become 500 server errors."""
+        registry.transcribe.side_effect = RuntimeError("metal")
+
+        with pytest.raises(TranscribeError) as exc_info:
+            ModelHostClient(socket_path).transcribe(np.zeros(10, np.float32), None, {})
+
+        assert exc_info.value.status_code == 500
+        assert "metal" in exc_info.value.message
+
+    def test_status(self, host, socket_path):
+        """Test the host reports its status."""
+        assert ModelHostClient(socket_path).get_status() == {"ok": True}
+
+    def test_unreachable_host(self, socket_path):
+        """Test a missing socket raises a connection error."""
+        with pytest.raises(OSError):
+            ModelHostClient(socket_path).transcribe(np.zeros(10, np.float32), None, {})
+
+
+class TestHandleHostRequest:
+    """Test handle_host_request function."""
+
+    def test_admission_error(self, registry):
+        """Test a full host worker pool answers server_busy."""
+        pool = MagicMock()
+        pool.submit.side_effect = ServerBusyError(4)
+
+        response = handle_host_request({"type": "transcribe"}, np.zeros(16000, np.float32), registry, pool, dict)
+
+        assert response["error"]["status_code"] == 503
+        assert pool.submit.call_args.args[2] == 1.0
+
+    def test_result(self, registry):
+        """Test the worker pool result is returned."""
+        pool = MagicMock()
+        future = Future()
+        future.set_result({"text": "hi"})
+        pool.submit.return_value = future
+
+        response = handle_host_request({"type": "transcribe"}, np.zeros(10, np.float32), registry, pool, dict)
+
+        assert response == {"result": {"text": "hi"}}
@@ -0,0 +1,123 @@
+"""Tests for ModelManager."""
+
+from unittest.mock import patch
+
+import mlx.core as mx
+import mlx.nn as nn
+import pytest
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+from src.core.exceptions import ModelLoadError
+from src.mlx.model_manager import ModelManager, model_nbytes, prepare_model
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=1,
+    n_vocab=51865, n_text_ctx=448, n_text_state=64, n_text_head=2, n_text_layer=2
+)
+
+
+class TestModelManager:
+    """Test ModelManager class."""
+
+    def test_kv_cache_pool_owned_and_reported(self):
+        """Test the KV cache pool is created once, sized for the model and reported."""
+        manager = ModelManager("test-model", use_modelscope=False)
+        model = Whisper(DIMS, mx.float16)
+        model.set_dtype(mx.float16)
+
+        pool = manager.get_kv_cache_pool(model, 4)
+
+        assert manager.get_kv_cache_pool(model, 8) is pool
+        assert pool.keys[0].shape == (4, DIMS.n_text_ctx, DIMS.n_text_state)
+        assert pool.keys[0].dtype == mx.float16
+        assert manager.get_status()["kv_cache_pool"]["capacity"] == 4
+
+    def test_invalid_options_rejected(self):
+        """Test unsupported dtype and bit widths raise ValueError."""
+        with pytest.raises(ValueError):
+            ModelManager("test-model", use_modelscope=False, dtype="int8")
+        with pytest.raises(ValueError):
+            ModelManager("test-model", use_modelscope=False, quantize_bits=3)
+
+    def test_transcribe_options_follow_dtype(self):
+        """Test fp16 activations are only requested for float16 weights."""
+        assert ModelManager("m", False).get_transcribe_options() == {"fp16": True}
+        assert ModelManager("m", False, dtype="bfloat16").get_transcribe_options() == {"fp16": False}
+        assert ModelManager("m", False, dtype="float32").get_transcribe_options() == {"fp16": False}
+
+    def test_load_prepares_and_reports_footprint(self):
+        """Test loading casts and quantizes weights and reports their size."""
+        manager = ModelManager("test-model", use_modelscope=False, dtype="float16", quantize_bits=8)
+
+        with patch("src.mlx.model_manager.load_model", return_value=Whisper(DIMS, mx.float16)) as load:
+            model = manager.get_model()
+            assert manager.get_model() is model
+
+        load.assert_called_once_with("test-model", dtype=mx.float16)
+        assert isinstance(model.decoder.token_embedding, nn.QuantizedEmbedding)
+        status = manager.get_status()
+        assert status["loaded"] is True
+        assert status["quantize_bits"] == 8
+        assert status["model_bytes"] == model_nbytes(model)
+        assert status["load_seconds"] is not None
+
+        manager.unload_model()
+        assert manager.get_status()["model_bytes"] is None
+
+    def test_load_failure_raises_model_load_error(self):
+        """Test loader errors surface as ModelLoadError."""
+        manager = ModelManager("missing-model", use_modelscope=False)
+
+        with patch("src.mlx.model_manager.load_model", side_effect=FileNotFoundError("no weights")):
+            with pytest.raises(ModelLoadError):
+                manager.get_model()
+        assert not manager.is_loaded()
+
+
+    def test_mmap_loader_selected(self):
+        """Test mmap_weights switches to the memory-mapped loader."""
+        manager = ModelManager("test-model", use_modelscope=False, mmap_weights=True)
+
+        with patch("src.mlx.model_manager.load_whisper_mmap", return_value=Whisper(DIMS, mx.float16)) as load:
+            manager.get_model()
+
+        load.assert_called_once_with("test-model", dtype=mx.float16)
+
+    def test_warmup_transcribes_each_duration(self):
+        """Test warm-up runs one synthetic clip per length bucket and records its time."""
+        manager = ModelManager("test-model", use_modelscope=False)
+
+        with patch.object(manager, "get_model"), patch.object(manager, "transcribe") as transcribe:
+            manager.warmup([1.0, 45.0])
+
+        lengths = [len(call.args[0]) for call in transcribe.call_args_list]
+        assert lengths == [16000, 45 * 16000]
+        assert manager.get_status()["warmup_seconds"] is not None
+
+
+class TestPrepareModel:
+    """Test weight casting and quantization."""
+
+    def test_cast_dtype(self):
+        """Test weights are cast to the requested dtype."""
+        model = prepare_model(Whisper(DIMS, mx.float32), mx.bfloat16)
+
+        assert model.decoder.ln.weight.dtype == mx.bfloat16
+        assert model.encoder.conv1.weight.dtype == mx.bfloat16
+
+    @pytest.mark.parametrize("bits", [4, 8])
+    def test_quantization_shrinks_model(self, bits):
+        """Test quantized weights take less memory than float16."""
+        full = model_nbytes(prepare_model(Whisper(DIMS, mx.float16), mx.float16))
+        quantized = prepare_model(Whisper(DIMS, mx.float16), mx.float16, quantize_bits=bits)
+
+        assert isinstance(quantized.decoder.blocks[0].mlp1, nn.QuantizedLinear)
+        assert model_nbytes(quantized) < full
+
+    def test_quantize_twice_is_noop(self):
+        """Test already-quantized weights are left alone."""
+        model = prepare_model(Whisper(DIMS, mx.float16), mx.float16, quantize_bits=4)
+        size = model_nbytes(model)
+
+        prepare_model(model, mx.float16, quantize_bits=4)
+        assert model_nbytes(model) == size
@@ -0,0 +1,176 @@
+"""Tests for ModelRegistry."""
+
+import threading
+import time
+
+import pytest
+
+from src.core.exceptions import ModelNotFoundError
+from src.mlx.model_registry import ModelRegistry
+
+
+class FakeManager:
+    """Stands in for ModelManager with a fixed model size."""
+
+    def __init__(self, model_name: str, nbytes: int = 100):
+        self.model_name = model_name
+        self.nbytes = nbytes
+        self.loaded = False
+        self.loads = 0
+        self.warmups = 0
+        self.transcribing = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def is_loaded(self):
+        return self.loaded
+
+    def get_model(self):
+        if not self.loaded:
+            self.loaded = True
+            self.loads += 1
+
+    def warmup(self, durations=(1.0,)):
+        self.warmups += 1
+        self.warmup_durations = list(durations)
+
+    def transcribe(self, audio, **options):
+        self.get_model()
+        self.transcribing.set()
+        self.release.wait(5)
+        return {"text": self.model_name}
+
+    def unload_model(self):
+        self.loaded = False
+
+    def get_model_bytes(self):
+        return self.nbytes if self.loaded else 0
+
+    def get_transcribe_options(self):
+        return {"fp16": True}
+
+    def get_status(self):
+        return {"loaded": self.loaded}
+
+
+@pytest.fixture
+def managers():
+    """Fake managers created by the registry, by checkpoint."""
+    return {}
+
+
+def make_registry(managers, **kwargs):
+    """Registry over fake managers."""
+    def factory(checkpoint):
+        managers[checkpoint] = FakeManager(checkpoint)
+        return managers[checkpoint]
+
+    return ModelRegistry("default", factory, aliases={"fast": "tiny-ckpt", "slow": "big-ckpt"}, **kwargs)
+
+
+class TestModelRegistry:
+    """Test ModelRegistry class."""
+
+    def test_resolve(self, managers):
+        """Test aliases, checkpoints and the OpenAI model name resolve."""
+        registry = make_registry(managers)
+
+        assert registry.resolve(None) == "default"
+        assert registry.resolve("whisper-1") == "default"
+        assert registry.resolve("fast") == "tiny-ckpt"
+        assert registry.resolve("tiny-ckpt") == "tiny-ckpt"
+        assert registry.resolve("small") == "mlx-community/whisper-small-mlx"
+
+    def test_resolve_unknown_model(self, managers):
+        """Test unknown names raise ModelNotFoundError with status 404."""
+        registry = make_registry(managers)
+
+        with pytest.raises(ModelNotFoundError) as exc_info:
+            registry.resolve("someone/else", "req-1")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.request_id == "req-1"
+
+    def test_transcribe_loads_and_warms_once(self, managers):
+        """Test a model is created, loaded and warmed up only on first use."""
+        registry = make_registry(managers)
+
+        assert registry.transcribe("tiny-ckpt", None)["text"] == "tiny-ckpt"
+        registry.transcribe("tiny-ckpt", None)
+
+        assert managers["tiny-ckpt"].loads == 1
+        assert managers["tiny-ckpt"].warmups == 1
+        assert registry.get_status()["loaded"] == ["tiny-ckpt"]
+
+    def test_acquire_with_durations_warms_loaded_model(self, managers):
+        """Test startup warm-up re-warms an already loaded model with every length bucket."""
+        registry = make_registry(managers, warmup=False)
+        registry.transcribe("default", None)
+
+        manager = registry.acquire("default", [1.0, 60.0])
+        registry.release("default")
+
+        assert manager.loads == 1
+        assert manager.warmups == 1
+        assert manager.warmup_durations == [1.0, 60.0]
+
+    def test_memory_budget_evicts_least_recently_used(self, managers):
+        """Test loading past the budget unloads the oldest idle model but not the default."""
+        registry = make_registry(managers, memory_budget_bytes=250, warmup=False)
+
+        registry.transcribe("default", None)
+        registry.transcribe("tiny-ckpt", None)
+        registry.transcribe("big-ckpt", None)
+
+        assert managers["default"].loaded
+        assert not managers["tiny-ckpt"].loaded
+        assert managers["big-ckpt"].loaded
+        status = registry.get_status()
+        assert status["loaded"] == ["default", "big-ckpt"]
+        assert status["loaded_bytes"] == 200
+        assert status["evictions"] == 1
+
+    def test_models_in_use_are_not_evicted(self, managers):
+        """Test a model mid-transcription survives budget eviction."""
+        registry = make_registry(managers, memory_budget_bytes=100, warmup=False)
+        registry.get_manager("tiny-ckpt").release.clear()
+
+        thread = threading.Thread(target=registry.transcribe, args=("tiny-ckpt", None))
+        thread.start()
+        assert managers["tiny-ckpt"].transcribing.wait(5)
+        registry.transcribe("big-ckpt", None)
+
+        assert managers["tiny-ckpt"].loaded
+        managers["tiny-ckpt"].release.set()
+        thread.join()
+
+        # Once idle, the next load over budget evicts it
+        registry.transcribe("big-ckpt", None)
+        assert not managers["tiny-ckpt"].loaded
+
+    def test_evict_idle(self, managers):
+        """Test models unused past the idle timeout are unloaded."""
+        registry = make_registry(managers, idle_unload_seconds=0.05, warmup=False)
+        registry.transcribe("default", None)
+        registry.transcribe("tiny-ckpt", None)
+
+        time.sleep(0.1)
+        assert registry.evict_idle() == 1
+
+        assert managers["default"].loaded
+        assert not managers["tiny-ckpt"].loaded
+        assert registry.get_status()["loaded"] == ["default"]
+
+    def test_reaper_thread(self, managers):
+        """Test the background thread evicts idle models."""
+        registry = make_registry(managers, idle_unload_seconds=0.05, warmup=False)
+        registry.start()
+        try:
+            registry.transcribe("tiny-ckpt", None)
+            deadline = time.monotonic() + 2
+            while managers["tiny-ckpt"].loaded and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            registry.stop()
+
+        assert not managers["tiny-ckpt"].loaded
@@ -0,0 +1,75 @@
+"""Tests for in-process duration probes."""
+
+import pytest
+
+from src.services.probing import PROBES, parse_mp3_frame_header, probe_duration
+from tests.fixtures.synthetic_audio import make_flac, make_m4a, make_mp3, make_ogg_vorbis, make_wav
+
+
+def _write(tmp_path, name, data):
+    """Write data to a file and return its path."""
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+class TestProbeDuration:
+    """Test probe_duration for each supported container."""
+
+    def test_registry(self):
+        """Test probes are registered for the validator's format names."""
+        assert {"wav", "mp3", "flac", "ogg", "mp4", "m4a"} <= set(PROBES)
+
+    def test_wav(self, tmp_path):
+        """Test WAV duration from the data chunk size."""
+        path = _write(tmp_path, "a.wav", make_wav(2.5, sample_rate=22050, channels=2))
+        assert probe_duration(path, "wav") == pytest.approx(2.5)
+
+    def test_long_wav_not_estimated(self, tmp_path):
+        """Test a 20-minute 8 kHz WAV reports its real duration."""
+        path = _write(tmp_path, "long.wav", make_wav(1200, sample_rate=8000))
+        assert probe_duration(path, "wav") == pytest.approx(1200)
+
+    def test_wav_streaming_placeholder_size(self, tmp_path):
+        """Test WAV files with a placeholder data size use the file length."""
+        data = bytearray(make_wav(1.0))
+        data[40:44] = b"\xff\xff\xff\xff"
+        path = _write(tmp_path, "stream.wav", bytes(data))
+        assert probe_duration(path, "wav") == pytest.approx(1.0)
+
+    def test_mp3_frame_scan(self, tmp_path):
+        """Test CBR MP3 without a Xing header is measured by frame scanning."""
+        path = _write(tmp_path, "a.mp3", make_mp3(10.0))
+        assert probe_duration(path, "mp3") == pytest.approx(10.0, abs=0.03)
+
+    def test_mp3_xing(self, tmp_path):
+        """Test MP3 frame count is read from the Xing header."""
+        path = _write(tmp_path, "a.mp3", make_mp3(10.0, xing=True))
+        assert probe_duration(path, "mp3") == pytest.approx(10.0, abs=0.03)
+
+    def test_mp3_frame_header(self):
+        """Test MPEG-1 Layer III frame header parsing."""
+        frame_length, samples, sample_rate, side_info, mono = parse_mp3_frame_header(b"\xff\xfb\x90\x00")
+        assert (frame_length, samples, sample_rate, side_info, mono) == (417, 1152, 44100, 32, False)
+        assert parse_mp3_frame_header(b"ID3\x04") is None
+
+    def test_flac(self, tmp_path):
+        """Test FLAC duration from STREAMINFO."""
+        path = _write(tmp_path, "a.flac", make_flac(42.0))
+        assert probe_duration(path, "flac") == pytest.approx(42.0)
+
+    def test_ogg_vorbis(self, tmp_path):
+        """Test Ogg Vorbis duration from the last granule position."""
+        path = _write(tmp_path, "a.ogg", make_ogg_vorbis(7.5))
+        assert probe_duration(path, "ogg") == pytest.approx(7.5)
+
+    def test_m4a_moov_at_end(self, tmp_path):
+        """Test M4A duration from mvhd placed after mdat."""
+        path = _write(tmp_path, "a.m4a", make_m4a(95.0))
+        assert probe_duration(path, "m4a") == pytest.approx(95.0)
+
+    def test_unparseable_returns_none(self, tmp_path):
+        """Test garbage and unsupported formats return None."""
+        path = _write(tmp_path, "a.wav", b"RIFF" + b"\x00" * 100)
+        assert probe_duration(path, "wav") is None
+        assert probe_duration(path, "webm") is None
@@ -0,0 +1,95 @@
+"""Tests for the transcription result cache."""
+
+import os
+import time
+
+from src.services.result_cache import ResultCache, hash_file, make_cache_key
+
+
+class TestMakeCacheKey:
+    """Test make_cache_key."""
+
+    def test_key_covers_model_and_parameters(self):
+        """Test the key changes with model, language, temperature and format but not other fields."""
+        base = make_cache_key("abc", "small", {"language": "en", "temperature": 0.0, "response_format": "json"})
+
+        assert base == make_cache_key("abc", "small", {"language": "en", "temperature": 0.0,
+                                                        "response_format": "json", "model": "whisper-1"})
+        assert base != make_cache_key("abd", "small", {"language": "en", "temperature": 0.0, "response_format": "json"})
+        assert base != make_cache_key("abc", "large", {"language": "en", "temperature": 0.0, "response_format": "json"})
+        assert base != make_cache_key("abc", "small", {"language": "de", "temperature": 0.0, "response_format": "json"})
+        assert base != make_cache_key("abc", "small", {"language": "en", "temperature": 0.2, "response_format": "json"})
+        assert base != make_cache_key("abc", "small", {"language": "en", "temperature": 0.0, "response_format": "text"})
+
+    def test_hash_file(self, tmp_path):
+        """Test files hash by content."""
+        (tmp_path / "a.wav").write_bytes(b"audio")
+        (tmp_path / "b.mp3").write_bytes(b"audio")
+
+        assert hash_file(str(tmp_path / "a.wav")) == hash_file(str(tmp_path / "b.mp3"))
+
+
+class TestResultCache:
+    """Test ResultCache class."""
+
+    def test_hit_returns_copy_without_request_fields(self):
+        """Test hits are independent copies and the per-request RTF is not cached."""
+        cache = ResultCache(1024)
+        cache.put("k", {"text": "hello", "processing_rtf": 12.5})
+
+        first = cache.get("k")
+        first["text"] = "changed"
+
+        assert cache.get("k") == {"text": "hello"}
+        assert cache.get("missing") is None
+        assert cache.get_status()["memory_hits"] == 2
+        assert cache.get_status()["misses"] == 1
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        """Test entries beyond the byte budget are evicted oldest first."""
+        cache = ResultCache(60)
+        cache.put("a", {"text": "a" * 10})
+        cache.put("b", {"text": "b" * 10})
+        cache.get("a")
+        cache.put("c", {"text": "c" * 10})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_status()["bytes"] <= 60
+
+    def test_disk_tier_survives_restart_and_promotes(self, tmp_path):
+        """Test a new cache over the same directory serves and promotes disk entries."""
+        ResultCache(1024, str(tmp_path)).put("k", {"text": "hello"})
+
+        cache = ResultCache(1024, str(tmp_path))
+
+        assert cache.get("k") == {"text": "hello"}
+        assert cache.get("k") == {"text": "hello"}
+        assert cache.get_status()["disk_hits"] == 1
+        assert cache.get_status()["memory_hits"] == 1
+
+    def test_disk_ttl_expires_entries(self, tmp_path):
+        """Test disk entries older than the TTL are misses and get removed."""
+        ResultCache(1024, str(tmp_path)).put("old", {"text": "old"})
+        ResultCache(1024, str(tmp_path)).put("new", {"text": "new"})
+        old_path = next(tmp_path.glob("*/old.json"))
+        past = time.time() - 120
+        os.utime(old_path, (past, past))
+
+        cache = ResultCache(1024, str(tmp_path), disk_ttl_seconds=60)
+
+        assert cache.get("old") is None
+        assert not old_path.exists()
+        assert cache.get("new") == {"text": "new"}
+
+    def test_evict_expired_sweeps_directory(self, tmp_path):
+        """Test the sweep removes only expired entries."""
+        cache = ResultCache(1024, str(tmp_path), disk_ttl_seconds=60)
+        cache.put("old", {"text": "old"})
+        cache.put("new", {"text": "new"})
+        past = time.time() - 120
+        os.utime(next(tmp_path.glob("*/old.json")), (past, past))
+
+        assert cache.evict_expired() == 1
+        assert [path.stem for path in tmp_path.glob("*/*.json")] == ["new"]
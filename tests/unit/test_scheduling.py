@@ -0,0 +1,109 @@
+"""Tests for request scheduling policies."""
+
+import asyncio
+
+import pytest
+
+from src.services.scheduling import (
+    AsyncSchedulingQueue,
+    FairSharePolicy,
+    FifoPolicy,
+    SchedulingQueue,
+    ShortestJobFirstPolicy,
+    create_policy_factory,
+)
+
+
+def _request(name, duration=0.0, client_id=None, enqueued_at=0.0):
+    """Build a request dictionary for scheduling."""
+    return {"name": name, "duration": duration, "client_id": client_id, "enqueued_at": enqueued_at}
+
+
+def _drain(policy):
+    """Pop all request names from a policy."""
+    return [policy.pop()["name"] for _ in range(len(policy))]
+
+
+class TestPolicies:
+    """Test scheduling policies."""
+
+    def test_fifo_order(self):
+        """Test FIFO keeps arrival order."""
+        policy = FifoPolicy()
+        for name, duration in [("long", 1500), ("short", 5), ("mid", 60)]:
+            policy.push(_request(name, duration))
+        assert _drain(policy) == ["long", "short", "mid"]
+
+    def test_sjf_orders_by_duration(self):
+        """Test shortest-job-first runs short audio first."""
+        policy = ShortestJobFirstPolicy(aging_rate=10.0)
+        for name, duration in [("long", 1500), ("short", 5), ("mid", 60)]:
+            policy.push(_request(name, duration))
+        assert _drain(policy) == ["short", "mid", "long"]
+
+    def test_sjf_aging_prevents_starvation(self):
+        """Test that a long request eventually beats newer short ones."""
+        policy = ShortestJobFirstPolicy(aging_rate=10.0)
+        policy.push(_request("long", 1500, enqueued_at=0.0))
+        # Arrives 100s later: 1500 - 10 * 100 = 500 of remaining advantage
+        policy.push(_request("short-early", 5, enqueued_at=100.0))
+        # Arrives 200s later: the long request has aged past it
+        policy.push(_request("short-late", 5, enqueued_at=200.0))
+        assert _drain(policy) == ["short-early", "long", "short-late"]
+
+    def test_fair_share_interleaves_clients(self):
+        """Test that a flooding client does not starve another."""
+        policy = FairSharePolicy()
+        for i in range(4):
+            policy.push(_request(f"a{i}", 10, "key-a"))
+        policy.push(_request("b0", 10, "key-b"))
+        order = _drain(policy)
+        assert order.index("b0") <= 1
+        assert [n for n in order if n.startswith("a")] == ["a0", "a1", "a2", "a3"]
+
+    def test_fair_share_weights(self):
+        """Test that weights scale a client's share."""
+        policy = FairSharePolicy(weights={"key-a": 3.0})
+        for i in range(6):
+            policy.push(_request(f"a{i}", 10, "key-a"))
+            policy.push(_request(f"b{i}", 10, "key-b"))
+        first = _drain(policy)[:8]
+        assert sum(1 for n in first if n.startswith("a")) == 6
+
+    def test_create_policy_factory(self):
+        """Test policy factory by name."""
+        assert isinstance(create_policy_factory("fifo")(), FifoPolicy)
+        assert isinstance(create_policy_factory("sjf", aging_rate=2.0)(), ShortestJobFirstPolicy)
+        assert isinstance(create_policy_factory("fair", weights={"k": 2.0})(), FairSharePolicy)
+        with pytest.raises(ValueError):
+            create_policy_factory("random")
+
+
+class TestSchedulingQueues:
+    """Test policy-backed queues."""
+
+    def test_control_items_after_requests(self):
+        """Test that non-request items are returned after queued requests."""
+        queue = SchedulingQueue(ShortestJobFirstPolicy())
+        sentinel = object()
+        queue.put({"name": "long", "duration": 100})
+        queue.put(sentinel)
+        queue.put({"name": "short", "duration": 1})
+
+        assert queue.qsize() == 3
+        assert queue.get()["name"] == "short"
+        assert queue.get()["name"] == "long"
+        assert queue.get() is sentinel
+
+    @pytest.mark.asyncio
+    async def test_async_queue_uses_policy(self):
+        """Test that the asyncio queue orders by policy."""
+        queue = AsyncSchedulingQueue(maxsize=2, policy=ShortestJobFirstPolicy())
+        await queue.put({"name": "long", "duration": 100})
+        await queue.put({"name": "short", "duration": 1})
+
+        assert queue.full()
+        assert queue.qsize() == 2
+        assert (await queue.get())["name"] == "short"
+        assert (await queue.get())["name"] == "long"
+        assert queue.empty()
@@ -5,7 +5,13 @@ from pathlib import Path
 import tempfile
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
+from src.services.decoding import PreparedAudio
+from src.services.metrics import METRICS
+from src.services.result_cache import ResultCache
 from src.services.transcription import TranscriptionService
+from src.services.workers import WorkerPool
 from src.core.exceptions import TranscriptionError
 
 
@@ -36,7 +42,7 @@ class TestTranscriptionService:
     async def test_transcribe_success(self, transcription_service, mock_validator, mock_model_manager):
         """Test successful transcription."""
         # Setup mocks
-        mock_validator.validate_file.return_value = ("mp3", 120.0)
+        mock_validator.prepare_file.return_value = PreparedAudio("mp3", np.zeros(120 * 16000, np.float32))
         mock_model_manager.get_model.return_value = MagicMock()
 
         with patch("src.services.transcription.MLXWhisper") as mock_mlx:
@@ -70,7 +76,7 @@ class TestTranscriptionService:
     async def test_transcribe_with_response_formats(self, transcription_service, mock_validator, mock_model_manager):
         """Test transcription with different response formats."""
         # Setup mocks
-        mock_validator.validate_file.return_value = ("wav", 60.0)
+        mock_validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(60 * 16000, np.float32))
         mock_model_manager.get_model.return_value = MagicMock()
 
         with patch("src.services.transcription.MLXWhisper") as mock_mlx:
@@ -104,7 +110,7 @@ class TestTranscriptionService:
     async def test_transcribe_failure(self, transcription_service, mock_validator, mock_model_manager):
         """Test transcription failure."""
         # Setup mocks to raise error
-        mock_validator.validate_file.side_effect = Exception("Validation failed")
+        mock_validator.prepare_file.side_effect = Exception("Validation failed")
 
         with pytest.raises(TranscriptionError) as exc_info:
             await transcription_service.transcribe(
@@ -119,7 +125,7 @@ class TestTranscriptionService:
     def test_transcribe_cleanup_temp_file(self, transcription_service, mock_validator, mock_model_manager):
         """Test that temporary files are cleaned up."""
         # Setup mocks
-        mock_validator.validate_file.return_value = ("mp3", 60.0)
+        mock_validator.prepare_file.return_value = PreparedAudio("mp3", np.zeros(60 * 16000, np.float32))
         mock_model_manager.get_model.return_value = MagicMock()
 
         with patch("src.services.transcription.MLXWhisper"):
@@ -143,3 +149,160 @@ class TestTranscriptionService:
                     assert not Path(temp_path).exists()
 
                 asyncio.run(run_test())
+
+    @pytest.mark.asyncio
+    async def test_transcribe_server_busy(self, mock_validator, mock_model_manager):
+        """Test that admission errors keep their 503 status."""
+        from src.core.exceptions import ServerBusyError
+
+        mock_validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(1 * 16000, np.float32))
+        worker_pool = MagicMock()
+        worker_pool.run.side_effect = ServerBusyError(10)
+        service = TranscriptionService(mock_validator, mock_model_manager, worker_pool)
+
+        with pytest.raises(ServerBusyError) as exc_info:
+            await service.transcribe(b"audio", "audio.wav", {}, "req-id")
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.request_id == "req-id"
+
+    @pytest.mark.asyncio
+    async def test_transcribe_wav_decoded_in_process(self, mock_validator, mock_model_manager):
+        """Test that WAV audio reaches the model as a PCM array, not a path."""
+        import io
+        import wave
+        import numpy as np
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(16000)
+            f.writeframes(b"\x00\x00" * 16000)
+
+        from src.services.validation import AudioValidator
+
+        validator = AudioValidator(1024 * 1024, 60, ["wav"])
+        mock_model_manager.transcribe.return_value = {"text": "silence"}
+        service = TranscriptionService(validator, mock_model_manager)
+
+        result = await service.transcribe(buffer.getvalue(), "audio.wav", {}, "req-id")
+        service.shutdown()
+
+        audio = mock_model_manager.transcribe.call_args.args[0]
+        assert isinstance(audio, np.ndarray)
+        assert audio.shape == (16000,)
+        assert result["text"] == "silence"
+        assert result["duration"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_transcribe_with_requested_model(self, mock_validator, mock_model_manager):
+        """Test the request's model is resolved and served by the registry."""
+        mock_validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(1 * 16000, np.float32))
+        registry = MagicMock()
+        registry.resolve.return_value = "mlx-community/whisper-small-mlx"
+        registry.get_manager.return_value.get_transcribe_options.return_value = {"fp16": True}
+        registry.transcribe.return_value = {"text": "small"}
+        service = TranscriptionService(mock_validator, mock_model_manager, model_registry=registry)
+
+        result = await service.transcribe(b"audio", "audio.wav", {"model": "small"}, "req-id")
+        service.shutdown()
+
+        registry.resolve.assert_called_once_with("small", "req-id")
+        assert registry.transcribe.call_args.args[0] == "mlx-community/whisper-small-mlx"
+        assert registry.transcribe.call_args.kwargs == {"fp16": True}
+        assert result["text"] == "small"
+        mock_model_manager.transcribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transcribe_unknown_model(self, mock_validator, mock_model_manager):
+        """Test unknown models are rejected before the audio is decoded."""
+        from src.core.exceptions import ModelNotFoundError
+
+        registry = MagicMock()
+        registry.resolve.side_effect = ModelNotFoundError("gpt-4o", ["whisper-1"])
+        service = TranscriptionService(mock_validator, mock_model_manager, model_registry=registry)
+
+        with pytest.raises(ModelNotFoundError) as exc_info:
+            await service.transcribe(b"audio", "audio.wav", {"model": "gpt-4o"}, "req-id")
+        service.shutdown()
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.request_id == "req-id"
+        mock_validator.prepare_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transcribe_on_model_host(self, mock_validator, mock_model_manager):
+        """Test the host backend forwards samples instead of running a local model."""
+        samples = np.zeros(2 * 16000, np.float32)
+        mock_validator.prepare_file.return_value = PreparedAudio("wav", samples)
+        registry = MagicMock()
+        registry.resolve.return_value = "default"
+        model_host = MagicMock()
+        model_host.transcribe.return_value = {"text": "from host"}
+        service = TranscriptionService(mock_validator, mock_model_manager, model_registry=registry,
+                                       model_host=model_host)
+
+        result = await service.transcribe(b"audio", "audio.wav", {}, "req-id", client_id="key")
+        service.shutdown()
+
+        assert model_host.transcribe.call_args.args == (samples, "default", {}, "req-id", "key")
+        assert result["text"] == "from host"
+        assert result["duration"] == 2.0
+        assert result["processing_rtf"] > 0
+        registry.get_manager.assert_not_called()
+        mock_model_manager.transcribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transcribe_records_stage_metrics(self, mock_validator, mock_model_manager):
+        """Test validation, queue wait, inference and audio seconds are recorded."""
+        mock_validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(4 * 16000, np.float32))
+        mock_model_manager.transcribe.return_value = {"text": "ok"}
+        service = TranscriptionService(mock_validator, mock_model_manager)
+        counts = {stage: METRICS.stage_seconds.get_count(stage) for stage in ("validation", "queue_wait", "inference")}
+        audio_seconds = METRICS.audio_seconds.get()
+
+        await service.transcribe(b"audio", "audio.wav", {}, "req-id")
+        service.shutdown()
+
+        for stage, count in counts.items():
+            assert METRICS.stage_seconds.get_count(stage) == count + 1
+        assert METRICS.audio_seconds.get() == audio_seconds + 4.0
+
+    @pytest.mark.asyncio
+    async def test_transcribe_reports_realtime_factor(self, mock_validator, mock_model_manager):
+        """Test the request's real-time factor is returned and aggregated per model."""
+        mock_validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(60 * 16000, np.float32))
+        mock_model_manager.get_model_name.return_value = "whisper-small"
+        mock_model_manager.transcribe.return_value = {"text": "ok"}
+        service = TranscriptionService(mock_validator, mock_model_manager)
+
+        result = await service.transcribe(b"audio", "audio.wav", {}, "req-id")
+        service.shutdown()
+
+        status = service.rtf_tracker.get_status()["whisper-small"]
+        assert result["processing_rtf"] > 60
+        assert status["window_requests"] == 1
+        assert status["total_audio_seconds"] == 60.0
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_validation_and_worker_pool(self, mock_validator, mock_model_manager):
+        """Test identical audio and parameters are served from the result cache."""
+        mock_validator.prepare_file.return_value = PreparedAudio("wav", np.zeros(16000, np.float32))
+        mock_model_manager.get_model_name.return_value = "small"
+        mock_model_manager.transcribe.return_value = {"text": "cached"}
+        worker_pool = MagicMock(wraps=WorkerPool(1, 10, mock_model_manager))
+        worker_pool.start()
+        service = TranscriptionService(mock_validator, mock_model_manager, worker_pool,
+                                       result_cache=ResultCache(1024 * 1024))
+
+        first = await service.transcribe(b"audio", "a.wav", {"language": "en"}, "req-1")
+        second = await service.transcribe(b"audio", "b.wav", {"language": "en"}, "req-2")
+        other = await service.transcribe(b"audio", "a.wav", {"language": "de"}, "req-3")
+        service.shutdown()
+
+        assert first["text"] == second["text"] == other["text"] == "cached"
+        assert "processing_rtf" not in second
+        assert mock_validator.prepare_file.call_count == 2
+        assert worker_pool.run.call_count == 2
+        assert service.result_cache.get_status()["memory_hits"] == 1
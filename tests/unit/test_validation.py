@@ -4,6 +4,8 @@ import pytest
 from pathlib import Path
 import tempfile
 
+import numpy as np
+
 from src.services.validation import AudioValidator
 from src.core.exceptions import (
     FileTooLargeError,
@@ -122,3 +124,43 @@ class TestAudioValidator:
             format, duration = validator.validate_file(str(file_path), 104)
             assert format == "wav"
             assert isinstance(duration, float)
+
+    def test_get_duration_from_headers(self, validator):
+        """Test duration comes from container headers, not a size estimate."""
+        from tests.fixtures.synthetic_audio import make_wav
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # 20 minutes of 8 kHz mono is ~19MB, which the estimate called 19 minutes
+            file_path = Path(tmpdir) / "long.wav"
+            file_path.write_bytes(make_wav(1200, sample_rate=8000))
+
+            assert validator._get_duration(str(file_path), "wav") == pytest.approx(1200)
+
+    def test_prepare_file_exact_duration(self, validator):
+        """Test prepare_file decodes once and reports the sample-exact duration."""
+        from tests.fixtures.synthetic_audio import make_wav
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "audio.wav"
+            file_path.write_bytes(make_wav(2.5, sample_rate=8000))
+
+            audio = validator.prepare_file(str(file_path), file_path.stat().st_size)
+
+            assert audio.format == "wav"
+            assert audio.samples.dtype == np.float32
+            assert len(audio.samples) == 40000
+            assert audio.duration == 2.5
+
+    def test_prepare_file_too_long_rejected_before_decode(self, validator):
+        """Test over-long files are rejected from headers without decoding."""
+        from unittest.mock import patch
+        from tests.fixtures.synthetic_audio import make_wav
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "long.wav"
+            file_path.write_bytes(make_wav(1800, sample_rate=4000))
+
+            with patch("src.services.validation.decode_audio") as decode:
+                with pytest.raises(FileTooLongError):
+                    validator.prepare_file(str(file_path), 1024)
+                decode.assert_not_called()
@@ -0,0 +1,94 @@
+"""Tests for memory-mapped weight loading."""
+
+import dataclasses
+import json
+
+import mlx.core as mx
+import mlx.nn as nn
+import numpy as np
+import pytest
+from mlx.utils import tree_flatten
+from mlx_whisper.load_models import load_model
+from mlx_whisper.whisper import ModelDimensions, Whisper
+
+from src.mlx.weights import load_weights, load_whisper_mmap
+
+DIMS = ModelDimensions(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=1,
+    n_vocab=51865, n_text_ctx=448, n_text_state=64, n_text_head=2, n_text_layer=1
+)
+
+
+def save_checkpoint(path, model, weights_format="safetensors", quantization=None):
+    """Write a checkpoint directory in the mlx-community layout."""
+    path.mkdir()
+    config = dataclasses.asdict(DIMS)
+    if quantization is not None:
+        config["quantization"] = quantization
+    (path / "config.json").write_text(json.dumps(config))
+    weights = dict(tree_flatten(model.parameters()))
+    if weights_format == "safetensors":
+        mx.save_safetensors(str(path / "weights.safetensors"), weights)
+    else:
+        mx.savez(str(path / "weights.npz"), **weights)
+    return path
+
+
+class TestLoadWeights:
+    """Test load_weights function."""
+
+    @pytest.mark.parametrize("suffix", ["safetensors", "npz"])
+    @pytest.mark.parametrize("dtype", [mx.float16, mx.bfloat16, mx.float32, mx.uint32])
+    def test_matches_mx_load(self, tmp_path, suffix, dtype):
+        """Test mapped tensors equal mx.load's, dtypes included."""
+        weights = {"a.b": (mx.arange(12).reshape(3, 4) * 3).astype(dtype), "c": mx.ones((5,), dtype)}
+        path = tmp_path / f"weights.{suffix}"
+        if suffix == "safetensors":
+            mx.save_safetensors(str(path), weights)
+        else:
+            mx.savez(str(path), **weights)
+
+        loaded = load_weights(path)
+
+        assert set(loaded) == set(weights)
+        for name, expected in weights.items():
+            assert loaded[name].dtype == dtype
+            assert mx.array_equal(loaded[name], expected).item()
+
+    def test_compressed_npz(self, tmp_path):
+        """Test compressed npz archives fall back to mx.load."""
+        path = tmp_path / "weights.npz"
+        np.savez_compressed(path, w=np.arange(6, dtype=np.float16))
+
+        loaded = load_weights(path)
+
+        assert loaded["w"].tolist() == list(range(6))
+
+
+class TestLoadWhisperMmap:
+    """Test load_whisper_mmap function."""
+
+    @pytest.mark.parametrize("weights_format", ["safetensors", "npz"])
+    def test_matches_mlx_whisper_loader(self, tmp_path, weights_format):
+        """Test the mapped model has the same parameters as mlx_whisper.load_model's."""
+        model = Whisper(DIMS, mx.float16)
+        path = save_checkpoint(tmp_path / "ckpt", model, weights_format)
+
+        mapped = dict(tree_flatten(load_whisper_mmap(str(path), mx.float16).parameters()))
+        expected = dict(tree_flatten(load_model(str(path), mx.float16).parameters()))
+
+        assert set(mapped) == set(expected)
+        for name, value in expected.items():
+            assert mx.array_equal(mapped[name], value).item()
+
+    def test_quantized_checkpoint(self, tmp_path):
+        """Test checkpoints saved quantized are rebuilt with quantized layers."""
+        model = Whisper(DIMS, mx.float16)
+        quantization = {"group_size": 64, "bits": 4}
+        nn.quantize(model, **quantization, class_predicate=lambda _, m: isinstance(m, (nn.Linear, nn.Embedding)))
+        path = save_checkpoint(tmp_path / "ckpt", model, quantization=quantization)
+
+        loaded = load_whisper_mmap(str(path), mx.float16)
+
+        assert isinstance(loaded.decoder.token_embedding, nn.QuantizedEmbedding)
+        assert mx.array_equal(loaded.decoder.blocks[0].mlp1.weight, model.decoder.blocks[0].mlp1.weight).item()
@@ -0,0 +1,141 @@
+"""Tests for the inference worker pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.services.workers import AsyncWorkerPool, WorkerPool
+from src.core.exceptions import ServerBusyError
+
+
+class TestWorkerPool:
+    """Test WorkerPool class."""
+
+    @pytest.fixture
+    def pool(self):
+        """Create a started worker pool."""
+        pool = WorkerPool(num_workers=2, max_concurrent=3, model_manager=MagicMock())
+        pool.start()
+        yield pool
+        pool.stop()
+
+    def test_submit_returns_result(self, pool):
+        """Test that task results are delivered through the future."""
+        future = pool.submit(lambda: {"text": "hello"}, "req-1")
+        assert future.result(timeout=5) == {"text": "hello"}
+
+    def test_submit_propagates_exception(self, pool):
+        """Test that task exceptions are delivered through the future."""
+        def failing_task():
+            raise RuntimeError("decode failed")
+
+        future = pool.submit(failing_task, "req-1")
+        with pytest.raises(RuntimeError, match="decode failed"):
+            future.result(timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_run_awaits_result(self, pool):
+        """Test awaiting a task from the event loop."""
+        result = await pool.run(lambda: 42, "req-1")
+        assert result == 42
+
+    def test_max_concurrent_enforced(self, pool):
+        """Test that requests beyond max_concurrent raise ServerBusyError."""
+        release = threading.Event()
+        futures = [pool.submit(release.wait, f"req-{i}") for i in range(3)]
+
+        with pytest.raises(ServerBusyError) as exc_info:
+            pool.submit(lambda: None, "req-overflow")
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.request_id == "req-overflow"
+
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        # Slots are released once requests complete
+        assert pool.get_status()["active_requests"] == 0
+        assert pool.submit(lambda: "ok", "req-after").result(timeout=5) == "ok"
+
+    def test_status_reports_queue_depth(self, pool):
+        """Test that per-worker queue depth is visible in status."""
+        release = threading.Event()
+        futures = [pool.submit(release.wait, f"req-{i}") for i in range(3)]
+
+        status = pool.get_status()
+        assert status["active_requests"] == 3
+        assert status["queue_depth"] == sum(w["queue_size"] for w in status["workers"])
+        assert all("queue_size" in w for w in status["workers"])
+
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+    def test_stop_drains_queue_promptly(self):
+        """Test that stop finishes queued work and returns without polling delay."""
+        pool = WorkerPool(num_workers=1, max_concurrent=5, model_manager=MagicMock())
+        pool.start()
+
+        release = threading.Event()
+        futures = [pool.submit(release.wait, "req-0")]
+        futures += [pool.submit(lambda i=i: i, f"req-{i}") for i in range(1, 4)]
+        release.set()
+
+        start = time.perf_counter()
+        pool.stop()
+        elapsed = time.perf_counter() - start
+
+        assert [f.result(timeout=0) for f in futures] == [True, 1, 2, 3]
+        assert elapsed < 0.5
+        assert not pool.workers[0].thread.is_alive()
+
+
+class TestAsyncWorkerPool:
+    """Test AsyncWorkerPool class."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result(self):
+        """Test that results are delivered to the awaiting coroutine."""
+        pool = AsyncWorkerPool(num_workers=2, max_concurrent=4, model_manager=MagicMock(), queue_size=2)
+        pool.start()
+        try:
+            results = await asyncio.gather(*[pool.run(lambda i=i: i * 2, f"req-{i}") for i in range(4)])
+            assert results == [0, 2, 4, 6]
+            assert pool.get_status()["active_requests"] == 0
+        finally:
+            pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_enforced(self):
+        """Test that requests beyond max_concurrent raise ServerBusyError."""
+        pool = AsyncWorkerPool(num_workers=1, max_concurrent=2, model_manager=MagicMock())
+        pool.start()
+        release = threading.Event()
+        try:
+            running = [asyncio.create_task(pool.run(release.wait, f"req-{i}")) for i in range(2)]
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ServerBusyError):
+                await pool.run(lambda: None, "req-overflow")
+
+            status = pool.get_status()
+            assert status["active_requests"] == 2
+            assert status["queue_depth"] == 1
+            assert status["workers"][0]["busy"]
+
+            release.set()
+            assert await asyncio.gather(*running) == [True, True]
+        finally:
+            release.set()
+            pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_run_requires_start(self):
+        """Test that submitting to a stopped pool fails."""
+        pool = AsyncWorkerPool(num_workers=1, max_concurrent=2, model_manager=MagicMock())
+        with pytest.raises(RuntimeError):
+            await pool.run(lambda: None, "req-1")